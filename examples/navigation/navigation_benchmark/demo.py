@@ -0,0 +1,120 @@
+# coding:utf-8
+""" Benchmark of switching the current item of navigation interface
+
+Usage::
+
+    python demo.py [--virtualized] [--animation] [-n 200]
+
+The switching time includes the repainting of navigation items, and the number of repainted
+items should stay flat as the item count grows.
+"""
+import argparse
+import random
+import sys
+import time
+
+from PyQt5.QtCore import QObject, QEvent
+from PyQt5.QtWidgets import QApplication, QWidget, QHBoxLayout
+
+from qfluentwidgets import NavigationInterface, NavigationItemPosition, NavigationWidget, NavigationTreeItemDelegate
+from qfluentwidgets import FluentIcon as FIF
+
+
+class PaintCounter(QObject):
+    """ Count the paint events of navigation widgets, the items of tree view are counted by
+    `CountingTreeItemDelegate` since they are painted by the viewport of tree view """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.count = 0
+
+    def eventFilter(self, obj, e):
+        if e.type() == QEvent.Paint and isinstance(obj, NavigationWidget):
+            self.count += 1
+
+        return super().eventFilter(obj, e)
+
+
+class CountingTreeItemDelegate(NavigationTreeItemDelegate):
+    """ Tree item delegate which counts the painted items """
+
+    def __init__(self, counter: PaintCounter, parent):
+        super().__init__(parent)
+        self.counter = counter
+
+    def paint(self, painter, option, index):
+        self.counter.count += 1
+        super().paint(painter, option, index)
+
+
+class Window(QWidget):
+
+    def __init__(self, itemCount: int, isVirtualized=False, isAnimationEnabled=False):
+        super().__init__()
+        self.hBoxLayout = QHBoxLayout(self)
+        self.navigationInterface = NavigationInterface(self, showMenuButton=True)
+        self.navigationInterface.setVirtualized(isVirtualized)
+        self.navigationInterface.setIndicatorAnimationEnabled(isAnimationEnabled)
+
+        self.hBoxLayout.setContentsMargins(0, 0, 0, 0)
+        self.hBoxLayout.addWidget(self.navigationInterface)
+        self.resize(1200, 800)
+
+        # each root item has 9 children and the first half of roots are expanded
+        self.routeKeys = []
+        for i in range(itemCount // 10):
+            root = self.addItem(f'root{i}', f'Root {i}')
+            for j in range(9):
+                self.addItem(f'item{i}-{j}', f'Item {i}-{j}', f'root{i}')
+
+            root.setExpanded(i < itemCount // 20)
+
+        self.navigationInterface.expand(useAni=False)
+
+    def addItem(self, routeKey: str, text: str, parentRouteKey: str = None):
+        self.routeKeys.append(routeKey)
+        return self.navigationInterface.addItem(
+            routeKey, FIF.DOCUMENT, text, position=NavigationItemPosition.SCROLL, parentRouteKey=parentRouteKey)
+
+
+def benchmark(app: QApplication, itemCount: int, switchCount: int, isVirtualized: bool, isAnimationEnabled: bool):
+    """ return the average milliseconds and repainted items of each switch """
+    w = Window(itemCount, isVirtualized, isAnimationEnabled)
+    w.show()
+    app.processEvents()
+
+    counter = PaintCounter()
+    app.installEventFilter(counter)
+
+    treeView = w.navigationInterface.panel.treeView
+    if treeView:
+        treeView.delegate = CountingTreeItemDelegate(counter, treeView)
+        treeView.setItemDelegate(treeView.delegate)
+
+    random.seed(0)
+    routeKeys = random.choices(w.routeKeys, k=switchCount)
+
+    t0 = time.perf_counter()
+    for routeKey in routeKeys:
+        w.navigationInterface.setCurrentItem(routeKey)
+        app.processEvents()
+
+    cost = (time.perf_counter() - t0) * 1000 / switchCount
+    app.removeEventFilter(counter)
+    w.deleteLater()
+    return cost, counter.count / switchCount
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of NavigationPanel.setCurrentItem")
+    parser.add_argument('-n', '--number', type=int, default=200, help="the number of switches")
+    parser.add_argument('--virtualized', action='store_true', help="render tree items with NavigationTreeView")
+    parser.add_argument('--animation', action='store_true', help="enable indicator animation")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    print(f"{'items':>6} {'switch (ms)':>12} {'repainted items':>16}")
+    for itemCount in [100, 500, 1000, 2000]:
+        cost, paints = benchmark(app, itemCount, args.number, args.virtualized, args.animation)
+        print(f"{itemCount:>6} {cost:>12.3f} {paints:>16.1f}")
@@ -0,0 +1,87 @@
+# coding:utf-8
+""" Benchmark of painting table view and list view
+
+Usage::
+
+    python demo.py [-r 100000] [-c 10] [-n 50]
+
+The views are scrolled page by page and repainted synchronously, the average time of
+painting a full viewport is reported.
+"""
+import argparse
+import sys
+import time
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import QApplication
+
+from qfluentwidgets import TableView, ListView
+
+
+class BenchmarkModel(QAbstractTableModel):
+    """ Table model which generates the cell text on demand """
+
+    def __init__(self, rowCount: int, columnCount: int, parent=None):
+        super().__init__(parent=parent)
+        self._rowCount = rowCount
+        self._columnCount = columnCount
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rowCount
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._columnCount
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return f"Cell {index.row()}-{index.column()}"
+
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return f"Column {section}"
+
+        return None
+
+
+def benchmark(app: QApplication, view, pageCount: int):
+    """ return the average milliseconds of painting a page """
+    view.resize(1200, 900)
+    view.show()
+    app.processEvents()
+
+    view.selectRow(1) if isinstance(view, TableView) else view.setCurrentIndex(view.model().index(1, 0))
+    scrollBar = view.verticalScrollBar()
+    step = scrollBar.pageStep()
+
+    t0 = time.perf_counter()
+    for i in range(pageCount):
+        scrollBar.setValue(i * step)
+        view.viewport().repaint()
+
+    cost = (time.perf_counter() - t0) * 1000 / pageCount
+    view.deleteLater()
+    return cost
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of painting TableView and ListView")
+    parser.add_argument('-r', '--rows', type=int, default=100000, help="the number of rows")
+    parser.add_argument('-c', '--columns', type=int, default=10, help="the number of columns of table")
+    parser.add_argument('-n', '--number', type=int, default=50, help="the number of painted pages")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    tableView = TableView()
+    tableView.setModel(BenchmarkModel(args.rows, args.columns, tableView))
+    tableView.verticalHeader().hide()
+
+    listView = ListView()
+    listView.setModel(BenchmarkModel(args.rows, 1, listView))
+
+    print(f"{'view':>10} {'rows':>8} {'page (ms)':>10}")
+    for name, view in [('TableView', tableView), ('ListView', listView)]:
+        cost = benchmark(app, view, args.number)
+        print(f"{name:>10} {args.rows:>8} {cost:>10.2f}")
@@ -15,7 +15,14 @@ Examples are available at https://github.com/zhiyiYo/PyQt-Fluent-Widgets/tree/ma
 __version__ = "1.11.2"
 __author__ = "zhiyiYo"
 
-from .components import *
-from .common import *
-from .window import *
-from ._rc import resource
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from ._lazy import lazyImport
+from ._rc import resource
+
+if TYPE_CHECKING:
+    from .components import *
+    from .common import *
+    from .window import *
+
+__getattr__, __dir__ = lazyImport(__name__)
\ No newline at end of file
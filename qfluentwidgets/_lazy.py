@@ -0,0 +1,200 @@
+# coding:utf-8
+import ast
+import os
+import sys
+from importlib import import_module
+from typing import Dict, List, Tuple
+
+
+class LazyModule:
+    """ Lazy attribute loader of package
+
+    The relative imports inside the `if TYPE_CHECKING:` block of package's `__init__.py`
+    are parsed instead of executed, and the submodule is imported when one of its
+    attributes is accessed for the first time. Static analyzers still see the imports.
+
+    If the source code of package is unavailable (e.g. frozen application), all the
+    imports are executed immediately.
+    """
+
+    HELPER_NAMES = ('TYPE_CHECKING', 'lazyImport')
+
+    def __init__(self, name: str):
+        """
+        Parameters
+        ----------
+        name: str
+            the name of package, usually `__name__`
+        """
+        self.name = name
+        self.attributes = {}    # type: Dict[str, Tuple[str, str]]
+        self.starModules = []   # type: List[str]
+        self.submodules = []    # type: List[str]
+        self._all = None
+        self.isParsed = self._parse()
+
+    @property
+    def module(self):
+        return sys.modules[self.name]
+
+    def _parse(self):
+        """ parse the lazy imports, return `False` if the source code is unavailable """
+        spec = getattr(self.module, '__spec__', None)
+
+        try:
+            source = spec.loader.get_source(self.name)
+        except (AttributeError, ImportError, OSError):
+            source = None
+
+        if not source:
+            return False
+
+        for node in ast.parse(source).body:
+            if not (isinstance(node, ast.If) and getattr(node.test, 'id', None) == 'TYPE_CHECKING'):
+                continue
+
+            for statement in node.body:
+                if not isinstance(statement, ast.ImportFrom) or statement.level != 1:
+                    continue
+
+                module = '.' + (statement.module or '')
+                self.submodules.append(module[1:].split('.')[0])
+
+                for alias in statement.names:
+                    if alias.name == '*':
+                        self.starModules.append(module)
+                    else:
+                        self.attributes[alias.asname or alias.name] = (module, alias.name)
+
+        return True
+
+    def getattr(self, name: str):
+        """ get the attribute of package, which is used as the `__getattr__` of package """
+        if name in self.attributes:
+            module, attr = self.attributes[name]
+            value = getattr(import_module(module, self.name), attr)
+        elif name == '__all__':
+            # not cached, since the submodules imported later are bound to package as well
+            return self.all()
+        elif name.startswith('_'):
+            raise AttributeError(f"module '{self.name}' has no attribute '{name}'")
+        elif isSubmodule(self.module, name):
+            value = import_module('.' + name, self.name)
+        else:
+            value = self._getStarAttribute(name)
+
+        setattr(self.module, name, value)
+        return value
+
+    def dir(self):
+        """ get the attribute names of package, which is used as the `__dir__` of package """
+        return sorted(set(vars(self.module)) | set(self.all()))
+
+    def all(self) -> List[str]:
+        """ get the public attribute names of package """
+        if self._all is None:
+            # the names loaded by recursive calls are incomplete, which are updated later
+            self._all = []
+
+            # the eagerly imported package loads all the subpackages of its root package
+            root = self.name.partition('.')[0]
+            if root != self.name:
+                getattr(import_module(root), '__all__', None)
+
+            self._all = self._loadNames()
+
+        # the submodules imported as side effects after loading names are exported too
+        names = self._all + [i for i in vars(self.module) if not i.startswith('_') and i not in self.HELPER_NAMES]
+        return list(dict.fromkeys(names))
+
+    def _loadNames(self) -> List[str]:
+        """ import all the attributes and get their names """
+        modules = [import_module(i, self.name) for i in self.starModules]
+
+        # import all the attributes first, so the submodules imported as side effects are bound
+        # to their packages and exported as if they were imported eagerly
+        for name in self.attributes:
+            getattr(self.module, name)
+
+        for module in modules:
+            for name in publicNames(module):
+                getattr(module, name)
+
+        names = list(self.attributes)
+        for module in modules:
+            names.extend(publicNames(module))
+
+        names.extend(self.submodules)
+        return list(dict.fromkeys(names))
+
+    def loadAll(self):
+        """ import all submodules immediately """
+        namespace = vars(self.module)
+
+        for name, (module, attr) in self.attributes.items():
+            namespace[name] = getattr(import_module(module, self.name), attr)
+
+        for module in self.starModules:
+            module = import_module(module, self.name)
+            for name in publicNames(module):
+                namespace[name] = getattr(module, name)
+
+    def _getStarAttribute(self, name: str):
+        # the later star import overrides the former one
+        for module in reversed(self.starModules):
+            module = import_module(module, self.name)
+
+            try:
+                return getattr(module, name)
+            except AttributeError:
+                pass
+
+            # the submodules of eagerly imported package
+            if isSubmodule(module, name):
+                return import_module('.' + name, module.__name__)
+
+        raise AttributeError(f"module '{self.name}' has no attribute '{name}'")
+
+
+def lazyImport(name: str):
+    """ make the package import its submodules lazily
+
+    Parameters
+    ----------
+    name: str
+        the name of package, usually `__name__`
+
+    Returns
+    -------
+    getattr, dir:
+        the `__getattr__` and `__dir__` function of package
+    """
+    lazyModule = LazyModule(name)
+
+    module = lazyModule.module
+    module.__getattr__ = lazyModule.getattr
+    module.__dir__ = lazyModule.dir
+
+    if not lazyModule.isParsed:
+        lazyModule.loadAll()
+
+    return lazyModule.getattr, lazyModule.dir
+
+
+def isSubmodule(package, name: str):
+    """ whether `name` is a submodule of package """
+    for folder in getattr(package, '__path__', []):
+        path = os.path.join(folder, name)
+        if os.path.isfile(path + '.py') or os.path.isfile(os.path.join(path, '__init__.py')):
+            return True
+
+    return False
+
+
+def publicNames(module) -> List[str]:
+    """ get the names imported by `from module import *` """
+    names = getattr(module, '__all__', None)
+    if names is not None:
+        return list(names)
+
+    return [i for i in vars(module) if not i.startswith('_')]
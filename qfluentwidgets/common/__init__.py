@@ -1,12 +1,15 @@
 from .config import *
-from .font import setFont, getFont, setFontFamilies, fontFamilies, fontStyleSheet
+from .font import setFont, getFont, setFontFamilies, fontFamilies, fontStyleSheet, TextAtlas, textAtlas
 from .auto_wrap import TextWrap
 from .icon import Action, Icon, getIconColor, drawSvgIcon, FluentIcon, drawIcon, FluentIconBase, writeSvg, FluentFontIconBase
 from .style_sheet import (setStyleSheet, getStyleSheet, setTheme, ThemeColor, themeColor,
                           setThemeColor, applyThemeColor, FluentStyleSheet, StyleSheetBase,
-                          StyleSheetFile, StyleSheetCompose, CustomStyleSheet, toggleTheme, setCustomStyleSheet, renderQss)
+                          StyleSheetFile, StyleSheetCompose, CustomStyleSheet, toggleTheme, setCustomStyleSheet, renderQss,
+                          setStyleSheetSharingEnabled)
 from .smooth_scroll import SmoothScroll, SmoothMode
 from .translator import FluentTranslator
 from .router import qrouter, Router
 from .color import FluentThemeColor, FluentSystemColor
-from .theme_listener import SystemThemeListener
\ No newline at end of file
+from .theme_listener import SystemThemeListener
+from .completion import (CompletionEngine, CompletionScorer, PrefixCompletionScorer, ContainsCompletionScorer,
+                         FuzzyCompletionScorer)
\ No newline at end of file
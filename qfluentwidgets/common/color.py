@@ -77,8 +77,15 @@ class FluentSystemColor(Enum):
     CRITICAL_BACKGROUND = ("#fde7e9", "#442726")
 
     def color(self, theme=Theme.AUTO) -> QColor:
-        color = self.value[1] if isDarkThemeMode(theme) else self.value[0]
-        return QColor(color)
+        return QColor(_systemColors[self][isDarkThemeMode(theme)])
+
+    def colorName(self, theme=Theme.AUTO) -> str:
+        """ get the hex name of system color """
+        return self.value[1] if isDarkThemeMode(theme) else self.value[0]
+
+
+# precomputed light and dark system colors
+_systemColors = {c: (QColor(c.value[0]), QColor(c.value[1])) for c in FluentSystemColor}
 
 
 
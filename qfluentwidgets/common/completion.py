@@ -0,0 +1,336 @@
+# coding:utf-8
+import heapq
+from itertools import count
+from typing import Iterable, List, Optional, Sequence
+
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QModelIndex, QAbstractItemModel, QStringListModel, pyqtSignal
+
+
+class CompletionScorer:
+    """ Completion scorer, which decides whether a candidate matches the pattern and how well
+
+    Subclass it and reimplement `score()` to customize the matching algorithm. The method is
+    called in the worker thread of `CompletionEngine`, so it should not access widgets.
+    """
+
+    def __init__(self, caseSensitivity=Qt.CaseInsensitive):
+        self.caseSensitivity = caseSensitivity
+
+    def key(self, text: str) -> str:
+        """ normalize the pattern and candidate before scoring, the keys of candidates are cached """
+        return text if self.caseSensitivity == Qt.CaseSensitive else text.casefold()
+
+    def isIncremental(self) -> bool:
+        """ whether the matches of an extended pattern are always a subset of the matches of
+        the original pattern, if so, the candidates are filtered from the last result """
+        return True
+
+    def score(self, pattern: str, text: str) -> Optional[float]:
+        """ score the candidate
+
+        Parameters
+        ----------
+        pattern: str
+            the key of pattern
+
+        text: str
+            the key of candidate
+
+        Returns
+        -------
+        score: float | None
+            `None` if the candidate does not match the pattern, otherwise the higher the better,
+            the candidates with the same score keep their original order
+        """
+        raise NotImplementedError
+
+
+class PrefixCompletionScorer(CompletionScorer):
+    """ Scorer which matches the candidates starting with pattern """
+
+    def score(self, pattern: str, text: str):
+        return 0 if text.startswith(pattern) else None
+
+
+class ContainsCompletionScorer(CompletionScorer):
+    """ Scorer which matches the candidates containing pattern, the earlier the better """
+
+    def score(self, pattern: str, text: str):
+        i = text.find(pattern)
+        return None if i < 0 else -i
+
+
+class FuzzyCompletionScorer(CompletionScorer):
+    """ Scorer which matches the candidates containing all the characters of pattern in order
+
+    Consecutive characters and characters at the beginning of words are preferred, while
+    the gaps between characters and the unmatched tail are penalized.
+    """
+
+    consecutiveBonus = 4
+    wordStartBonus = 6
+    gapPenalty = 1
+    maxGapPenalty = 6
+    lengthPenalty = 0.01
+
+    def score(self, pattern: str, text: str):
+        score = 0
+        last = -1
+
+        for c in pattern:
+            i = text.find(c, last + 1)
+            if i < 0:
+                return None
+
+            if i == last + 1 and last >= 0:
+                score += self.consecutiveBonus
+            else:
+                score -= min(self.maxGapPenalty, (i - last - 1) * self.gapPenalty)
+
+            if i == 0 or not text[i - 1].isalnum():
+                score += self.wordStartBonus
+
+            last = i
+
+        return score - (len(text) - len(pattern)) * self.lengthPenalty
+
+
+class CompletionTask(QRunnable):
+    """ Completion task running in thread pool """
+
+    checkInterval = 1024
+
+    def __init__(self, taskId: int, engine: "CompletionEngine", pattern: str, keys: Sequence[str],
+                 candidates: Optional[Sequence[int]], scorer: CompletionScorer, maxResults: int):
+        super().__init__()
+        self.taskId = taskId
+        self.engine = engine
+        self.pattern = pattern
+        self.keys = keys
+        self.candidates = candidates
+        self.scorer = scorer
+        self.maxResults = maxResults
+
+    def isCanceled(self):
+        return self.engine._taskId != self.taskId
+
+    def run(self):
+        score = self.scorer.score
+        keys = self.keys
+        pattern = self.scorer.key(self.pattern)
+        candidates = range(len(keys)) if self.candidates is None else self.candidates
+        interval = self.checkInterval
+
+        rows = []       # type: List[int]
+        scores = []     # type: List[float]
+        for n, row in enumerate(candidates):
+            if n % interval == 0 and self.isCanceled():
+                return
+
+            s = score(pattern, keys[row])
+            if s is not None:
+                rows.append(row)
+                scores.append(s)
+
+        if self.isCanceled():
+            return
+
+        # sort by score and keep the original order of candidates with the same score
+        if self.maxResults < 0:
+            results = sorted(range(len(rows)), key=lambda i: -scores[i])
+        else:
+            results = heapq.nsmallest(self.maxResults, range(len(rows)), key=lambda i: -scores[i])
+
+        self.engine._taskFinished.emit(self.taskId, self.pattern, rows, [rows[i] for i in results])
+
+
+class CompletionEngine(QObject):
+    """ Completion engine which filters candidates in a thread pool
+
+    The candidates can be filtered incrementally: if the pattern extends the last completed one
+    and the scorer is incremental, only the last matches are scored again. A new completion
+    cancels the running one, and the result of canceled completion is never emitted.
+    """
+
+    # the rows are emitted as python object to avoid converting large lists to QVariantList
+    completionFinished = pyqtSignal(str, object)
+    _taskFinished = pyqtSignal(int, str, object, object)
+
+    _taskIds = count(1)
+
+    def __init__(self, items: Iterable[str] = None, scorer: CompletionScorer = None, parent=None):
+        """
+        Parameters
+        ----------
+        items: Iterable[str]
+            the candidates of completion
+
+        scorer: CompletionScorer
+            completion scorer, `PrefixCompletionScorer` is used by default
+
+        parent: QObject
+            parent object
+        """
+        super().__init__(parent=parent)
+        self.threadPool = QThreadPool(self)
+        self.threadPool.setMaxThreadCount(1)
+
+        self._items = []    # type: List[str]
+        self._keys = None   # type: List[str]
+        self._scorer = scorer or PrefixCompletionScorer()
+        self._model = None  # type: QAbstractItemModel
+        self._column = 0
+        self._role = Qt.DisplayRole
+        self._isModelDirty = False
+        self._maxResults = 200
+        self._isThreaded = True
+
+        self._taskId = 0
+        self._lastPattern = None    # type: str
+        self._lastMatches = None    # type: List[int]
+        self._results = []          # type: List[int]
+
+        self._taskFinished.connect(self._onTaskFinished)
+
+        if items is not None:
+            self.setItems(items)
+
+    def setItems(self, items: Iterable[str]):
+        """ set the candidates of completion """
+        self._setModel(None)
+        self._items = list(items)
+        self._resetCache()
+
+    def items(self) -> List[str]:
+        self._updateItems()
+        return self._items
+
+    def setModel(self, model: QAbstractItemModel, column=0, role=Qt.DisplayRole):
+        """ use the data of model as the candidates, the data is copied when model changes """
+        self._setModel(model)
+        self._column = column
+        self._role = role
+        self._isModelDirty = True
+        self._resetCache()
+
+    def model(self) -> QAbstractItemModel:
+        return self._model
+
+    def index(self, row: int) -> QModelIndex:
+        """ Returns the model index of candidate """
+        if not self._model:
+            return QModelIndex()
+
+        return self._model.index(row, self._column)
+
+    def setScorer(self, scorer: CompletionScorer):
+        self._scorer = scorer
+        self._resetCache()
+
+    def scorer(self) -> CompletionScorer:
+        return self._scorer
+
+    def setMaxResults(self, num: int):
+        """ set the maximum number of results, set to -1 indicates no restriction """
+        self._maxResults = num
+
+    def maxResults(self):
+        return self._maxResults
+
+    def setThreaded(self, isThreaded: bool):
+        """ set whether to filter candidates in thread pool """
+        self._isThreaded = isThreaded
+
+    def isThreaded(self):
+        return self._isThreaded
+
+    def results(self) -> List[int]:
+        """ Returns the rows of candidates in the last completion """
+        return self._results
+
+    def complete(self, pattern: str) -> int:
+        """ filter the candidates matching pattern, the result is emitted by `completionFinished`
+
+        Returns
+        -------
+        taskId: int
+            the id of completion task
+        """
+        self.cancel()
+        self._updateItems()
+
+        if self._keys is None:
+            key = self._scorer.key
+            self._keys = [key(i) for i in self._items]
+
+        # filter the last matches if the pattern is extended
+        candidates = None
+        if self._lastPattern is not None and pattern.startswith(self._lastPattern) \
+                and self._scorer.isIncremental():
+            candidates = self._lastMatches
+
+        taskId = self._taskId = next(self._taskIds)
+        task = CompletionTask(taskId, self, pattern, self._keys, candidates, self._scorer, self._maxResults)
+
+        if self.isThreaded():
+            self.threadPool.start(task)
+        else:
+            task.run()
+
+        return taskId
+
+    def cancel(self):
+        """ cancel the running completion """
+        self._taskId = 0
+
+    def waitForDone(self, msecs=-1):
+        return self.threadPool.waitForDone(msecs)
+
+    def _onTaskFinished(self, taskId: int, pattern: str, matches: list, results: list):
+        if taskId != self._taskId:
+            return
+
+        self._lastPattern = pattern
+        self._lastMatches = matches
+        self._results = results
+        self.completionFinished.emit(pattern, results)
+
+    def _resetCache(self):
+        self.cancel()
+        self._keys = None
+        self._lastPattern = None
+        self._lastMatches = None
+
+    def _setModel(self, model: QAbstractItemModel):
+        if self._model:
+            for signal in self._modelSignals(self._model):
+                signal.disconnect(self._onModelChanged)
+
+        self._model = model
+        if model:
+            for signal in self._modelSignals(model):
+                signal.connect(self._onModelChanged)
+
+    @staticmethod
+    def _modelSignals(model: QAbstractItemModel):
+        return [model.modelReset, model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                model.dataChanged, model.layoutChanged]
+
+    def _onModelChanged(self, *args):
+        self._isModelDirty = True
+        self._resetCache()
+
+    def _updateItems(self):
+        if not self._isModelDirty:
+            return
+
+        self._isModelDirty = False
+        model = self._model
+
+        if isinstance(model, QStringListModel) and self._column == 0 and self._role in (Qt.DisplayRole, Qt.EditRole):
+            self._items = model.stringList()
+        else:
+            self._items = [model.data(model.index(i, self._column), self._role) or ""
+                           for i in range(model.rowCount())]
+
+        self._keys = None
@@ -1,6 +1,10 @@
 # coding: utf-8
+from collections import OrderedDict
+from math import ceil, floor
 from typing import List
-from PyQt5.QtGui import QFont
+
+from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5.QtGui import QFont, QFontMetricsF, QColor, QImage, QPainter, QPixmap, QTransform
 from PyQt5.QtWidgets import QWidget
 
 from .config import qconfig
@@ -67,4 +71,176 @@ def fontStyleSheet(font: QFont):
         families.append(f"'{family}'")
 
     qss = f"font: {font.pixelSize()}px {','.join(families)}"
-    return qss
\ No newline at end of file
+    return qss
+
+
+class TextAtlas:
+    """ Least recently used cache of rendered text
+
+    Each text is rendered to a pixmap once for its font, color and device pixel ratio, so
+    the widgets repainted in every animation frame can blit the text instead of shaping it.
+    """
+
+    # the extra space around text, which holds the overhang of glyphs
+    padding = 2
+
+    # the number of sub-pixel positions of text, which is the precision of text layout, so
+    # the glyphs are snapped to pixels exactly like the text drawn directly
+    subpixels = 64
+
+    def __init__(self, maxSize=2048):
+        """
+        Parameters
+        ----------
+        maxSize: int
+            the maximum number of cached pixmaps
+        """
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self._pixmaps = OrderedDict()
+        self._sizes = OrderedDict()
+
+    def pixmap(self, text: str, font: QFont, color, ratio=1.0, offset=QPointF()) -> QPixmap:
+        """ get the pixmap of text, whose baseline is at `padding + ascent`
+
+        Parameters
+        ----------
+        text: str
+            single line text
+
+        font: QFont
+            the font of text
+
+        color: QColor | Qt.GlobalColor | str
+            text color
+
+        ratio: float
+            device pixel ratio of pixmap
+
+        offset: QPointF
+            the sub-pixel offset of text in device pixels, whose coordinates are in `[0, 1)`
+        """
+        return self._pixmap(text, font, font.key(), QColor(color), ratio, offset.x(), offset.y())
+
+    def textSize(self, text: str, font: QFont):
+        """ get the advance and height of text, which are cached to avoid shaping text """
+        return self._textSize(text, font, font.key())
+
+    def draw(self, painter: QPainter, rect, text: str, font: QFont, color, align=Qt.AlignCenter):
+        """ draw the cached text, the text is drawn directly if the painter is scaled or rotated
+
+        Parameters
+        ----------
+        painter: QPainter
+            painter
+
+        rect: QRect | QRectF
+            the rect to draw text
+
+        text: str
+            single line text
+
+        font: QFont
+            the font of text
+
+        color: QColor | Qt.GlobalColor | str
+            text color
+
+        align: Qt.Alignment
+            the alignment of text in rect
+        """
+        if not text:
+            return
+
+        rect = QRectF(rect)
+        if painter.transform().type() > QTransform.TxTranslate:
+            painter.save()
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+            painter.drawText(rect, align, text)
+            return painter.restore()
+
+        device = painter.device()
+        ratio = device.devicePixelRatioF() if device else 1.0
+        fontKey = font.key()
+
+        w, h = self._textSize(text, font, fontKey)
+        if align & Qt.AlignRight:
+            x = rect.right() - w
+        elif align & Qt.AlignHCenter:
+            x = rect.x() + (rect.width() - w) / 2
+        else:
+            x = rect.x()
+
+        if align & Qt.AlignBottom:
+            y = rect.bottom() - h
+        elif align & Qt.AlignVCenter:
+            y = rect.y() + (rect.height() - h) / 2
+        else:
+            y = rect.y()
+
+        # blit pixmap at device pixels and keep the sub-pixel offset in pixmap
+        x, y = (x - self.padding) * ratio, (y - self.padding) * ratio
+        pixmap = self._pixmap(text, font, fontKey, QColor(color), ratio, x - floor(x), y - floor(y))
+        painter.drawPixmap(QPointF(floor(x) / ratio, floor(y) / ratio), pixmap)
+
+    def clear(self):
+        """ clear all cached pixmaps """
+        self._pixmaps.clear()
+        self._sizes.clear()
+
+    def stats(self) -> dict:
+        """ get the statistics of cache """
+        return {"size": len(self._pixmaps), "maxSize": self.maxSize, "hits": self.hits, "misses": self.misses}
+
+    def _pixmap(self, text: str, font: QFont, fontKey: str, color: QColor, ratio: float, dx: float, dy: float):
+        dx = int(dx * self.subpixels) / self.subpixels
+        dy = int(dy * self.subpixels) / self.subpixels
+        key = (text, fontKey, color.rgba(), ratio, dx, dy)
+
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+
+        p = self.padding
+        w, h = self._textSize(text, font, fontKey)
+        w, h = w + 2 * p, h + 2 * p
+
+        image = QImage(max(ceil(w * ratio), 1), max(ceil(h * ratio), 1), QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.transparent)
+
+        painter = QPainter(image)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(QPointF(p + dx / ratio, p + dy / ratio + QFontMetricsF(font).ascent()), text)
+        painter.end()
+
+        pixmap = self._pixmaps[key] = QPixmap.fromImage(image)
+        if len(self._pixmaps) > self.maxSize:
+            self._pixmaps.popitem(last=False)
+
+        return pixmap
+
+    def _textSize(self, text: str, font: QFont, fontKey: str):
+        key = (text, fontKey)
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+            return size
+
+        fm = QFontMetricsF(font)
+        size = self._sizes[key] = (fm.horizontalAdvance(text), fm.height())
+        if len(self._sizes) > self.maxSize:
+            self._sizes.popitem(last=False)
+
+        return size
+
+
+textAtlas = TextAtlas()
\ No newline at end of file
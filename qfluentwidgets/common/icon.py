@@ -1,18 +1,268 @@
 # coding:utf-8
+from collections import OrderedDict
 from enum import Enum
 from typing import Union
 import json
 
 from PyQt5.QtXml import QDomDocument
-from PyQt5.QtCore import QRectF, Qt, QFile, QObject, QRect
-from PyQt5.QtGui import QIcon, QIconEngine, QColor, QPixmap, QImage, QPainter, QFontDatabase, QFont, QPainterPath
+from PyQt5.QtCore import QRectF, Qt, QFile, QObject, QRect, QSize
+from PyQt5.QtGui import (QIcon, QIconEngine, QColor, QPixmap, QImage, QPainter, QFontDatabase, QFont, QPainterPath,
+                         QTransform)
 from PyQt5.QtWidgets import QAction, qApp, QApplication
 from PyQt5.QtSvg import QSvgRenderer
 
-from .config import isDarkTheme, Theme
+from .config import isDarkTheme, Theme, qconfig
 from .overload import singledispatchmethod
 
 
+class IconCache:
+    """ Least recently used cache of rasterized icons """
+
+    def __init__(self, maxSize=1024):
+        """
+        Parameters
+        ----------
+        maxSize: int
+            the maximum number of cached pixmaps
+        """
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pixmaps = OrderedDict()
+
+    def pixmap(self, key, size: QSize, ratio=1.0, render=None) -> QPixmap:
+        """ get the rasterized icon
+
+        Parameters
+        ----------
+        key: Hashable
+            the key of icon, it should contain everything that affects the appearance except size
+
+        size: QSize | QSizeF
+            the logical size of pixmap
+
+        ratio: float
+            device pixel ratio
+
+        render: Callable[[QPainter, QRectF], None]
+            the function used to draw the icon when it is not cached
+        """
+        w, h = max(round(size.width() * ratio), 1), max(round(size.height() * ratio), 1)
+        key = (key, w, h, ratio)
+
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+
+        image = QImage(w, h, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+
+        painter = QPainter(image)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
+        render(painter, QRectF(0, 0, w, h))
+        painter.end()
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        self._pixmaps[key] = pixmap
+
+        while len(self._pixmaps) > self.maxSize:
+            self._pixmaps.popitem(last=False)
+            self.evictions += 1
+
+        return pixmap
+
+    def draw(self, painter: QPainter, rect, key, render):
+        """ draw the cached icon, the icon is rendered directly if the painter is scaled or rotated
+
+        Parameters
+        ----------
+        painter: QPainter
+            painter
+
+        rect: QRect | QRectF
+            the rect to draw icon
+
+        key: Hashable
+            the key of icon
+
+        render: Callable[[QPainter, QRectF], None]
+            the function used to draw the icon when it is not cached
+        """
+        rect = QRectF(rect)
+        if painter.transform().type() > QTransform.TxTranslate or rect.isEmpty():
+            return render(painter, rect)
+
+        device = painter.device()
+        ratio = device.devicePixelRatioF() if device else 1.0
+
+        pixmap = self.pixmap(key, rect.size(), ratio, render)
+        painter.drawPixmap(rect, pixmap, QRectF(pixmap.rect()))
+
+    def clear(self):
+        """ clear all cached pixmaps """
+        self._pixmaps.clear()
+
+    def stats(self) -> dict:
+        """ get the statistics of cache """
+        return {
+            "size": len(self._pixmaps),
+            "maxSize": self.maxSize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+iconCache = IconCache()
+qconfig.themeChanged.connect(iconCache.clear)
+
+
+class SvgRendererPool:
+    """ Pool of parsed svg renderers and rewritten svg codes """
+
+    def __init__(self, maxSize=256):
+        """
+        Parameters
+        ----------
+        maxSize: int
+            the maximum number of pooled renderers and svg codes respectively
+        """
+        self.maxSize = maxSize
+        self._renderers = OrderedDict()
+        self._svgs = OrderedDict()
+
+    def renderer(self, icon: Union[str, bytes]) -> QSvgRenderer:
+        """ get the renderer of svg icon
+
+        Parameters
+        ----------
+        icon: str | bytes
+            the path or code of svg icon
+        """
+        return self._get(self._renderers, ('svg', icon), lambda: QSvgRenderer(icon))
+
+    def modifiedRenderer(self, iconPath: str, indexes=None, **attributes) -> QSvgRenderer:
+        """ get the renderer of svg icon with specified path attributes, see `writeSvg()` """
+        key = ('modified', iconPath, attributesKey(indexes, attributes))
+        return self._get(self._renderers, key, lambda: QSvgRenderer(
+            self.svg(iconPath, indexes, **attributes).encode()))
+
+    def svg(self, iconPath: str, indexes=None, **attributes) -> str:
+        """ get the svg code with specified path attributes, see `writeSvg()` """
+        key = (iconPath, attributesKey(indexes, attributes))
+        return self._get(self._svgs, key, lambda: writeSvg(iconPath, indexes, **attributes))
+
+    def clear(self):
+        """ clear all pooled renderers and svg codes """
+        self._renderers.clear()
+        self._svgs.clear()
+
+    def _get(self, cache: OrderedDict, key, create):
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            return value
+
+        value = cache[key] = create()
+        if len(cache) > self.maxSize:
+            cache.popitem(last=False)
+
+        return value
+
+
+svgRendererPool = SvgRendererPool()
+
+
+class GlyphPathCache:
+    """ Least recently used cache of the glyph paths of font icons """
+
+    def __init__(self, maxSize=1024):
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self._paths = OrderedDict()
+
+    def path(self, fontFamily: str, char: str, isBold: bool, pixelSize: int) -> QPainterPath:
+        """ get the glyph path whose baseline starts from `(0, 0)` """
+        key = (fontFamily, char, isBold, pixelSize)
+
+        path = self._paths.get(key)
+        if path is not None:
+            self.hits += 1
+            self._paths.move_to_end(key)
+            return path
+
+        self.misses += 1
+
+        font = QFont(fontFamily)
+        font.setBold(isBold)
+        font.setPixelSize(pixelSize)
+
+        path = QPainterPath()
+        path.addText(0, 0, font, char)
+        self._paths[key] = path
+
+        if len(self._paths) > self.maxSize:
+            self._paths.popitem(last=False)
+
+        return path
+
+    def clear(self):
+        """ clear all cached glyph paths """
+        self._paths.clear()
+
+    def stats(self) -> dict:
+        """ get the statistics of cache """
+        return {"size": len(self._paths), "maxSize": self.maxSize, "hits": self.hits, "misses": self.misses}
+
+
+glyphPathCache = GlyphPathCache()
+
+
+def drawFontIcon(painter: QPainter, rect, fontFamily: str, char: str, color, isBold=False):
+    """ draw font icon
+
+    Parameters
+    ----------
+    painter: QPainter
+        painter
+
+    rect: QRect | QRectF
+        the rect to render icon
+
+    fontFamily: str
+        the font family of icon
+
+    char: str
+        the character of icon
+
+    color: QColor | Qt.GlobalColor | str
+        icon color
+
+    isBold: bool
+        whether to use bold font
+    """
+    rect = QRectF(rect)
+    path = glyphPathCache.path(fontFamily, char, isBold, round(rect.height()))
+
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(color))
+    painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
+    painter.drawPath(path.translated(rect.x(), rect.y() + rect.height()))
+
+
+def attributesKey(indexes=None, attributes: dict = None):
+    """ convert the modified svg path indexes and attributes to a hashable key """
+    attributes = attributes or {}
+    return tuple(indexes or ()), tuple(sorted((k, str(v)) for k, v in attributes.items()))
+
+
 class FluentIconEngine(QIconEngine):
     """ Fluent icon engine """
 
@@ -31,6 +281,53 @@ class FluentIconEngine(QIconEngine):
         self.isThemeReversed = reverse
 
     def paint(self, painter, rect, mode, state):
+        if rect.x() == 19:
+            rect = rect.adjusted(-1, 0, 0, 0)
+
+        key = self._cacheKey()
+        if key is None:
+            return self._render(painter, rect, mode, state)
+
+        iconCache.draw(painter, rect, (key, mode, state),
+                       lambda p, r: self._render(p, r.toRect(), mode, state))
+
+    def clone(self) -> QIconEngine:
+        return FluentIconEngine(self.icon, self.isThemeReversed)
+
+    def pixmap(self, size, mode, state):
+        key = self._cacheKey()
+        if key is not None:
+            return iconCache.pixmap((key, mode, state), size, 1, lambda p, r: self._render(p, r.toRect(), mode, state))
+
+        image = QImage(size, QImage.Format_ARGB32)
+        image.fill(Qt.transparent)
+        pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
+
+        painter = QPainter(pixmap)
+        rect = QRect(0, 0, size.width(), size.height())
+        self._render(painter, rect, mode, state)
+        return pixmap
+
+    def _theme(self):
+        if not self.isThemeReversed:
+            return Theme.AUTO
+
+        return Theme.LIGHT if isDarkTheme() else Theme.DARK
+
+    def _cacheKey(self):
+        """ returns the key of icon cache, `None` if the icon can't be cached """
+        icon = self.icon.fluentIcon if isinstance(self.icon, Icon) else self.icon
+        if not isinstance(icon, FluentIconBase):
+            return None
+
+        theme = self._theme()
+        if isinstance(icon, FluentFontIconBase):
+            color = QColor(icon._getIconColor(theme))
+            return (icon.fontFamily, icon.char, icon.isBold, color.rgba())
+
+        return icon.path(theme)
+
+    def _render(self, painter, rect, mode, state):
         painter.save()
 
         if mode == QIcon.Disabled:
@@ -40,36 +337,16 @@ class FluentIconEngine(QIconEngine):
 
         # change icon color according to the theme
         icon = self.icon
-
-        if not self.isThemeReversed:
-            theme = Theme.AUTO
-        else:
-            theme = Theme.LIGHT if isDarkTheme() else Theme.DARK
+        theme = self._theme()
 
         if isinstance(self.icon, Icon):
             icon = self.icon.fluentIcon.icon(theme)
         elif isinstance(self.icon, FluentIconBase):
             icon = self.icon.icon(theme)
 
-        if rect.x() == 19:
-            rect = rect.adjusted(-1, 0, 0, 0)
-
         icon.paint(painter, rect, Qt.AlignCenter, QIcon.Normal, state)
         painter.restore()
 
-    def clone(self) -> QIconEngine:
-        return FluentIconEngine(self.icon, self.isThemeReversed)
-
-    def pixmap(self, size, mode, state):
-        image = QImage(size, QImage.Format_ARGB32)
-        image.fill(Qt.transparent)
-        pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
-
-        painter = QPainter(pixmap)
-        rect = QRect(0, 0, size.width(), size.height())
-        self.paint(painter, rect, mode, state)
-        return pixmap
-
 
 class SvgIconEngine(QIconEngine):
     """ Svg icon engine """
@@ -77,9 +354,10 @@ class SvgIconEngine(QIconEngine):
     def __init__(self, svg: str):
         super().__init__()
         self.svg = svg
+        self._svgData = svg.encode()
 
     def paint(self, painter, rect, mode, state):
-        drawSvgIcon(self.svg.encode(), painter, rect)
+        drawSvgIcon(self._svgData, painter, rect)
 
     def clone(self) -> QIconEngine:
         return SvgIconEngine(self.svg)
@@ -106,32 +384,14 @@ class FontIconEngine(QIconEngine):
         self.isBold = isBold
 
     def paint(self, painter, rect, mode, state):
-        font = QFont(self.fontFamily)
-        font.setBold(self.isBold)
-        font.setPixelSize(round(rect.height()))
-        painter.setFont(font)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(self.color)
-        painter.setRenderHints(
-            QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
-
-        path = QPainterPath()
-        path.addText(rect.x(), rect.y() + rect.height(), font, self.char)
-        painter.drawPath(path)
-
+        drawFontIcon(painter, rect, self.fontFamily, self.char, self.color, self.isBold)
 
     def clone(self) -> QIconEngine:
         return FontIconEngine(self.fontFamily, self.char, self.color, self.isBold)
 
     def pixmap(self, size, mode, state):
-        image = QImage(size, QImage.Format_ARGB32)
-        image.fill(Qt.transparent)
-        pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
-
-        painter = QPainter(pixmap)
-        rect = QRect(0, 0, size.width(), size.height())
-        self.paint(painter, rect, mode, state)
-        return pixmap
+        key = ('font', self.fontFamily, self.char, self.isBold, QColor(self.color).rgba())
+        return iconCache.pixmap(key, size, 1, lambda p, r: self.paint(p, r, mode, state))
 
 
 def getIconColor(theme=Theme.AUTO, reverse=False):
@@ -163,8 +423,10 @@ def drawSvgIcon(icon, painter, rect):
     rect: QRect | QRectF
         the rect to render icon
     """
-    renderer = QSvgRenderer(icon)
-    renderer.render(painter, QRectF(rect))
+    if not isinstance(icon, (str, bytes)):
+        icon = bytes(icon)
+
+    iconCache.draw(painter, rect, ('svg', icon), lambda p, r: svgRendererPool.renderer(icon).render(p, r))
 
 
 def writeSvg(iconPath: str, indexes=None, **attributes):
@@ -209,7 +471,14 @@ def writeSvg(iconPath: str, indexes=None, **attributes):
     return dom.toString()
 
 
-def drawIcon(icon, painter, rect, state=QIcon.Off, **attributes):
+def _drawModifiedSvgIcon(iconPath: str, painter, rect, indexes, attributes: dict):
+    """ draw svg icon with specified path attributes, the svg is only rewritten when it is not cached """
+    key = ('svg', iconPath, attributesKey(indexes, attributes))
+    iconCache.draw(painter, rect, key,
+                   lambda p, r: svgRendererPool.modifiedRenderer(iconPath, indexes, **attributes).render(p, r))
+
+
+def drawIcon(icon, painter, rect, state=QIcon.Off, key=None, **attributes):
     """ draw icon
 
     Parameters
@@ -223,16 +492,34 @@ def drawIcon(icon, painter, rect, state=QIcon.Off, **attributes):
     rect: QRect | QRectF
         the rect to render icon
 
+    key: Hashable
+        the cache key of icon, it should be given if the icon is created for each painting,
+        e.g. `(fluentIcon, theme)` for the icon returned by `fluentIcon.icon(theme)`
+
     **attribute:
         the attribute of svg icon
     """
     if isinstance(icon, FluentIconBase):
-        icon.render(painter, rect, **attributes)
+        return icon.render(painter, rect, **attributes)
     elif isinstance(icon, Icon):
-        icon.fluentIcon.render(painter, rect, **attributes)
-    else:
-        icon = QIcon(icon)
-        icon.paint(painter, QRectF(rect).toRect(), Qt.AlignCenter, state=state)
+        return icon.fluentIcon.render(painter, rect, **attributes)
+
+    # the cache key of pixmap and image is stable, while the converted icon gets a new one
+    if key is not None:
+        key = ('key', key)
+    elif isinstance(icon, (str, QPixmap, QImage)):
+        key = (type(icon).__name__, icon if isinstance(icon, str) else icon.cacheKey())
+    elif isinstance(icon, QIcon):
+        key = ('QIcon', icon.cacheKey())
+
+    if isinstance(icon, QImage):
+        icon = QPixmap.fromImage(icon)
+
+    render = lambda p, r: QIcon(icon).paint(p, r.toRect(), Qt.AlignCenter, state=state)
+    if key is None:
+        return render(painter, QRectF(rect))
+
+    iconCache.draw(painter, QRectF(rect).toRect(), ('icon', key, state), render)
 
 
 class FluentIconBase:
@@ -271,7 +558,7 @@ class FluentIconBase:
             return QIcon(self.path(theme))
 
         color = QColor(color).name()
-        return QIcon(SvgIconEngine(writeSvg(path, fill=color)))
+        return QIcon(SvgIconEngine(svgRendererPool.svg(path, fill=color)))
 
     def colored(self, lightColor: QColor, darkColor: QColor) -> "ColoredFluentIcon":
         """ create a colored fluent icon
@@ -323,13 +610,13 @@ class FluentIconBase:
 
         if icon.endswith('.svg'):
             if attributes:
-                icon = writeSvg(icon, indexes, **attributes).encode()
-
-            drawSvgIcon(icon, painter, rect)
+                _drawModifiedSvgIcon(icon, painter, rect, indexes, attributes)
+            else:
+                drawSvgIcon(icon, painter, rect)
         else:
-            icon = QIcon(icon)
             rect = QRectF(rect).toRect()
-            painter.drawPixmap(rect, icon.pixmap(QRectF(rect).toRect().size()))
+            iconCache.draw(painter, rect, ('icon', icon),
+                           lambda p, r: p.drawPixmap(r.toRect(), QIcon(icon).pixmap(r.toRect().size())))
 
 
 class FluentFontIconBase(FluentIconBase):
@@ -375,17 +662,7 @@ class FluentFontIconBase(FluentIconBase):
         if "fill" in attributes:
             color = QColor(attributes["fill"])
 
-        font = QFont(self.fontFamily)
-        font.setBold(self.isBold)
-        font.setPixelSize(round(rect.height()))
-        painter.setFont(font)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(color)
-        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
-
-        path = QPainterPath()
-        path.addText(rect.x(), rect.y() + rect.height(), font, self.char)
-        painter.drawPath(path)
+        drawFontIcon(painter, rect, self.fontFamily, self.char, color, self.isBold)
 
     def iconNameMapPath(self) -> str:
         return None
@@ -466,8 +743,7 @@ class ColoredFluentIcon(FluentIconBase):
             color = self.darkColor if theme == Theme.DARK else self.lightColor
 
         attributes.update(fill=color.name())
-        icon = writeSvg(icon, indexes, **attributes).encode()
-        drawSvgIcon(icon, painter, rect)
+        _drawModifiedSvgIcon(icon, painter, rect, indexes, attributes)
 
 
 
@@ -1,53 +1,254 @@
 # coding:utf-8
-from math import floor
+from enum import Enum
+from math import floor, sqrt
 from io import BytesIO
+from itertools import count
+import sys
 from typing import Union
 
 import numpy as np
 from colorthief import ColorThief
 from PIL import Image
 from PyQt5.QtGui import QImage, QPixmap
-from PyQt5.QtCore import QIODevice, QBuffer
-from scipy.ndimage.filters import gaussian_filter
+from PyQt5.QtCore import QIODevice, QBuffer, QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from scipy.ndimage import gaussian_filter, uniform_filter1d
 
 from .exception_handler import exceptionHandler
 
 
+class BlurMode(Enum):
+    """ Blur mode """
 
-def gaussianBlur(image, blurRadius=18, brightFactor=1, blurPicSize= None):
-    if isinstance(image, str) and not image.startswith(':'):
-        image = Image.open(image)
-    else:
-        image = fromqpixmap(QPixmap(image))
+    GAUSSIAN = 0
+
+    # separable three-pass box blur approximating gaussian blur, faster for large radius
+    BOX = 1
+
+
+# 32-bit formats whose channels can be viewed directly
+_RGBA32_FORMATS = {
+    QImage.Format_RGB32, QImage.Format_ARGB32, QImage.Format_ARGB32_Premultiplied,
+    QImage.Format_RGBX8888, QImage.Format_RGBA8888, QImage.Format_RGBA8888_Premultiplied
+}
+
+
+def imageToArray(image: QImage) -> np.ndarray:
+    """ view the memory of 32-bit image as an array with shape `(h, w, 4)` without copying
+
+    The image must be kept alive while the array is used. Images in other formats should be
+    converted with `QImage.convertToFormat()` first. The returned array is read only unless the
+    image is not shared with others, because a shared image can't be modified in place
+    """
+    if image.format() not in _RGBA32_FORMATS:
+        raise ValueError("Only 32-bit images can be viewed as array.")
+
+    h, bpl = image.height(), image.bytesPerLine()
+    readonly = not image.isDetached()
+    bits = image.constBits() if readonly else image.bits()
+    bits.setsize(h * bpl)
+
+    array = np.frombuffer(bits, np.uint8).reshape(h, bpl // 4, 4)[:, :image.width()]
+    if readonly:
+        array.flags.writeable = False
+
+    return array
+
+
+def _alphaIndex(image: QImage):
+    """ the index of alpha channel in the array viewed from image """
+    if image.format() in [QImage.Format_RGBX8888, QImage.Format_RGBA8888, QImage.Format_RGBA8888_Premultiplied]:
+        return 3
+
+    # formats like `Format_ARGB32` store pixel as 0xAARRGGBB
+    return 3 if sys.byteorder == 'little' else 0
+
+
+def _boxSizes(sigma: float, n=3):
+    """ the widths of `n` box filters approximating gaussian filter """
+    wIdeal = sqrt(12 * sigma * sigma / n + 1)
+    wl = int(floor(wIdeal))
+    wl -= 1 if wl % 2 == 0 else 0
+    wu = wl + 2
+
+    m = round((12 * sigma * sigma - n * wl * wl - 4 * n * wl - 3 * n) / (-4 * wl - 4))
+    return [wl if i < m else wu for i in range(n)]
+
+
+def _blurArray(array: np.ndarray, blurRadius: float, mode: BlurMode):
+    """ blur all the channels of array with shape `(h, w, c)` in one pass """
+    if blurRadius <= 0:
+        return array
+
+    if mode == BlurMode.GAUSSIAN:
+        return gaussian_filter(array, (blurRadius, blurRadius, 0), mode='reflect')
+
+    for size in _boxSizes(blurRadius):
+        if size <= 1:
+            continue
+
+        array = uniform_filter1d(array, size, axis=0, mode='reflect')
+        array = uniform_filter1d(array, size, axis=1, mode='reflect')
+
+    return array
+
+
+def blurImage(image: QImage, blurRadius=18, brightFactor=1, blurPicSize=None, mode=BlurMode.GAUSSIAN,
+              downscale=1) -> QImage:
+    """ blur image, this function is thread safe
+
+    Parameters
+    ----------
+    image: QImage
+        the image to be blurred
+
+    blurRadius: float
+        the standard deviation of gaussian blur
+
+    brightFactor: float
+        brightness factor of blurred image
+
+    blurPicSize: tuple
+        maximum size of image, the image will be shrunk before blurring to reduce computation
+
+    mode: BlurMode
+        blur mode
+
+    downscale: float
+        scale the image down by this factor before blurring and scale it back afterwards,
+        which is much faster for large radius with little visual difference
+
+    Returns
+    -------
+    image: QImage
+        blurred image in `Format_ARGB32_Premultiplied` or `Format_RGB32` format
+    """
+    if image.isNull():
+        return QImage()
 
     if blurPicSize:
         # adjust image size to reduce computation
-        w, h = image.size
+        w, h = image.width(), image.height()
         ratio = min(blurPicSize[0] / w, blurPicSize[1] / h)
-        w_, h_ = w * ratio, h * ratio
+        if ratio < 1:
+            image = image.scaled(int(w * ratio), int(h * ratio), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+    size = image.size()
+    if downscale > 1:
+        w, h = max(int(size.width() / downscale), 1), max(int(size.height() / downscale), 1)
+        image = image.scaled(w, h, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        blurRadius /= downscale
+
+    format = QImage.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format_RGB32
+    if image.format() != format:
+        image = image.convertToFormat(format)
 
-        if w_ < w:
-            image = image.resize((int(w_), int(h_)))
+    src = imageToArray(image)
+    alpha = _alphaIndex(image)
+    channels = [i for i in range(4) if i != alpha]
 
-    image = np.array(image)
+    result = QImage(image.width(), image.height(), format)
+    dst = imageToArray(result)
 
-    # handle gray image
-    if len(image.shape) == 2:
-        image = np.stack([image, image, image], axis=-1)
+    if image.hasAlphaChannel():
+        # blur the premultiplied color channels together with alpha channel
+        array = _blurArray(src.astype(np.float32), blurRadius, mode)
+        if brightFactor != 1:
+            array[:, :, channels] *= brightFactor
 
-    # blur each channel
-    for i in range(3):
-        image[:, :, i] = gaussian_filter(
-            image[:, :, i], blurRadius) * brightFactor
+        dst[:] = np.clip(array + 0.5, 0, 255).astype(np.uint8)
 
-    # convert ndarray to QPixmap
-    h, w, c = image.shape
-    if c == 3:
-        format = QImage.Format_RGB888
+        # premultiplied color can't exceed alpha
+        dst[:, :, channels] = np.minimum(dst[:, :, channels], dst[:, :, alpha:alpha + 1])
     else:
-        format = QImage.Format_RGBA8888
+        array = _blurArray(src[:, :, channels].astype(np.float32), blurRadius, mode)
+        if brightFactor != 1:
+            array *= brightFactor
+
+        dst[:, :, channels] = np.clip(array + 0.5, 0, 255).astype(np.uint8)
+        dst[:, :, alpha] = 255
+
+    if downscale > 1:
+        result = result.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+    return result
+
+
+def gaussianBlur(image, blurRadius=18, brightFactor=1, blurPicSize=None, mode=BlurMode.GAUSSIAN, downscale=1):
+    """ blur image
+
+    Parameters
+    ----------
+    image: str | QImage | QPixmap
+        the path of image or the image to be blurred
+
+    for the other parameters, see `blurImage()`
+
+    Returns
+    -------
+    pixmap: QPixmap
+        blurred pixmap
+    """
+    if isinstance(image, QPixmap):
+        image = image.toImage()
+    elif not isinstance(image, QImage):
+        image = QImage(image)
+
+    image = blurImage(image, blurRadius, brightFactor, blurPicSize, mode, downscale)
+    return QPixmap.fromImage(image)
+
+
+class BlurTask(QRunnable):
+    """ Blur task running in thread pool """
+
+    def __init__(self, taskId: int, engine: "BlurEngine", image: QImage, blurRadius, brightFactor,
+                 blurPicSize, mode, downscale):
+        super().__init__()
+        self.taskId = taskId
+        self.engine = engine
+        self.image = image
+        self.args = (blurRadius, brightFactor, blurPicSize, mode, downscale)
+
+    def run(self):
+        image = blurImage(self.image, *self.args)
+        self.engine.blurFinished.emit(self.taskId, image)
+
+
+class BlurEngine(QObject):
+    """ Blur engine which blurs images in a thread pool
+
+    Only `QImage` is used off the GUI thread, the finished signal is delivered to the receivers
+    in their own threads
+    """
+
+    blurFinished = pyqtSignal(int, QImage)
+
+    _taskIds = count(1)
+
+    def __init__(self, maxThreadCount: int = None, parent=None):
+        super().__init__(parent=parent)
+        self.threadPool = QThreadPool(self)
+        if maxThreadCount:
+            self.threadPool.setMaxThreadCount(maxThreadCount)
+
+    def blur(self, image: Union[QImage, QPixmap], blurRadius=18, brightFactor=1, blurPicSize=None,
+             mode=BlurMode.GAUSSIAN, downscale=1) -> int:
+        """ blur image asynchronously, see `blurImage()` for the parameters
+
+        Returns
+        -------
+        taskId: int
+            the id of blur task, which is emitted with the blurred image by `blurFinished`
+        """
+        if isinstance(image, QPixmap):
+            image = image.toImage()
+
+        taskId = next(self._taskIds)
+        task = BlurTask(taskId, self, image, blurRadius, brightFactor, blurPicSize, mode, downscale)
+        self.threadPool.start(task)
+        return taskId
 
-    return QPixmap.fromImage(QImage(image.data, w, h, c*w, format))
+    def waitForDone(self, msecs=-1):
+        return self.threadPool.waitForDone(msecs)
 
 
 # https://github.com/python-pillow/Pillow/blob/main/src/PIL/ImageQt.py
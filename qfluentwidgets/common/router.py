@@ -1,6 +1,6 @@
 # coding:utf-8
-from typing import Dict, List
-from itertools import groupby
+from collections import deque
+from typing import Deque, Dict, List
 
 from PyQt5.QtCore import Qt, QObject, pyqtSignal
 from PyQt5.QtWidgets import QWidget, QStackedWidget
@@ -20,51 +20,194 @@ class RouteItem:
         return other.stacked is self.stacked and self.routeKey == other.routeKey
 
 
+class RouteHistory:
+    """ Bounded history of route keys without consecutive duplicates
+
+    The number of occurrences of each route key is counted, so membership test is O(1).
+    """
+
+    def __init__(self, capacity: int = None):
+        self._items = deque(maxlen=self._validCapacity(capacity))    # type: Deque
+        self._counts = {}   # type: Dict[object, int]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, key):
+        return key in self._counts
+
+    def __getitem__(self, index: int):
+        return self._items[index]
+
+    def capacity(self):
+        return self._items.maxlen
+
+    def setCapacity(self, capacity: int):
+        """ set the maximum length of history, the oldest items are discarded if exceeded """
+        self._items = deque(self._items, maxlen=self._validCapacity(capacity))
+        self._recount()
+
+    def key(self, item):
+        return item
+
+    def append(self, item):
+        """ append item, return `False` if the item is the same as the last one """
+        key = self.key(item)
+        if self._items and self.key(self._items[-1]) == key:
+            return False
+
+        if len(self._items) == self._items.maxlen:
+            self._discount(self.key(self._items[0]))
+
+        self._items.append(item)
+        self._counts[key] = self._counts.get(key, 0) + 1
+        return True
+
+    def pop(self):
+        item = self._items.pop()
+        self._discount(self.key(item))
+        return item
+
+    def popLeft(self):
+        item = self._items.popleft()
+        self._discount(self.key(item))
+        return item
+
+    def remove(self, key):
+        """ remove all the items of key and merge the consecutive duplicates """
+        if key not in self._counts:
+            return False
+
+        items = []
+        for item in self._items:
+            k = self.key(item)
+            if k != key and (not items or self.key(items[-1]) != k):
+                items.append(item)
+
+        self._items = deque(items, maxlen=self._items.maxlen)
+        self._recount()
+        return True
+
+    def clear(self):
+        self._items.clear()
+        self._counts.clear()
+
+    @staticmethod
+    def _validCapacity(capacity: int):
+        return None if capacity is None else max(capacity, 1)
+
+    def _discount(self, key):
+        count = self._counts[key] - 1
+        if count:
+            self._counts[key] = count
+        else:
+            self._counts.pop(key)
+
+    def _recount(self):
+        self._counts.clear()
+        for item in self._items:
+            key = self.key(item)
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+
+class RouteItemHistory(RouteHistory):
+    """ Route item history, the route items are compared by stacked widget and route key """
+
+    def key(self, item: RouteItem):
+        return item.stacked, item.routeKey
+
+    def remove(self, routeKey: str):
+        """ remove all the items of route key in any stacked widget and merge the consecutive
+        items with the same route key """
+        isFound = False
+        items = []
+        for item in self._items:
+            if item.routeKey == routeKey:
+                isFound = True
+            elif not items or items[-1].routeKey != item.routeKey:
+                items.append(item)
+
+        self._items = deque(items, maxlen=self._items.maxlen)
+        self._recount()
+        return isFound
+
+
 class StackedHistory:
     """ Stacked history """
 
-    def __init__(self, stacked: QStackedWidget):
+    def __init__(self, stacked: QStackedWidget, capacity: int = None):
         self.stacked = stacked
         self.defaultRouteKey = None  # type: str
-        self.history = [self.defaultRouteKey]   # type: List[str]
+        self.routeKeys = RouteHistory(capacity)
+        self.widgets = {}   # type: Dict[str, QWidget]
+
+    @property
+    def history(self) -> List[str]:
+        return [self.defaultRouteKey] + list(self.routeKeys)
 
     def __len__(self):
-        return len(self.history)
+        return len(self.routeKeys) + 1
 
     def isEmpty(self):
         return len(self) <= 1
 
     def push(self, routeKey: str):
-        if self.history[-1] == routeKey:
+        if self.top() == routeKey:
             return False
 
-        self.history.append(routeKey)
-        return True
+        return self.routeKeys.append(routeKey)
 
     def pop(self):
         if self.isEmpty():
             return
 
-        self.history.pop()
+        self.routeKeys.pop()
         self.goToTop()
 
     def remove(self, routeKey: str):
-        if routeKey not in self.history:
+        if routeKey not in self.routeKeys:
             return
 
-        self.history[1:] = [i for i in self.history[1:] if i != routeKey]
-        self.history = [k for k, g in groupby(self.history)]
+        self.routeKeys.remove(routeKey)
+
+        # merge the first route key with the default one
+        if self.routeKeys and self.routeKeys[0] == self.defaultRouteKey:
+            self.routeKeys.popLeft()
+
         self.goToTop()
 
     def top(self):
-        return self.history[-1]
+        return self.routeKeys[-1] if self.routeKeys else self.defaultRouteKey
 
     def setDefaultRouteKey(self, routeKey: str):
         self.defaultRouteKey = routeKey
-        self.history[0] = routeKey
+
+    def setCapacity(self, capacity: int):
+        self.routeKeys.setCapacity(capacity)
+
+    def widget(self, routeKey: str) -> QWidget:
+        """ get the sub interface of route key, the result of lookup is cached """
+        w = self.widgets.get(routeKey)
+
+        try:
+            if w is not None and w.objectName() == routeKey:
+                return w
+        except RuntimeError:
+            pass
+
+        w = self.stacked.findChild(QWidget, routeKey) if routeKey else None
+        if w:
+            self.widgets[routeKey] = w
+        else:
+            self.widgets.pop(routeKey, None)
+
+        return w
 
     def goToTop(self):
-        w = self.stacked.findChild(QWidget, self.top())
+        w = self.widget(self.top())
         if w:
             self.stacked.setCurrentWidget(w)
 
@@ -74,17 +217,43 @@ class Router(QObject):
 
     emptyChanged = pyqtSignal(bool)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, capacity: int = None):
+        """
+        Parameters
+        ----------
+        parent: QObject
+            parent object
+
+        capacity: int
+            the maximum length of history, `None` means no limit
+        """
         super().__init__(parent=parent)
-        self.history = []   # type: List[RouteItem]
+        self._capacity = capacity
+        self.history = RouteItemHistory(capacity)
         self.stackHistories = {}  # type: Dict[QStackedWidget, StackedHistory]
 
+    def capacity(self):
+        return self._capacity
+
+    def setCapacity(self, capacity: int):
+        """ set the maximum length of history, the oldest routes are discarded if exceeded
+
+        Parameters
+        ----------
+        capacity: int
+            the maximum length of history, `None` means no limit
+        """
+        self._capacity = capacity
+        self.history.setCapacity(capacity)
+
+        for history in self.stackHistories.values():
+            history.setCapacity(capacity)
+
+        self.emptyChanged.emit(not bool(self.history))
+
     def setDefaultRouteKey(self, stacked: QStackedWidget, routeKey: str):
         """ set the default route key of stacked widget """
-        if stacked not in self.stackHistories:
-            self.stackHistories[stacked] = StackedHistory(stacked)
-
-        self.stackHistories[stacked].setDefaultRouteKey(routeKey)
+        self._stackedHistory(stacked).setDefaultRouteKey(routeKey)
 
     def push(self, stacked: QStackedWidget, routeKey: str):
         """ push history
@@ -99,11 +268,8 @@ class Router(QObject):
         """
         item = RouteItem(stacked, routeKey)
 
-        if stacked not in self.stackHistories:
-            self.stackHistories[stacked] = StackedHistory(stacked)
-
         # don't add duplicated history
-        success = self.stackHistories[stacked].push(routeKey)
+        success = self._stackedHistory(stacked).push(routeKey)
         if success:
             self.history.append(item)
 
@@ -120,14 +286,96 @@ class Router(QObject):
 
     def remove(self, routeKey: str):
         """ remove history """
-        self.history = [i for i in self.history if i.routeKey != routeKey]
-        self.history = [list(g)[0] for k, g in groupby(self.history, lambda i: i.routeKey)]
+        self.history.remove(routeKey)
         self.emptyChanged.emit(not bool(self.history))
 
         for stacked, history in self.stackHistories.items():
-            w = stacked.findChild(QWidget, routeKey)
-            if w:
+            if routeKey in history.routeKeys and history.widget(routeKey):
                 return history.remove(routeKey)
 
+    def saveState(self) -> dict:
+        """ save the history to a JSON serializable dict, the stacked widgets are identified
+        by their object names or registration orders """
+        stackeds = list(self.stackHistories.keys())
+        return {
+            "stackeds": [
+                {
+                    "name": s.objectName(),
+                    "defaultRouteKey": h.defaultRouteKey,
+                    "history": list(h.routeKeys)
+                } for s, h in self.stackHistories.items()
+            ],
+            "history": [[stackeds.index(i.stacked), i.routeKey] for i in self.history]
+        }
+
+    def restoreState(self, state: dict):
+        """ restore the history saved by `saveState()`, the stacked widgets should be registered
+        by `setDefaultRouteKey()` or `push()` already
+
+        Returns
+        -------
+        success: bool
+            whether all the stacked widgets in state are found
+        """
+        stackeds = list(self.stackHistories.keys())
+        names = {s.objectName(): s for s in stackeds if s.objectName()}
+
+        # match stacked widgets by object name first, then by registration order
+        matches = []    # type: List[QStackedWidget]
+        for i, info in enumerate(state.get("stackeds", [])):
+            stacked = names.get(info.get("name"))
+            if stacked is None and not info.get("name") and i < len(stackeds):
+                stacked = stackeds[i]
+
+            matches.append(stacked)
+
+        self.history.clear()
+        for index, routeKey in state.get("history", []):
+            if 0 <= index < len(matches) and matches[index] is not None:
+                self.history.append(RouteItem(matches[index], routeKey))
+
+        for stacked, info in zip(matches, state.get("stackeds", [])):
+            if stacked is None:
+                continue
+
+            history = self.stackHistories[stacked]
+            history.routeKeys.clear()
+
+            if info.get("defaultRouteKey") is not None:
+                history.setDefaultRouteKey(info["defaultRouteKey"])
+
+            for routeKey in info.get("history", []):
+                history.push(routeKey)
+
+            history.goToTop()
+
+        self.emptyChanged.emit(not bool(self.history))
+        return all(i is not None for i in matches)
+
+    def _stackedHistory(self, stacked: QStackedWidget) -> StackedHistory:
+        if stacked not in self.stackHistories:
+            self.stackHistories[stacked] = StackedHistory(stacked, self._capacity)
+            stacked.destroyed.connect(lambda: self._removeStacked(stacked))
+
+        return self.stackHistories[stacked]
+
+    def _removeStacked(self, stacked: QStackedWidget):
+        if self.stackHistories.pop(stacked, None) is None:
+            return
+
+        items = [i for i in self.history if i.stacked is not stacked]
+        if len(items) == len(self.history):
+            return
+
+        self.history.clear()
+        for item in items:
+            self.history.append(item)
+
+        try:
+            self.emptyChanged.emit(not bool(self.history))
+        except RuntimeError:
+            # the router is deleted before stacked widget
+            pass
+
 
-qrouter = Router()
\ No newline at end of file
+qrouter = Router()
@@ -1,12 +1,14 @@
 # coding:utf-8
+from collections import OrderedDict, deque
 from enum import Enum
+import re
 from string import Template
-from typing import List, Union
+from typing import Dict, List, Union
 import weakref
 
-from PyQt5.QtCore import QFile, QObject, QEvent
+from PyQt5.QtCore import Qt, QFile, QFileInfo, QObject, QEvent, QTimer, QElapsedTimer, pyqtSignal
 from PyQt5.QtGui import QColor
-from PyQt5.QtWidgets import QWidget
+from PyQt5.QtWidgets import QWidget, QApplication
 
 from .config import qconfig, Theme, isDarkTheme
 
@@ -14,8 +16,16 @@ from .config import qconfig, Theme, isDarkTheme
 class StyleSheetManager(QObject):
     """ Style sheet manager """
 
+    SHARED_QSS_KEY = 'sharedQss'
+    SHARED_QSS_PLACEHOLDER = '/* sharedQss */'
+    SHARED_QSS_BEGIN = '/* qfluentwidgets shared style sheet begin */'
+    SHARED_QSS_END = '/* qfluentwidgets shared style sheet end */'
+
     def __init__(self):
         self.widgets = weakref.WeakKeyDictionary()
+        self.isSharingEnabled = False
+        self._scopedQss = {}
+        self._sharedKey = None
 
     def register(self, source, widget: QWidget, reset=True):
         """ register widget to manager
@@ -61,6 +71,105 @@ class StyleSheetManager(QObject):
         """ get the qss source of widget """
         return self.widgets.get(widget, StyleSheetCompose([]))
 
+    def setSharingEnabled(self, isEnabled: bool):
+        """ set whether to share the fluent style sheets through the application style sheet """
+        if isEnabled == self.isSharingEnabled:
+            return
+
+        self.isSharingEnabled = isEnabled
+        self._sharedKey = None
+        self._setSharedStyleSheet('')
+        self.updateSharedStyleSheet()
+
+    def styleSheet(self, widget: QWidget, theme=Theme.AUTO):
+        """ get the style sheet installed on the widget itself
+
+        When sharing is enabled, the `FluentStyleSheet` sources are moved to the application style
+        sheet as rules scoped to the widgets marked with the `sharedQss` property, so that only
+        the other sources such as `CustomStyleSheet` remain in the widget's own style sheet.
+
+        A placeholder is returned instead of an empty style sheet, otherwise Qt may reset the fonts
+        set by `setFont()` when the application style sheet changes
+        """
+        source = self.source(widget)
+        if not self.isSharingEnabled:
+            return getStyleSheet(source, theme)
+
+        shared, local = [], []
+        self._splitSource(source, shared, local)
+
+        # the application style sheet is always rendered in the current theme
+        if theme not in [Theme.AUTO, qconfig.theme]:
+            shared, local = [], shared + local
+
+        self._share(widget, shared)
+        return getStyleSheet(StyleSheetCompose(local), theme) or self.SHARED_QSS_PLACEHOLDER
+
+    def updateSharedStyleSheet(self):
+        """ update the application style sheet which contains the shared style sheets
+
+        All the fluent style sheets are installed at once, because changing the application
+        style sheet repolishes every widget
+        """
+        if not self.isSharingEnabled or not isinstance(QApplication.instance(), QApplication):
+            return
+
+        key = styleSheetCache.renderKey()
+        if key == self._sharedKey:
+            return
+
+        self._sharedKey = key
+        qss = '\n'.join(renderQss(self._scopeSource(i)) for i in FluentStyleSheet)
+        self._setSharedStyleSheet(qss)
+
+    def _splitSource(self, source: 'StyleSheetBase', shared: list, local: list):
+        if isinstance(source, StyleSheetCompose):
+            for i in source.sources:
+                self._splitSource(i, shared, local)
+        elif isinstance(source, FluentStyleSheet):
+            if source not in shared:
+                shared.append(source)
+        elif source not in local:
+            local.append(source)
+
+    def _share(self, widget: QWidget, sources: List['StyleSheetBase']):
+        self.updateSharedStyleSheet()
+
+        scope = ' '.join(i.value for i in sources)
+        if (widget.property(self.SHARED_QSS_KEY) or '') == scope:
+            return
+
+        widget.setProperty(self.SHARED_QSS_KEY, scope)
+        if widget.testAttribute(Qt.WA_WState_Polished):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def _scopeSource(self, source: 'StyleSheetBase'):
+        qss = source.content()
+        key = (qss, source.value)
+
+        scoped = self._scopedQss.get(key)
+        if scoped is None:
+            scoped = self._scopedQss[key] = scopeQss(qss, f'[{self.SHARED_QSS_KEY}~="{source.value}"]')
+
+        return scoped
+
+    def _setSharedStyleSheet(self, qss: str):
+        app = QApplication.instance()
+        if not isinstance(app, QApplication):
+            return
+
+        appQss = app.styleSheet()
+        begin, end = appQss.find(self.SHARED_QSS_BEGIN), appQss.find(self.SHARED_QSS_END)
+        if begin >= 0 and end >= 0:
+            appQss = appQss[:begin].rstrip('\n') + appQss[end + len(self.SHARED_QSS_END):]
+
+        if qss:
+            appQss = '\n'.join([appQss, self.SHARED_QSS_BEGIN, qss, self.SHARED_QSS_END]).lstrip('\n')
+
+        if appQss != app.styleSheet():
+            app.setStyleSheet(appQss)
+
 
 styleSheetManager = StyleSheetManager()
 
@@ -71,6 +180,142 @@ class QssTemplate(Template):
     delimiter = '--'
 
 
+class StyleSheetCache:
+    """ Compiled style sheet cache
+
+    The raw content of qss files and the parsed templates are cached once, the rendered
+    style sheets are cached per render key `(theme, theme color, font families)` and
+    dropped as soon as one of these inputs changes
+    """
+
+    def __init__(self, maxSize=512):
+        self.maxSize = maxSize
+        self._files = {}                # path -> (modified time, qss)
+        self._templates = {}            # qss -> QssTemplate
+        self._renders = OrderedDict()   # qss -> rendered qss
+        self._key = None
+        self._mappings = {}
+
+    def file(self, path: str) -> str:
+        """ get the content of qss file, the files outside the resource system are reloaded when modified """
+        isResource = path.startswith(':') or path.startswith('qrc:')
+        mtime = 0 if isResource else QFileInfo(path).lastModified().toMSecsSinceEpoch()
+
+        cache = self._files.get(path)
+        if cache is not None and cache[0] == mtime:
+            return cache[1]
+
+        qss = getStyleSheetFromFile(path)
+        self._files[path] = (mtime, qss)
+        return qss
+
+    def template(self, qss: str) -> QssTemplate:
+        """ get the parsed template of style sheet """
+        template = self._templates.get(qss)
+        if template is None:
+            template = self._templates[qss] = QssTemplate(qss)
+
+            if len(self._templates) > self.maxSize:
+                self._templates.pop(next(iter(self._templates)))
+
+        return template
+
+    def render(self, qss: str) -> str:
+        """ render font and theme color to style sheet """
+        self._checkKey()
+
+        result = self._renders.get(qss)
+        if result is not None:
+            self._renders.move_to_end(qss)
+            return result
+
+        result = self.template(qss).safe_substitute(self._mappings)
+        self._renders[qss] = result
+
+        if len(self._renders) > self.maxSize:
+            self._renders.popitem(last=False)
+
+        return result
+
+    def renderKey(self):
+        """ get the inputs that the rendered style sheet depends on """
+        color = qconfig.get(qconfig._cfg.themeColor)    # type: QColor
+        families = tuple(qconfig.get(qconfig.fontFamilies))
+        return qconfig.theme, color.name(QColor.HexArgb), families
+
+    def clear(self):
+        """ clear all cached style sheets """
+        self._files.clear()
+        self._templates.clear()
+        self._renders.clear()
+        self._key = None
+
+    def _checkKey(self):
+        key = self.renderKey()
+        if key == self._key:
+            return
+
+        self._key = key
+        self._renders.clear()
+        self._mappings = {c.value: c.name() for c in ThemeColor._member_map_.values()}
+        self._mappings["FontFamilies"] = ",".join([f"'{i}'" for i in key[2]])
+
+
+styleSheetCache = StyleSheetCache()
+
+
+def scopeQss(qss: str, scope: str):
+    """ restrict the rules of style sheet to the scoped widgets and their children
+
+    Parameters
+    ----------
+    qss: str
+        the style sheet to be scoped
+
+    scope: str
+        the selector of scoped widgets without type, i.e `[sharedQss~="button"]`
+    """
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.S)
+
+    rules = []
+    for match in re.finditer(r'([^{}]+)\{([^{}]*)\}', qss):
+        selectors = []
+        for selector in match.group(1).split(','):
+            selector = selector.strip()
+            if selector:
+                selectors.extend([_scopeSelector(selector, scope), f'*{scope} {selector}'])
+
+        if selectors:
+            rules.append(f"{', '.join(selectors)} {{{match.group(2)}}}")
+
+    return '\n'.join(rules)
+
+
+def _scopeSelector(selector: str, scope: str):
+    """ append scope to the last compound selector, before pseudo states and sub controls """
+    start, depth = 0, 0
+    for i, c in enumerate(selector):
+        if c == '[':
+            depth += 1
+        elif c == ']':
+            depth -= 1
+        elif depth == 0 and (c.isspace() or c == '>'):
+            start = i + 1
+
+    pos, depth = len(selector), 0
+    for i in range(start, len(selector)):
+        c = selector[i]
+        if c == '[':
+            depth += 1
+        elif c == ']':
+            depth -= 1
+        elif depth == 0 and c == ':':
+            pos = i
+            break
+
+    return selector[:pos] + scope + selector[pos:]
+
+
 def applyThemeColor(qss: str):
     """ apply theme color to style sheet
 
@@ -94,10 +339,7 @@ def renderQss(qss: str):
         the style sheet string to apply theme color, the substituted variable
         should be equal to the value of `ThemeColor` and starts width `--`, i.e `--ThemeColorPrimary`
     """
-    template = QssTemplate(qss)
-    mappings = {c.value: c.name() for c in ThemeColor._member_map_.values()}
-    mappings["FontFamilies"] = ",".join([f"'{i}'" for i in qconfig.get(qconfig.fontFamilies)])
-    return template.safe_substitute(mappings)
+    return styleSheetCache.render(qss)
 
 
 class StyleSheetBase:
@@ -109,7 +351,7 @@ class StyleSheetBase:
 
     def content(self, theme=Theme.AUTO):
         """ get the content of style sheet """
-        return getStyleSheetFromFile(self.path(theme))
+        return styleSheetCache.file(self.path(theme))
 
     def apply(self, widget: QWidget, theme=Theme.AUTO):
         """ apply style sheet to widget """
@@ -257,7 +499,7 @@ class DirtyStyleSheetWatcher(QObject):
 
         obj.setProperty('dirty-qss', False)
         if obj in styleSheetManager.widgets:
-            obj.setStyleSheet(getStyleSheet(styleSheetManager.source(obj)))
+            obj.setStyleSheet(styleSheetManager.styleSheet(obj))
 
         return super().eventFilter(obj, e)
 
@@ -338,7 +580,15 @@ def setStyleSheet(widget: QWidget, source: Union[str, StyleSheetBase], theme=The
     if register:
         styleSheetManager.register(source, widget)
 
-    widget.setStyleSheet(getStyleSheet(source, theme))
+    if register and styleSheetManager.isSharingEnabled:
+        qss = styleSheetManager.styleSheet(widget, theme)
+    else:
+        qss = getStyleSheet(source, theme)
+
+    if not qss and not widget.styleSheet():
+        return
+
+    widget.setStyleSheet(qss)
 
 
 def setCustomStyleSheet(widget: QWidget, lightQss: str, darkQss: str):
@@ -380,7 +630,7 @@ def addStyleSheet(widget: QWidget, source: Union[str, StyleSheetBase], theme=The
     """
     if register:
         styleSheetManager.register(source, widget, reset=False)
-        qss = getStyleSheet(styleSheetManager.source(widget), theme)
+        qss = styleSheetManager.styleSheet(widget, theme)
     else:
         qss = widget.styleSheet() + '\n' + getStyleSheet(source, theme)
 
@@ -388,14 +638,150 @@ def addStyleSheet(widget: QWidget, source: Union[str, StyleSheetBase], theme=The
         widget.setStyleSheet(qss)
 
 
-def updateStyleSheet(lazy=False):
+class StyleSheetUpdater(QObject):
+    """ Style sheet updater which restyles the registered widgets in time-sliced batches
+
+    The visible widgets are restyled first in descending order of their on-screen area,
+    each batch runs for at most `budget` milliseconds before returning to the event loop
+    """
+
+    progressChanged = pyqtSignal(int, int)
+    finished = pyqtSignal()
+
+    def __init__(self, budget=8, parent=None):
+        super().__init__(parent=parent)
+        self.budget = budget
+        self.total = 0
+        self.current = 0
+        self._queue = deque()
+        self._callbacks = []
+        self._timer = None
+        self._isPending = False
+
+    def start(self, lazy=False, callback=None):
+        """ start restyling the registered widgets
+
+        Parameters
+        ----------
+        lazy: bool
+            whether to mark the hidden widgets as dirty instead of restyling them
+
+        callback: callable
+            the function called once all widgets are restyled
+        """
+        styleSheetManager.updateSharedStyleSheet()
+
+        visibles, hiddens, removes = [], [], []
+        for widget in list(styleSheetManager.widgets):
+            try:
+                region = widget.visibleRegion()
+            except RuntimeError:
+                removes.append(widget)
+                continue
+
+            # the hidden widgets are restyled by the dirty style sheet watcher once they are shown,
+            # the visible widgets are not marked to avoid restyling them in the paint events
+            if region.isNull():
+                widget.setProperty('dirty-qss', True)
+                if not lazy:
+                    hiddens.append((weakref.ref(widget), True))
+            else:
+                rect = region.boundingRect()
+                visibles.append((rect.width() * rect.height(), (weakref.ref(widget), False)))
+
+        for widget in removes:
+            styleSheetManager.deregister(widget)
+
+        visibles.sort(key=lambda i: i[0], reverse=True)
+        self._queue = deque([i[1] for i in visibles] + hiddens)
+        self.total = len(self._queue)
+        self.current = 0
+        self._isPending = True
+
+        if callback:
+            self._callbacks.append(callback)
+
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setInterval(0)
+            self._timer.timeout.connect(self._processBatch)
+
+        self._timer.start()
+
+    def stop(self):
+        """ stop restyling and discard the remaining widgets """
+        if self._timer:
+            self._timer.stop()
+
+        self._queue.clear()
+
+    def finish(self):
+        """ restyle the remaining widgets immediately """
+        if not self._isPending:
+            return
+
+        self._processBatch(unlimited=True)
+
+    def isRunning(self):
+        return bool(self._timer and self._timer.isActive())
+
+    def _processBatch(self, unlimited=False):
+        timer = QElapsedTimer()
+        timer.start()
+
+        while self._queue and (unlimited or timer.elapsed() < self.budget):
+            ref, isDirty = self._queue.popleft()
+            widget = ref()
+            self.current += 1
+
+            try:
+                if widget is None or widget not in styleSheetManager.widgets:
+                    continue
+
+                # the hidden widgets may have been restyled by the dirty style sheet watcher
+                if isDirty and not widget.property('dirty-qss'):
+                    continue
+
+                widget.setProperty('dirty-qss', False)
+                widget.setStyleSheet(styleSheetManager.styleSheet(widget, qconfig.theme))
+            except RuntimeError:
+                styleSheetManager.deregister(widget)
+
+        self.progressChanged.emit(self.current, self.total)
+        if self._queue:
+            return
+
+        self._timer.stop()
+        self._isPending = False
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+        self.finished.emit()
+
+
+styleSheetUpdater = StyleSheetUpdater()
+
+
+def updateStyleSheet(lazy=False, batch=False):
     """ update the style sheet of all fluent widgets
 
     Parameters
     ----------
     lazy: bool
         whether to update the style sheet lazily, set to `True` will accelerate theme switching
+
+    batch: bool
+        whether to update the style sheet in time-sliced batches with `styleSheetUpdater`,
+        set to `True` will keep the user interface responsive when there are lots of widgets
     """
+    if batch:
+        return styleSheetUpdater.start(lazy)
+
+    styleSheetUpdater.stop()
+    styleSheetManager.updateSharedStyleSheet()
+
     removes = []
     for widget, file in list(styleSheetManager.items()):
         try:
@@ -410,8 +796,26 @@ def updateStyleSheet(lazy=False):
     for widget in removes:
         styleSheetManager.deregister(widget)
 
+    styleSheetUpdater.finish()
+
+
+def setStyleSheetSharingEnabled(isEnabled: bool):
+    """ set whether to share the fluent style sheets between widgets
+
+    Parameters
+    ----------
+    isEnabled: bool
+        whether to enable sharing. If `isEnabled=True`, each `FluentStyleSheet` is installed once
+        in the application style sheet as rules scoped to the widgets using it, and only the
+        other style sheets such as custom style sheets are installed on the widgets themselves.
+        Note that the precedence of nested shared style sheets follows the qss specificity instead
+        of the widget hierarchy
+    """
+    styleSheetManager.setSharingEnabled(isEnabled)
+    updateStyleSheet()
 
-def setTheme(theme: Theme, save=False, lazy=False):
+
+def setTheme(theme: Theme, save=False, lazy=False, batch=False):
     """ set the theme of application
 
     Parameters
@@ -424,13 +828,21 @@ def setTheme(theme: Theme, save=False, lazy=False):
 
     lazy: bool
         whether to update the style sheet lazily, set to `True` will accelerate theme switching
+
+    batch: bool
+        whether to update the style sheet in time-sliced batches, `qconfig.themeChangedFinished`
+        will be emitted after all widgets are restyled
     """
     qconfig.set(qconfig.themeMode, theme, save)
-    updateStyleSheet(lazy)
-    qconfig.themeChangedFinished.emit()
+
+    if batch:
+        styleSheetUpdater.start(lazy, qconfig.themeChangedFinished.emit)
+    else:
+        updateStyleSheet(lazy)
+        qconfig.themeChangedFinished.emit()
 
 
-def toggleTheme(save=False, lazy=False):
+def toggleTheme(save=False, lazy=False, batch=False):
     """ toggle the theme of application
 
     Parameters
@@ -440,9 +852,12 @@ def toggleTheme(save=False, lazy=False):
 
     lazy: bool
         whether to update the style sheet lazily, set to `True` will accelerate theme switching
+
+    batch: bool
+        whether to update the style sheet in time-sliced batches
     """
     theme = Theme.LIGHT if isDarkTheme() else Theme.DARK
-    setTheme(theme, save, lazy)
+    setTheme(theme, save, lazy, batch)
 
 
 class ThemeColor(Enum):
@@ -457,15 +872,26 @@ class ThemeColor(Enum):
     LIGHT_3 = "ThemeColorLight3"
 
     def name(self):
-        return self.color().name()
+        return themeColorPalette.name(self)
 
     def color(self):
-        color = qconfig.get(qconfig._cfg.themeColor)  # type:QColor
+        return themeColorPalette.color(self)
+
+    def derive(self, color: QColor, isDark: bool):
+        """ derive the theme color from the base color without caching
 
+        Parameters
+        ----------
+        color: QColor
+            the base theme color
+
+        isDark: bool
+            whether to derive the color used in dark theme mode
+        """
         # transform color into hsv space
         h, s, v, _ = color.getHsvF()
 
-        if isDarkTheme():
+        if isDark:
             s *= 0.84
             v = 1
             if self == self.DARK_1:
@@ -503,12 +929,62 @@ class ThemeColor(Enum):
         return QColor.fromHsvF(h, min(s, 1), min(v, 1))
 
 
+class ThemeColorPalette(QObject):
+    """ Theme color palette
+
+    The theme colors are precomputed once and rebuilt only after the theme or the theme color changes
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._theme = None
+        self._baseColor = None
+        self._colors = {}   # type: Dict[ThemeColor, QColor]
+        self._names = {}    # type: Dict[ThemeColor, str]
+
+        qconfig.themeChanged.connect(self.invalidate)
+        qconfig.themeColorChanged.connect(self.invalidate)
+
+    def color(self, key: ThemeColor) -> QColor:
+        """ get the theme color, a copy is returned so that it can be modified safely """
+        self._ensurePalette()
+        return QColor(self._colors[key])
+
+    def name(self, key: ThemeColor) -> str:
+        """ get the hex name of theme color """
+        self._ensurePalette()
+        return self._names[key]
+
+    def invalidate(self):
+        """ rebuild the palette at next lookup """
+        self._baseColor = None
+
+    def _ensurePalette(self):
+        # the config items replace their value on change, so the identity check covers
+        # the changes which are not notified by signals, i.e. `qconfig.load()`
+        baseColor = qconfig.get(qconfig._cfg.themeColor)
+        if baseColor is self._baseColor and qconfig.theme is self._theme:
+            return
+
+        self._baseColor = baseColor
+        self._theme = qconfig.theme
+
+        isDark = isDarkTheme()
+        for key in ThemeColor:
+            color = key.derive(baseColor, isDark)
+            self._colors[key] = color
+            self._names[key] = color.name()
+
+
+themeColorPalette = ThemeColorPalette()
+
+
 def themeColor():
     """ get theme color """
     return ThemeColor.PRIMARY.color()
 
 
-def setThemeColor(color, save=False, lazy=False):
+def setThemeColor(color, save=False, lazy=False, batch=False):
     """ set theme color
 
     Parameters
@@ -521,7 +997,10 @@ def setThemeColor(color, save=False, lazy=False):
 
     lazy: bool
         whether to update the style sheet lazily
+
+    batch: bool
+        whether to update the style sheet in time-sliced batches
     """
     color = QColor(color)
     qconfig.set(qconfig.themeColor, color, save=save)
-    updateStyleSheet(lazy)
+    updateStyleSheet(lazy, batch)
@@ -1,6 +1,14 @@
-from .dialog_box import *
-from .layout import *
-from .settings import *
-from .widgets import *
-from .navigation import *
-from .date_time import *
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from .._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .dialog_box import *
+    from .layout import *
+    from .settings import *
+    from .widgets import *
+    from .navigation import *
+    from .date_time import *
+
+__getattr__, __dir__ = lazyImport(__name__)
@@ -1,4 +1,13 @@
-from .calendar_picker import CalendarPicker, FastCalendarPicker
-from .date_picker import DatePickerBase, DatePicker, ZhDatePicker
-from .picker_base import PickerBase, PickerPanel, PickerColumnFormatter
-from .time_picker import TimePicker, AMTimePicker
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .calendar_picker import CalendarPicker, FastCalendarPicker
+    from .date_picker import DatePickerBase, DatePicker, ZhDatePicker
+    from .picker_base import PickerBase, PickerPanel, PickerColumnFormatter
+    from .popup_pool import PopupPool, popupPool
+    from .time_picker import TimePicker, AMTimePicker
+
+__getattr__, __dir__ = lazyImport(__name__)
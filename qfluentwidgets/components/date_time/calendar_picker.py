@@ -10,6 +10,7 @@ from ...common.icon import FluentIcon as FIF
 from ..widgets.flyout import Flyout, FlyoutAnimationType
 from .calendar_view import CalendarView
 from .fast_calendar_view import FastCalendarView
+from .popup_pool import popupPool
 
 
 class CalendarPicker(QPushButton):
@@ -58,15 +59,19 @@ class CalendarPicker(QPushButton):
         """ set the visibility of reset button """
         self._isResetEnabled = isEnabled
 
+    def prewarmCalendarView(self):
+        """ create the shared calendar view when the event loop is idle """
+        popupPool.prewarm(CalendarView, CalendarView)
+
     def _showCalendarView(self):
-        view = CalendarView(self.window())
+        view = popupPool.popup(CalendarView, CalendarView)
+        view.resetState(self.date)
         view.setResetEnabled(self.isRestEnabled())
 
-        view.resetted.connect(self.reset)
-        view.dateChanged.connect(self._onDateChanged)
-
-        if self.date.isValid():
-            view.setDate(self.date)
+        popupPool.bind(view, [
+            (view.resetted, self.reset),
+            (view.dateChanged, self._onDateChanged)
+        ])
 
         x = int(self.width()/2 - view.sizeHint().width()/2)
         y = self.height()
@@ -1,10 +1,10 @@
 # coding: utf-8
 from math import ceil
 from collections import defaultdict, Counter
-from typing import Tuple, Type
+from typing import List, Tuple, Type
 
 from PyQt5.QtCore import (Qt, QRectF, pyqtSignal, QSize, QModelIndex, QDate, QCalendar, QEasingCurve, QPropertyAnimation,
-                          QParallelAnimationGroup, QPoint, QRect, QStringListModel)
+                          QParallelAnimationGroup, QPoint, QRect, QStringListModel, QAbstractListModel)
 from PyQt5.QtGui import QPainter, QColor, QCursor
 from PyQt5.QtWidgets import (QApplication, QFrame, QPushButton, QHBoxLayout, QVBoxLayout, QListWidget,
                              QListWidgetItem, QStyledItemDelegate, QStyle, QStyleOptionViewItem,
@@ -101,6 +101,10 @@ class ScrollItemDelegate(QStyledItemDelegate):
         painter.restore()
 
     def _drawText(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        # placeholder item has no date
+        if index.data(Qt.UserRole) is None:
+            return
+
         painter.save()
         painter.setFont(self.font)
 
@@ -135,10 +139,142 @@ class DayScrollItemDelegate(ScrollItemDelegate):
         return 3
 
 
-class ScrollViewBase(QListWidget):
-    """ Scroll view base class """
+class CalendarItemModel(QAbstractListModel):
+    """ Calendar item model, the date and text of item are computed from row without storage
 
-    pageChanged = pyqtSignal(int)
+    Only a window of rows is exposed to the view, so the cost of item layout does not
+    depend on the range of years. The rows outside model are called absolute rows.
+    """
+
+    def __init__(self, minYear: int, maxYear: int, itemSize: QSize, parent=None):
+        super().__init__(parent=parent)
+        self.minYear = minYear
+        self.maxYear = maxYear
+        self.itemSize = QSize(itemSize)
+        self.firstRow = 0
+        self._count = self.absoluteRowCount()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def absoluteRowCount(self) -> int:
+        """ Returns the number of rows of all the years """
+        raise NotImplementedError
+
+    def setWindow(self, firstRow: int, rowCount: int):
+        """ expose `rowCount` rows starting from absolute row `firstRow` """
+        self.beginResetModel()
+        self.firstRow = max(0, firstRow)
+        self._count = max(0, min(rowCount, self.absoluteRowCount() - self.firstRow))
+        self.endResetModel()
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self._count:
+            return None
+
+        if role == Qt.SizeHintRole:
+            return self.itemSize
+
+        if role not in (Qt.DisplayRole, Qt.UserRole):
+            return None
+
+        row = index.row() + self.firstRow
+        date = self.absoluteRowToDate(row)
+        if date is None or role == Qt.UserRole:
+            return date
+
+        return self._text(row, date)
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid() or self.rowToDate(index.row()) is None:
+            return Qt.NoItemFlags
+
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def rowToDate(self, row: int) -> QDate:
+        """ Returns the date of row in window, `None` for placeholder """
+        if not 0 <= row < self._count:
+            return None
+
+        return self.absoluteRowToDate(row + self.firstRow)
+
+    def dateToRow(self, date: QDate) -> int:
+        """ Returns the row of date in window, which may be out of window """
+        return self.dateToAbsoluteRow(date) - self.firstRow
+
+    def absoluteRowToDate(self, row: int) -> QDate:
+        raise NotImplementedError
+
+    def dateToAbsoluteRow(self, date: QDate) -> int:
+        raise NotImplementedError
+
+    def _text(self, row: int, date: QDate) -> str:
+        raise NotImplementedError
+
+
+class YearItemModel(CalendarItemModel):
+    """ Year item model """
+
+    def absoluteRowCount(self):
+        return self.maxYear - self.minYear + 1
+
+    def absoluteRowToDate(self, row: int):
+        return QDate(self.minYear + row, 1, 1)
+
+    def dateToAbsoluteRow(self, date: QDate):
+        return date.year() - self.minYear
+
+    def _text(self, row, date):
+        return str(date.year())
+
+
+class MonthItemModel(CalendarItemModel):
+    """ Month item model """
+
+    def __init__(self, minYear: int, maxYear: int, itemSize: QSize, months: List[str], parent=None):
+        self.months = months
+        super().__init__(minYear, maxYear, itemSize, parent)
+
+    def absoluteRowCount(self):
+        return (self.maxYear - self.minYear + 1) * 12
+
+    def absoluteRowToDate(self, row: int):
+        return QDate(self.minYear + row // 12, row % 12 + 1, 1)
+
+    def dateToAbsoluteRow(self, date: QDate):
+        return (date.year() - self.minYear) * 12 + date.month() - 1
+
+    def _text(self, row, date):
+        return self.months[row % 12]
+
+
+class DayItemModel(CalendarItemModel):
+    """ Day item model, the rows before the first day are placeholders to align the week days """
+
+    def __init__(self, minYear: int, maxYear: int, itemSize: QSize, parent=None):
+        self.startDate = QDate(minYear, 1, 1)
+        self.bias = self.startDate.dayOfWeek() - 1
+        self.dayCount = self.startDate.daysTo(QDate(maxYear, 12, 31)) + 1
+        super().__init__(minYear, maxYear, itemSize, parent)
+
+    def absoluteRowCount(self):
+        return self.bias + self.dayCount
+
+    def absoluteRowToDate(self, row: int):
+        if row < self.bias:
+            return None
+
+        return self.startDate.addDays(row - self.bias)
+
+    def dateToAbsoluteRow(self, date: QDate):
+        return self.startDate.daysTo(date) + self.bias
+
+    def _text(self, row, date):
+        return str(date.day())
+
+
+class CalendarScrollBase:
+    """ Calendar scroll view base class """
 
     def __init__(self, Delegate: Type[ScrollItemDelegate], parent=None):
         super().__init__(parent)
@@ -160,12 +296,12 @@ class ScrollViewBase(QListWidget):
 
     def __initWidget(self):
         self.setSpacing(0)
-        self.setMovement(QListWidget.Static)
+        self.setMovement(QListView.Static)
         self.setGridSize(self.gridSize())
         self.setViewportMargins(0, 0, 0, 0)
         self.setItemDelegate(self.delegate)
-        self.setViewMode(QListWidget.IconMode)
-        self.setResizeMode(QListWidget.Adjust)
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
 
         self.vScrollBar.ani.finished.connect(self._onFirstScrollFinished)
         self.vScrollBar.setScrollAnimation(1)
@@ -235,6 +371,116 @@ class ScrollViewBase(QListWidget):
         return QSize(76, 76)
 
 
+class ScrollViewBase(CalendarScrollBase, QListWidget):
+    """ Scroll view base class """
+
+    pageChanged = pyqtSignal(int)
+
+
+class ModelScrollViewBase(CalendarScrollBase, QListView):
+    """ Scroll view base class, whose items are computed by `CalendarItemModel`
+
+    The model only exposes the rows around current page, and the window of rows is moved
+    when the view scrolls close to its edge.
+    """
+
+    pageChanged = pyqtSignal(int)
+
+    # the number of pages before and after current page in the window of model
+    windowPages = 6
+
+    def _initItems(self):
+        self._selectedDate = None   # type: QDate
+        self._currentItemDate = None    # type: QDate
+
+        model = self._createModel()
+        model.setWindow(0, self._windowRows())
+        self.setModel(model)
+        self._updateIndexes()
+
+    def _createModel(self) -> CalendarItemModel:
+        raise NotImplementedError
+
+    def _windowRows(self):
+        return (2 * self.windowPages + 2) * self.pageRows * self.cols
+
+    def scrollToPage(self, page: int):
+        if not self._isPageValid(page):
+            return
+
+        self.currentPage = page
+        row = self._moveWindow(self._pageToRow(page))
+        self._scrollToRow(row)
+        self.delegate.setRange(*self.currentPageRange())
+        self.pageChanged.emit(page)
+
+    def _isPageValid(self, page: int):
+        return 0 <= page <= ceil(self.model().absoluteRowCount() / (self.pageRows * self.cols))
+
+    def _pageToRow(self, page: int) -> int:
+        """ Returns the absolute row of the first item in page """
+        return page * self.pageRows * self.cols
+
+    def _scrollToRow(self, row: int):
+        self.vScrollBar.setValue(row // self.cols * self.gridSize().height())
+
+    def _moveWindow(self, row: int) -> int:
+        """ move the window of model to contain the page starting from absolute row
+
+        Returns
+        -------
+        row: int
+            the row in the window of model
+        """
+        model = self.model()
+        pageSize = self.pageRows * self.cols
+        first, last = model.firstRow, model.firstRow + model.rowCount()
+
+        # the first row of window should be aligned to the columns
+        if first % self.cols == 0 and (first == 0 or row - pageSize >= first) and \
+                (last == model.absoluteRowCount() or row + 2 * pageSize <= last):
+            return row - first
+
+        # keep the position of viewport while the rows are shifted
+        self.vScrollBar.ani.stop()
+        value = self.vScrollBar.value()
+
+        newFirst = max(0, row - self.windowPages * pageSize) // self.cols * self.cols
+        model.setWindow(newFirst, self._windowRows())
+        self.doItemsLayout()
+
+        value += (first - newFirst) // self.cols * self.gridSize().height()
+        self.vScrollBar.setValue(value, False)
+        self.vScrollBar.resetValue(value)
+        self._updateIndexes()
+        return row - newFirst
+
+    def _dateToIndex(self, date: QDate):
+        if date is None:
+            return QModelIndex()
+
+        return self.model().index(self.model().dateToRow(date), 0)
+
+    def _updateIndexes(self):
+        """ map the dates of highlighted items to the rows in the window of model """
+        self.delegate.setCurrentIndex(self._dateToIndex(self.currentDate))
+        self.delegate.setSelectedIndex(self._dateToIndex(self._selectedDate))
+        self.delegate.setPressedIndex(QModelIndex())
+
+        index = self._dateToIndex(self._currentItemDate)
+        if index.isValid():
+            self.setCurrentIndex(index)
+
+    def _setSelectedIndex(self, index):
+        self._selectedDate = index.data(Qt.UserRole)
+        super()._setSelectedIndex(index)
+
+    def currentChanged(self, current: QModelIndex, previous: QModelIndex):
+        super().currentChanged(current, previous)
+        if current.isValid():
+            self._currentItemDate = current.data(Qt.UserRole)
+
+
 class CalendarViewBase(QFrame):
     """ Calendar view base class """
 
@@ -287,7 +533,7 @@ class CalendarViewBase(QFrame):
 
     def setScrollView(self, view: ScrollViewBase):
         self.scrollView = view
-        self.scrollView.itemClicked.connect(lambda i: self.itemClicked.emit(i.data(Qt.UserRole)))
+        self.scrollView.clicked.connect(lambda i: self.itemClicked.emit(i.data(Qt.UserRole)))
         self.vBoxLayout.addWidget(view)
         view.pageChanged.connect(self._updateTitle)
         self._updateTitle()
@@ -320,22 +566,14 @@ class CalendarViewBase(QFrame):
         pass
 
 
-class YearScrollView(ScrollViewBase):
+class YearScrollView(ModelScrollViewBase):
     """ Year scroll view """
 
     def __init__(self, parent=None):
         super().__init__(YearScrollItemDelegate, parent)
 
-    def _initItems(self):
-        years = range(self.minYear, self.maxYear+1)
-        self.addItems([str(i) for i in years])
-
-        for i, year in enumerate(years):
-            item = self.item(i)
-            item.setData(Qt.UserRole, QDate(year, 1, 1))
-            item.setSizeHint(self.sizeHint())
-            if year == self.currentDate.year():
-                self.delegate.setCurrentIndex(self.indexFromItem(item))
+    def _createModel(self):
+        return YearItemModel(self.minYear, self.maxYear, self.sizeHint(), self)
 
     def scrollToDate(self, date: QDate):
         page = (date.year() - self.minYear) // 12
@@ -367,30 +605,19 @@ class YearCalendarView(CalendarViewBase):
         self.setTitle(f'{left.year()} - {right.year()}')
 
 
-class MonthScrollView(ScrollViewBase):
+class MonthScrollView(ModelScrollViewBase):
     """ Month scroll view """
 
     def __init__(self, parent=None):
         super().__init__(YearScrollItemDelegate, parent)
 
-    def _initItems(self):
+    def _createModel(self):
         self.months = [
             self.tr('Jan'), self.tr('Feb'), self.tr('Mar'), self.tr('Apr'),
             self.tr('May'), self.tr('Jun'), self.tr('Jul'), self.tr('Aug'),
             self.tr('Sep'), self.tr('Oct'), self.tr('Nov'), self.tr('Dec'),
         ]
-        self.addItems(self.months * 201)
-
-        # add month items
-        for i in range(12 * 201):
-            year = i // 12 + self.minYear
-            m = i % 12 + 1
-            item = self.item(i)
-            item.setData(Qt.UserRole, QDate(year, m, 1))
-            item.setSizeHint(self.gridSize())
-
-            if year == self.currentDate.year() and m == self.currentDate.month():
-                self.delegate.setCurrentIndex(self.indexFromItem(item))
+        return MonthItemModel(self.minYear, self.maxYear, self.gridSize(), self.months, self)
 
     def scrollToDate(self, date: QDate):
         page = date.year() - self.minYear
@@ -414,12 +641,12 @@ class MonthCalendarView(CalendarViewBase):
 
     def currentPageDate(self) -> QDate:
         date, _ = self.scrollView.currentPageRange()
-        item = self.scrollView.currentItem()
-        month = item.data(Qt.UserRole).month() if item else 1
+        index = self.scrollView.currentIndex()
+        month = index.data(Qt.UserRole).month() if index.isValid() else 1
         return QDate(date.year(), month, 1)
 
 
-class DayScrollView(ScrollViewBase):
+class DayScrollView(ModelScrollViewBase):
     """ Day scroll view """
 
     def __init__(self, parent=None):
@@ -451,54 +678,28 @@ class DayScrollView(ScrollViewBase):
     def gridSize(self) -> QSize:
         return QSize(44, 44)
 
-    def _initItems(self):
-        startDate = QDate(self.minYear, 1, 1)
-        endDate = QDate(self.maxYear, 12, 31)
-        currentDate = startDate
-
-        # add placeholder
-        bias = currentDate.dayOfWeek() - 1
-        for i in range(bias):
-            item = QListWidgetItem(self)
-            item.setFlags(Qt.NoItemFlags)
-            self.addItem(item)
-
-        # add day items
-        items, dates = [], []
-        while currentDate <= endDate:
-            items.append(str(currentDate.day()))
-            dates.append(QDate(currentDate))
-            currentDate = currentDate.addDays(1)
-
-        self.addItems(items)
-        for i in range(bias, self.count()):
-            item = self.item(i)
-            item.setData(Qt.UserRole, dates[i-bias])
-            item.setSizeHint(self.gridSize())
-
-        self.delegate.setCurrentIndex(self.model().index(self._dateToRow(self.currentDate)))
+    def _createModel(self):
+        return DayItemModel(self.minYear, self.maxYear, self.gridSize(), self)
 
     def setDate(self, date: QDate):
         self.scrollToDate(date)
         self.setCurrentIndex(self.model().index(self._dateToRow(date)))
-        self.delegate.setSelectedIndex(self.currentIndex())
+        self._setSelectedIndex(self.currentIndex())
 
     def scrollToDate(self, date: QDate):
         page = (date.year() - self.minYear) * 12 + date.month() - 1
         self.scrollToPage(page)
 
-    def scrollToPage(self, page: int):
-        if not 0 <= page <= 201 * 12 - 1:
-            return
+    def _isPageValid(self, page: int):
+        return 0 <= page <= 201 * 12 - 1
 
-        self.currentPage = page
+    def _pageToRow(self, page: int):
+        year = page // 12 + self.minYear
+        month = page % 12 + 1
+        return self.model().dateToAbsoluteRow(QDate(year, month, 1))
 
-        index = self._dateToRow(self._pageToDate())
-        y = index // self.cols * self.gridSize().height()
-        self.vScrollBar.scrollTo(y)
-
-        self.delegate.setRange(*self.currentPageRange())
-        self.pageChanged.emit(page)
+    def _scrollToRow(self, row: int):
+        self.vScrollBar.scrollTo(row // self.cols * self.gridSize().height())
 
     def currentPageRange(self):
         date = self._pageToDate()
@@ -510,9 +711,7 @@ class DayScrollView(ScrollViewBase):
         return QDate(year, month, 1)
 
     def _dateToRow(self, date: QDate):
-        startDate = QDate(self.minYear, 1, 1)
-        days = startDate.daysTo(date)
-        return days + startDate.dayOfWeek() - 1
+        return self.model().dateToRow(date)
 
     def mouseReleaseEvent(self, e):
         super().mouseReleaseEvent(e)
@@ -643,6 +842,23 @@ class CalendarView(QWidget):
         self.dayView.setDate(date)
         self.date = date
 
+    def resetState(self, date=QDate()):
+        """ reset the view to the state after construction, which is used to reuse view
+
+        Parameters
+        ----------
+        date: QDate
+            the selected date, the current date is shown if it's invalid
+        """
+        self.aniGroup.stop()
+        self.stackedWidget.setCurrentWidget(self.dayView)
+
+        if date.isValid():
+            self.setDate(date)
+        else:
+            self.dayView.setDate(QDate.currentDate())
+            self.date = QDate()
+
     def exec(self, pos: QPoint, ani=True):
         """ show calendar view """
         if self.isVisible():
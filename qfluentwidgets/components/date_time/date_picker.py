@@ -173,7 +173,7 @@ class DatePicker(DatePickerBase):
 
         # update days
         c = panel.column(self.dayIndex)
-        day = c.currentItem().text()
+        day = c.currentText()
         self.setColumnItems(self.dayIndex, range(1, days + 1))
 
         c.setItems(self.columns[self.dayIndex].items())
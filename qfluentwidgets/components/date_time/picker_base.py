@@ -4,14 +4,16 @@ from typing import Iterable, List
 from PyQt5.QtCore import Qt, pyqtSignal, QSize, QRectF, QPoint, QPropertyAnimation, QEasingCurve, QObject
 from PyQt5.QtGui import QColor, QPainter, QCursor, QRegion
 from PyQt5.QtWidgets import (QApplication, QWidget, QFrame, QVBoxLayout, QHBoxLayout,
-                             QGraphicsDropShadowEffect, QSizePolicy, QPushButton, QListWidgetItem)
+                             QGraphicsDropShadowEffect, QSizePolicy, QPushButton)
 
-from ..widgets.cycle_list_widget import CycleListWidget
+from ..widgets.cycle_list_widget import CycleListView
 from ..widgets.button import TransparentToolButton
 from ...common.icon import FluentIcon
 from ...common.screen import getCurrentScreenGeometry
 from ...common.style_sheet import FluentStyleSheet, themeColor, isDarkTheme
 from ...common.color import autoFallbackThemeColor
+from ...common.font import textAtlas
+from .popup_pool import popupPool
 
 
 class SeparatorWidget(QWidget):
@@ -31,7 +33,7 @@ class SeparatorWidget(QWidget):
 class ItemMaskWidget(QWidget):
     """ Item mask widget """
 
-    def __init__(self, listWidgets: List[CycleListWidget], parent=None):
+    def __init__(self, listWidgets: List[CycleListView], parent=None):
         super().__init__(parent=parent)
         self.listWidgets = listWidgets
         self.setFixedHeight(37)
@@ -54,43 +56,30 @@ class ItemMaskWidget(QWidget):
         painter.setBrush(autoFallbackThemeColor(self.lightBackgroundColor, self.darkBackgroundColor))
         painter.drawRoundedRect(self.rect().adjusted(4, 0, -3, 0), 5, 5)
 
-        # draw text
-        painter.setPen(Qt.black if isDarkTheme() else Qt.white)
-        painter.setFont(self.font())
+        # draw the text of items under mask, the rows are computed from scroll position
+        color = Qt.black if isDarkTheme() else Qt.white
         w, h = 0, self.height()
-        for i, p in enumerate(self.listWidgets):
-            painter.save()
-
-            # draw first item's text
-            x = p.itemSize.width()//2 + 4 + self.x()
-            item1 = p.itemAt(QPoint(x, self.y() + 6))
-            if not item1:
-                painter.restore()
-                continue
-
-            iw = item1.sizeHint().width()
-            y = p.visualItemRect(item1).y()
-            painter.translate(w, y - self.y() + 7)
-            self._drawText(item1, painter, 0)
-
-            # draw second item's text
-            item2 = p.itemAt(self.pos() + QPoint(x, h - 6))
-            self._drawText(item2, painter, h)
-
-            painter.restore()
+        for p in self.listWidgets:
+            iw, ih = p.itemSize.width(), p.itemSize.height()
+            value = p.verticalScrollBar().value()
+            row = (value + self.y() + 6) // ih
+            y = row * ih - value - self.y() + 7
+
+            self._drawText(painter, p, p.textAt(row), color, w, y)
+            self._drawText(painter, p, p.textAt((value + self.y() + h - 6) // ih), color, w, y + h)
             w += (iw + 8)  # margin: 0 4px;
 
-    def _drawText(self, item: QListWidgetItem, painter: QPainter, y: int):
-        align = item.textAlignment()
-        w, h = item.sizeHint().width(), item.sizeHint().height()
+    def _drawText(self, painter: QPainter, listWidget: CycleListView, text: str, color, x: int, y: int):
+        align = listWidget.align | Qt.AlignVCenter
+        w, h = listWidget.itemSize.width(), listWidget.itemSize.height()
         if align & Qt.AlignLeft:
-            rect = QRectF(15, y, w, h)      # padding-left: 11px
+            rect = QRectF(x + 15, y, w, h)      # padding-left: 11px
         elif align & Qt.AlignRight:
-            rect = QRectF(4, y, w-15, h)    # padding-right: 11px
-        elif align & Qt.AlignCenter:
-            rect = QRectF(4, y, w, h)
+            rect = QRectF(x + 4, y, w-15, h)    # padding-right: 11px
+        else:
+            rect = QRectF(x + 4, y, w, h)
 
-        painter.drawText(rect, align, item.text())
+        textAtlas.draw(painter, rect, text, self.font(), color, align)
 
 
 class PickerColumnFormatter(QObject):
@@ -374,12 +363,36 @@ class PickerBase(QPushButton):
         """ set whether to enable scroll button auto repeat """
         self._isScrollButtonRepeatEnabled = isEnabled
 
+    def prewarmPanel(self):
+        """ create the shared panel of picker when the event loop is idle """
+        popupPool.prewarm(self._panelKey(), self._panelFactory())
+
+    def _panelKey(self):
+        """ the panels of pickers with the same visible column sizes and alignments are shared """
+        columns = [(c.width(), int(c.align())) for c in self.columns if c.isVisible()]
+        return PickerPanel, tuple(columns)
+
+    def _panelFactory(self):
+        columns = [(c.items(), c.width(), c.align()) for c in self.columns if c.isVisible()]
+
+        def createPanel():
+            panel = PickerPanel()
+            for items, width, align in columns:
+                panel.addColumn(items, width, align)
+
+            return panel
+
+        return createPanel
+
     def _showPanel(self):
         """ show panel """
-        panel = PickerPanel(self)
-        for column in self.columns:
-            if column.isVisible():
-                panel.addColumn(column.items(), column.width(), column.align())
+        panel = popupPool.popup(self._panelKey(), self._panelFactory())
+
+        columns = [c for c in self.columns if c.isVisible()]
+        for column, w in zip(columns, panel.listWidgets):
+            items = column.items()
+            if w.originItems != items:
+                w.setItems(items)
 
         panel.setValue(self.panelInitialValue())
         panel.setResetEnabled(self.isRestEnabled())
@@ -387,10 +400,11 @@ class PickerBase(QPushButton):
         panel.setSelectedBackgroundColor(
             self.lightSelectedBackgroundColor, self.darkSelectedBackgroundColor)
 
-        panel.confirmed.connect(self._onConfirmed)
-        panel.resetted.connect(self.reset)
-        panel.columnValueChanged.connect(
-            lambda i, v: self._onColumnValueChanged(panel, i, v))
+        popupPool.bind(panel, [
+            (panel.confirmed, self._onConfirmed),
+            (panel.resetted, self.reset),
+            (panel.columnValueChanged, lambda i, v: self._onColumnValueChanged(panel, i, v))
+        ])
 
         w = panel.vBoxLayout.sizeHint().width() - self.width()
         panel.exec(self.mapToGlobal(QPoint(-w//2, -37 * 4)))
@@ -436,7 +450,7 @@ class PickerPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.itemHeight = 37
-        self.listWidgets = []   # type: List[CycleListWidget]
+        self.listWidgets = []   # type: List[CycleListView]
 
         self.view = QFrame(self)
         self.itemMaskWidget = ItemMaskWidget(self.listWidgets, self)
@@ -451,6 +465,7 @@ class PickerPanel(QWidget):
         self.vBoxLayout = QVBoxLayout(self.view)
 
         self.scrollButtonRepeatEnabled = True
+        self.ani = None     # type: QPropertyAnimation
 
         self.__initWidget()
 
@@ -458,6 +473,7 @@ class PickerPanel(QWidget):
         self.setWindowFlags(Qt.Popup | Qt.FramelessWindowHint |
                             Qt.NoDropShadowWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_DeleteOnClose, True)
 
         self.setShadowEffect()
         self.yesButton.setIconSize(QSize(16, 16))
@@ -544,13 +560,13 @@ class PickerPanel(QWidget):
         if self.listWidgets:
             self.listLayout.addWidget(SeparatorWidget(Qt.Vertical))
 
-        w = CycleListWidget(items, QSize(width, self.itemHeight), align, self)
+        w = CycleListView(items, QSize(width, self.itemHeight), align, self)
         w.setScrollButtonRepeatEnabled(self.scrollButtonRepeatEnabled)
         w.vScrollBar.valueChanged.connect(self.itemMaskWidget.update)
 
         N = len(self.listWidgets)
-        w.currentItemChanged.connect(
-            lambda i, n=N: self.columnValueChanged.emit(n, i.text()))
+        w.currentTextChanged.connect(
+            lambda t, n=N: self.columnValueChanged.emit(n, t))
 
         self.listWidgets.append(w)
         self.listLayout.addWidget(w)
@@ -562,7 +578,7 @@ class PickerPanel(QWidget):
 
     def value(self):
         """ return the value of columns """
-        return [i.currentItem().text() for i in self.listWidgets]
+        return [i.currentText() for i in self.listWidgets]
 
     def setValue(self, value: list):
         """ set the value of columns """
@@ -577,7 +593,7 @@ class PickerPanel(QWidget):
         if not 0 <= index < len(self.listWidgets):
             return
 
-        return self.listWidgets[index].currentItem().text()
+        return self.listWidgets[index].currentText()
 
     def setColumnValue(self, index: int, value: str):
         """ set the value of specified column """
@@ -604,6 +620,11 @@ class PickerPanel(QWidget):
         if self.isVisible():
             return
 
+        # restore the opacity and mask of reused panel
+        self._stopAni()
+        self.setWindowOpacity(1)
+        self.clearMask()
+
         # show before running animation, or the height calculation will be wrong
         self.show()
 
@@ -618,6 +639,7 @@ class PickerPanel(QWidget):
             return
 
         self.isExpanded = False
+        self._stopAni()
         self.ani = QPropertyAnimation(self.view, b'windowOpacity', self)
         self.ani.valueChanged.connect(self._onAniValueChanged)
         self.ani.setStartValue(0)
@@ -639,11 +661,20 @@ class PickerPanel(QWidget):
 
     def _fadeOut(self):
         self.isExpanded = True
+        self._stopAni()
         self.ani = QPropertyAnimation(self, b'windowOpacity', self)
         self.ani.valueChanged.connect(self._onAniValueChanged)
-        self.ani.finished.connect(self.deleteLater)
+        self.ani.finished.connect(self.close)
         self.ani.setStartValue(1)
         self.ani.setEndValue(0)
         self.ani.setDuration(150)
         self.ani.setEasingCurve(QEasingCurve.OutQuad)
         self.ani.start()
+
+    def _stopAni(self):
+        if not self.ani:
+            return
+
+        self.ani.stop()
+        self.ani.deleteLater()
+        self.ani = None
@@ -0,0 +1,134 @@
+# coding:utf-8
+from typing import Callable, Dict, Hashable, List, Tuple
+
+from PyQt5.QtCore import Qt, QObject, QTimer
+from PyQt5.QtWidgets import QApplication, QWidget
+
+
+class PopupPool(QObject):
+    """ Pool of popups shared by pickers
+
+    One popup is kept for each kind of popup and reused by all the pickers, the picker
+    re-targets the popup with `bind()` and resets it to its own value before showing it.
+    The style sheets of pooled popups are updated by style sheet manager when the theme
+    changes, so the same popup is used for all themes.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._popups = {}   # type: Dict[Hashable, QWidget]
+        self._connections = {}  # type: Dict[QWidget, List[Tuple]]
+        self._isEnabled = True
+        self._isAppConnected = False
+
+    def isEnabled(self):
+        return self._isEnabled
+
+    def setEnabled(self, isEnabled: bool):
+        """ set whether to reuse popups, the pooled popups are released if disabled """
+        self._isEnabled = isEnabled
+        if not isEnabled:
+            self.clear()
+
+    def popup(self, key: Hashable, factory: Callable[[], QWidget]) -> QWidget:
+        """ get the pooled popup of key
+
+        Parameters
+        ----------
+        key: Hashable
+            the key of popup, the popups with the same key should have the same structure
+
+        factory: Callable[[], QWidget]
+            function to create popup, the created popup should have no parent
+
+        Returns
+        -------
+        popup: QWidget
+            the pooled popup, or a popup deleted on close if pool is disabled or the
+            pooled popup is being shown
+        """
+        popup = self._popups.get(key)
+
+        try:
+            if popup is not None and not popup.isVisible():
+                return popup
+        except RuntimeError:
+            self._popups.pop(key, None)
+            popup = None
+
+        if not self.isEnabled() or popup is not None:
+            popup = factory()
+            popup.setAttribute(Qt.WA_DeleteOnClose, True)
+            return popup
+
+        return self._addPopup(key, factory())
+
+    def prewarm(self, key: Hashable, factory: Callable[[], QWidget]):
+        """ create the pooled popup of key when the event loop is idle """
+        if self.isEnabled() and key not in self._popups:
+            QTimer.singleShot(0, lambda: self._prewarm(key, factory))
+
+    def bind(self, popup: QWidget, connections: List[Tuple]):
+        """ connect the signals of popup to the slots of new target, the connections
+        made by last `bind()` are removed
+
+        Parameters
+        ----------
+        popup: QWidget
+            the popup returned by `popup()`
+
+        connections: List[Tuple[pyqtBoundSignal, Callable]]
+            the signals and slots to be connected
+        """
+        for signal, slot in self._connections.pop(popup, []):
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass
+
+        for signal, slot in connections:
+            signal.connect(slot)
+
+        if popup in self._popups.values():
+            self._connections[popup] = connections
+
+    def contains(self, key: Hashable):
+        return key in self._popups
+
+    def clear(self):
+        """ release all the pooled popups """
+        popups = list(self._popups.values())
+        self._popups.clear()
+        self._connections.clear()
+
+        for popup in popups:
+            try:
+                popup.close()
+                popup.deleteLater()
+            except RuntimeError:
+                pass
+
+    def _addPopup(self, key: Hashable, popup: QWidget):
+        popup.setAttribute(Qt.WA_DeleteOnClose, False)
+        popup.destroyed.connect(lambda _, i=id(popup): self._removePopup(key, i))
+        self._popups[key] = popup
+
+        # release popups before application quits
+        app = QApplication.instance()
+        if app and not self._isAppConnected:
+            app.aboutToQuit.connect(self.clear)
+            self._isAppConnected = True
+
+        return popup
+
+    def _removePopup(self, key: Hashable, popupId: int):
+        # the popup of key may be replaced after the pool is cleared
+        if id(self._popups.get(key)) == popupId:
+            self._connections.pop(self._popups.pop(key), None)
+
+    def _prewarm(self, key: Hashable, factory: Callable[[], QWidget]):
+        if self.isEnabled() and key not in self._popups:
+            self._addPopup(key, factory())
+
+
+popupPool = PopupPool()
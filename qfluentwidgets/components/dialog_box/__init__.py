@@ -1,6 +1,14 @@
-from .color_dialog import ColorDialog
-from .dialog import Dialog, MessageBox
-from .folder_list_dialog import FolderListDialog
-from .message_dialog import MessageDialog
-from .message_box_base import MessageBoxBase
-from .mask_dialog_base import MaskDialogBase
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .color_dialog import ColorDialog
+    from .dialog import Dialog, MessageBox
+    from .folder_list_dialog import FolderListDialog
+    from .message_dialog import MessageDialog
+    from .message_box_base import MessageBoxBase
+    from .mask_dialog_base import MaskDialogBase
+
+__getattr__, __dir__ = lazyImport(__name__)
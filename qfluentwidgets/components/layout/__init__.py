@@ -1,3 +1,11 @@
-from .expand_layout import ExpandLayout
-from .flow_layout import FlowLayout, AdaptiveFlowLayout
-from .v_box_layout import VBoxLayout
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .expand_layout import ExpandLayout
+    from .flow_layout import FlowLayout, AdaptiveFlowLayout
+    from .v_box_layout import VBoxLayout
+
+__getattr__, __dir__ = lazyImport(__name__)
@@ -1,8 +1,76 @@
 # coding:utf-8
-from typing import List
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 
 from PyQt5.QtCore import QSize, QPoint, Qt, QRect, QPropertyAnimation, QParallelAnimationGroup, QEasingCurve, QEvent, QTimer, QObject
-from PyQt5.QtWidgets import QLayout, QWidgetItem, QLayoutItem
+from PyQt5.QtWidgets import QApplication, QLayout, QWidgetItem, QLayoutItem, QWidget
+
+
+class FlowLayoutRows:
+    """ Row breakdown of flow layout for a specific width
+
+    The geometries are relative to the top left corner of layout, and the skipped
+    items are recorded as `None`.
+    """
+
+    def __init__(self):
+        self.geometries = []    # type: List[QRect]
+        self.rowIndexes = []    # type: List[int]
+        self.rowTops = []       # type: List[int]
+        self.rowHeights = []    # type: List[int]
+
+    def count(self):
+        return len(self.geometries)
+
+    def addRow(self, index: int, y: int):
+        self.rowIndexes.append(index)
+        self.rowTops.append(y)
+        self.rowHeights.append(0)
+
+    def addItem(self, geometry: QRect):
+        self.geometries.append(geometry)
+
+        if geometry is not None and self.rowHeights:
+            self.rowHeights[-1] = max(self.rowHeights[-1], geometry.height())
+
+    def bottom(self):
+        """ the bottom of last row, or `None` if there are no rows """
+        if not self.rowTops:
+            return None
+
+        return self.rowTops[-1] + self.rowHeights[-1]
+
+    def truncate(self, index: int):
+        """ remove the rows starting from the row which contains the item at `index` """
+        row = bisect_right(self.rowIndexes, index) - 1
+        if row < 0:
+            return self.clear()
+
+        del self.geometries[self.rowIndexes[row]:]
+        del self.rowIndexes[row:]
+        del self.rowTops[row:]
+        del self.rowHeights[row:]
+
+    def itemRange(self, top: int, bottom: int):
+        """ get the index range of items whose rows intersect with [top, bottom] """
+        if not self.rowTops:
+            return 0, 0
+
+        first = max(bisect_right(self.rowTops, top) - 1, 0)
+        if self.rowTops[first] + self.rowHeights[first] < top:
+            first += 1
+
+        last = bisect_right(self.rowTops, bottom)
+        start = self.rowIndexes[first] if first < len(self.rowIndexes) else self.count()
+        end = self.rowIndexes[last] if last < len(self.rowIndexes) else self.count()
+        return start, end
+
+    def clear(self):
+        self.geometries.clear()
+        self.rowIndexes.clear()
+        self.rowTops.clear()
+        self.rowHeights.clear()
 
 
 class FlowLayout(QLayout):
@@ -37,12 +105,37 @@ class FlowLayout(QLayout):
         self._wParent = None
         self._isInstalledEventFilter = False
 
+        self._widgets = set()
+        self._rowsCache = OrderedDict()     # width -> FlowLayoutRows
+        self._maxCacheSize = 4
+        self._minimumSize = None
+        self._itemHints = []    # type: List[QSize]
+        self._isItemHintsDirty = False
+
+        self._isVirtualized = False
+        self._viewport = None   # type: QWidget
+        self._culledWidgets = {}    # type: Dict[QWidget, Tuple[QSize, QSize]]
+        self._visibleRange = (0, 0)
+        self._isCulling = False
+        self._isUpdatingVisible = False
+        self._isVisibleUpdatePending = False
+        self._focusedWidgets = set()
+
     def addItem(self, item):
-        self._items.append(item)
+        self.insertItem(len(self._items), item)
 
     def insertItem(self, index, item):
+        index = max(0, min(index, len(self._items)))
         self._items.insert(index, item)
 
+        if item.widget():
+            self._widgets.add(item.widget())
+
+        self._itemHints.insert(index, None)
+        self._isItemHintsDirty = True
+        self._minimumSize = None
+        self._invalidateRows(index)
+
     def addWidget(self, w):
         super().addWidget(w)
         self._onWidgetAdded(w)
@@ -108,13 +201,25 @@ class FlowLayout(QLayout):
     def takeAt(self, index: int):
         if 0 <= index < len(self._items):
             item = self._items[index]   # type: QLayoutItem
-            ani = item.widget().property('flowAni')
+            w = item.widget()
+            ani = w.property('flowAni')
             if ani:
                 self._anis.remove(ani)
                 self._aniGroup.removeAnimation(ani)
                 ani.deleteLater()
 
-            return self._items.pop(index).widget()
+            self._items.pop(index)
+            self._itemHints.pop(index)
+            self._widgets.discard(w)
+            self._focusedWidgets.discard(w)
+            self._minimumSize = None
+            self._invalidateRows(index)
+
+            if w in self._culledWidgets:
+                self._culledWidgets.pop(w)
+                self._setWidgetVisible(w, True)
+
+            return w
 
         return None
 
@@ -126,12 +231,12 @@ class FlowLayout(QLayout):
     def removeAllWidgets(self):
         """ remove all widgets from layout """
         while self._items:
-            self.takeAt(0)
+            self.takeAt(len(self._items) - 1)
 
     def takeAllWidgets(self):
         """ remove all widgets from layout and delete them """
         while self._items:
-            w = self.takeAt(0)
+            w = self.takeAt(len(self._items) - 1)
             if w:
                 w.deleteLater()
 
@@ -145,6 +250,18 @@ class FlowLayout(QLayout):
         """ get the minimal height according to width """
         return self._doLayout(QRect(0, 0, width, 0), False)
 
+    def invalidate(self):
+        # the visibility of widgets is changed by layout itself in virtualized mode,
+        # which should not trigger a new layout pass
+        if self._isCulling:
+            return
+
+        # Qt invalidates layout on every insertion and removal, so the cached rows are
+        # only discarded from the first item whose size hint is changed
+        self._isItemHintsDirty = True
+        self._minimumSize = None
+        super().invalidate()
+
     def setGeometry(self, rect: QRect):
         super().setGeometry(rect)
 
@@ -157,19 +274,25 @@ class FlowLayout(QLayout):
         return self.minimumSize()
 
     def minimumSize(self):
+        if self._minimumSize is not None:
+            return QSize(self._minimumSize)
+
         size = QSize()
 
         for item in self._items:
-            size = size.expandedTo(item.minimumSize())
+            culled = self._culledWidgets.get(item.widget())
+            size = size.expandedTo(item.minimumSize() if culled is None else culled[1])
 
         m = self.contentsMargins()
         size += QSize(m.left()+m.right(), m.top()+m.bottom())
 
-        return size
+        self._minimumSize = size
+        return QSize(size)
 
     def setVerticalSpacing(self, spacing: int):
         """ set vertical spacing between widgets """
         self._verticalSpacing = spacing
+        self._rowsCache.clear()
 
     def verticalSpacing(self):
         """ get vertical spacing between widgets """
@@ -178,62 +301,279 @@ class FlowLayout(QLayout):
     def setHorizontalSpacing(self, spacing: int):
         """ set horizontal spacing between widgets """
         self._horizontalSpacing = spacing
+        self._rowsCache.clear()
 
     def horizontalSpacing(self):
         """ get horizontal spacing between widgets """
         return self._horizontalSpacing
 
+    def setVirtualized(self, isVirtualized: bool, viewport: QWidget = None):
+        """ set whether to only show and position the widgets intersecting the viewport
+
+        Parameters
+        ----------
+        isVirtualized: bool
+            whether to enable virtualized mode, it has no effect when the moving animation is used
+
+        viewport: QWidget
+            the viewport of scroll area, the parent of layout's widget is used if it's `None`
+        """
+        if self._viewport:
+            self._viewport.removeEventFilter(self)
+
+        parent = self.parentWidget()
+        self._isVirtualized = isVirtualized
+        self._viewport = viewport or (parent.parentWidget() if parent else None)
+
+        if isVirtualized:
+            if parent:
+                parent.installEventFilter(self)
+            if self._viewport:
+                self._viewport.installEventFilter(self)
+
+            self._doLayout(self.geometry(), True)
+        else:
+            self._viewport = None
+            self._visibleRange = (0, 0)
+            self._focusedWidgets.clear()
+
+            for w in self._culledWidgets:
+                self._setWidgetVisible(w, True)
+
+            self._culledWidgets.clear()
+            self._doLayout(self.geometry(), True)
+
+    def isVirtualized(self):
+        return self._isVirtualized
+
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
-        if obj in [w.widget() for w in self._items] and event.type() == QEvent.Type.ParentChange:
+        if event.type() == QEvent.Type.ParentChange and obj in self._widgets:
             self._wParent = obj.parent()
             obj.parent().installEventFilter(self)
             self._isInstalledEventFilter = True
 
         if obj == self._wParent and event.type() == QEvent.Type.Show:
+            if self.isTight:
+                self._rowsCache.clear()
+
             self._doLayout(self.geometry(), True)
             self._isInstalledEventFilter = True
 
+        if self._isVirtualized and event.type() in [QEvent.Type.Move, QEvent.Type.Resize]:
+            if obj is self._viewport or obj is self.parentWidget():
+                self._updateVisibleWidgets()
+
         return super().eventFilter(obj, event)
 
-    def _doLayout(self, rect: QRect, move: bool):
-        """ adjust widgets position according to the window size """
-        aniRestart = False
+    def _invalidateRows(self, index: int):
+        """ discard the cached rows starting from the row which contains the item at `index` """
+        for rows in self._rowsCache.values():
+            rows.truncate(index)
+
+    def _itemHint(self, item: QLayoutItem):
+        """ get the size hint used to place item, `None` for skipped item """
+        return None if self._isItemSkipped(item) else self._itemSizeHint(item)
+
+    def _updateItemHints(self):
+        """ discard the cached rows starting from the first item whose size hint is changed """
+        if not self._isItemHintsDirty:
+            return
+
+        hints = [self._itemHint(item) for item in self._items]
+        for i, (old, new) in enumerate(zip(self._itemHints, hints)):
+            if old != new:
+                self._invalidateRows(i)
+                break
+
+        self._itemHints = hints
+        self._isItemHintsDirty = False
+
+    def _rows(self, width: int) -> FlowLayoutRows:
+        """ get the row breakdown of width, only the rows after the last cached one are computed """
+        self._updateItemHints()
+
+        rows = self._rowsCache.get(width)
+        if rows is None:
+            rows = FlowLayoutRows()
+            self._rowsCache[width] = rows
+            if len(self._rowsCache) > self._maxCacheSize:
+                self._rowsCache.popitem(last=False)
+        else:
+            self._rowsCache.move_to_end(width)
+
+        if rows.count() < len(self._items):
+            self._layoutRows(rows, width)
+
+        return rows
+
+    def _itemSizeHint(self, item: QLayoutItem) -> QSize:
+        # the size hint of hidden widget is empty, so the culled widgets use the one before hiding
+        culled = self._culledWidgets.get(item.widget())
+        return item.sizeHint() if culled is None else culled[0]
+
+    def _isItemSkipped(self, item: QLayoutItem):
+        w = item.widget()
+        return self.isTight and w is not None and not w.isVisible() and w not in self._culledWidgets
+
+    def _layoutRows(self, rows: FlowLayoutRows, width: int):
+        """ place the items which are not in rows yet """
         margin = self.contentsMargins()
-        x = rect.x() + margin.left()
-        y = rect.y() + margin.top()
-        rowHeight = 0
         spaceX = self.horizontalSpacing()
         spaceY = self.verticalSpacing()
+        left = margin.left()
+        right = width - 1 - margin.right()
 
-        for i, item in enumerate(self._items):
-            if item.widget() and not item.widget().isVisible() and self.isTight:
+        bottom = rows.bottom()
+        y = margin.top() if bottom is None else bottom + spaceY
+        x = left
+        rowHeight = 0
+        isNewRow = True
+
+        for i in range(rows.count(), len(self._items)):
+            item = self._items[i]
+            if self._isItemSkipped(item):
+                rows.addItem(None)
                 continue
 
-            nextX = x + item.sizeHint().width() + spaceX
+            size = self._itemSizeHint(item)
+            nextX = x + size.width() + spaceX
 
-            if nextX - spaceX > rect.right() - margin.right() and rowHeight > 0:
-                x = rect.x() + margin.left()
+            if nextX - spaceX > right and rowHeight > 0:
+                x = left
                 y = y + rowHeight + spaceY
-                nextX = x + item.sizeHint().width() + spaceX
+                nextX = x + size.width() + spaceX
                 rowHeight = 0
+                isNewRow = True
 
-            if move:
-                target = QRect(QPoint(x, y), item.sizeHint())
-                if not self.needAni:
-                    item.setGeometry(target)
-                elif target != self._anis[i].endValue():
-                    self._anis[i].stop()
-                    self._anis[i].setEndValue(target)
-                    aniRestart = True
+            if isNewRow:
+                rows.addRow(i, y)
+                isNewRow = False
 
+            rows.addItem(QRect(QPoint(x, y), size))
             x = nextX
-            rowHeight = max(rowHeight, item.sizeHint().height())
+            rowHeight = max(rowHeight, size.height())
+
+    def _doLayout(self, rect: QRect, move: bool):
+        """ adjust widgets position according to the window size """
+        rows = self._rows(rect.width())
+
+        if move:
+            self._moveWidgets(rows, rect.topLeft())
+
+        bottom = rows.bottom()
+        bottom = self.contentsMargins().top() if bottom is None else bottom
+        return bottom + self.contentsMargins().bottom()
+
+    def _moveWidgets(self, rows: FlowLayoutRows, offset: QPoint):
+        if self._isVirtualized and not self.needAni:
+            return self._updateVisibleWidgets(rows, True)
+
+        aniRestart = False
+
+        for i, item in enumerate(self._items):
+            geometry = rows.geometries[i]
+            if geometry is None:
+                continue
+
+            target = geometry.translated(offset)
+            if not self.needAni:
+                item.setGeometry(target)
+            elif i < len(self._anis) and target != self._anis[i].endValue():
+                self._anis[i].stop()
+                self._anis[i].setEndValue(target)
+                aniRestart = True
 
         if self.needAni and aniRestart:
             self._aniGroup.stop()
             self._aniGroup.start()
 
-        return y + rowHeight + margin.bottom() - rect.y()
+    def _visibleRect(self):
+        """ get the visible rect of layout in the coordinates of layout's widget """
+        parent = self.parentWidget()
+        if not self._viewport or not parent:
+            return parent.rect() if parent else QRect()
+
+        pos = parent.mapFromGlobal(self._viewport.mapToGlobal(QPoint(0, 0)))
+        return QRect(pos, self._viewport.size())
+
+    def _updateVisibleWidgets(self, rows: FlowLayoutRows = None, reposition=False):
+        """ show and position the widgets intersecting the viewport, hide the others """
+        if not self._isVirtualized or self.needAni:
+            return
+
+        # showing or hiding widgets may move the viewport, which is handled after current pass
+        if self._isUpdatingVisible:
+            self._isVisibleUpdatePending = True
+            return
+
+        self._isUpdatingVisible = True
+        self._cullWidgets(rows, reposition)
+
+        while self._isVisibleUpdatePending:
+            self._isVisibleUpdatePending = False
+            self._cullWidgets(None, True)
+
+        self._isUpdatingVisible = False
+
+    def _isFocusWidget(self, w: QWidget):
+        """ whether the widget has focus or contains the focus widget """
+        focus = QApplication.focusWidget()
+        return focus is not None and (focus is w or w.isAncestorOf(focus))
+
+    def _cullWidgets(self, rows: FlowLayoutRows = None, reposition=False):
+        geometry = self.geometry()
+        rows = rows or self._rows(geometry.width())
+        rect = self._visibleRect().translated(-geometry.topLeft())
+        start, end = rows.itemRange(rect.top(), rect.bottom())
+        oldStart, oldEnd = self._visibleRange
+
+        if reposition:
+            # widgets may be added or moved out of the viewport
+            hidden = [i for i in range(len(self._items)) if not start <= i < end]
+        else:
+            hidden = [i for i in range(oldStart, min(oldEnd, len(self._items))) if not start <= i < end]
+            hidden += [i for i in map(self.indexOf, self._focusedWidgets) if not oldStart <= i < oldEnd]
+
+        focusedWidgets = set()
+
+        for i in hidden:
+            item = self._items[i]
+            w = item.widget()
+            if not w or rows.geometries[i] is None or w in self._culledWidgets or w.isHidden():
+                continue
+
+            # Qt moves the focus to next widget when the focus widget is hidden,
+            # and scroll area will scroll it into view, so the focus widget is kept
+            if self._isFocusWidget(w):
+                focusedWidgets.add(w)
+                item.setGeometry(rows.geometries[i].translated(geometry.topLeft()))
+                continue
+
+            self._culledWidgets[w] = (item.sizeHint(), item.minimumSize())
+            self._setWidgetVisible(w, False)
+
+        self._focusedWidgets = focusedWidgets
+
+        for i in range(start, end):
+            target = rows.geometries[i]
+            if target is None or (not reposition and oldStart <= i < oldEnd):
+                continue
+
+            # the geometry of hidden widget can't be set by layout item
+            item = self._items[i]
+            w = item.widget()
+            if w in self._culledWidgets:
+                self._culledWidgets.pop(w)
+                self._setWidgetVisible(w, True)
+
+            item.setGeometry(target.translated(geometry.topLeft()))
+
+        self._visibleRange = (start, end)
+
+    def _setWidgetVisible(self, w: QWidget, isVisible: bool):
+        self._isCulling = True
+        w.setVisible(isVisible)
+        self._isCulling = False
 
 
 class AdaptiveFlowLayout(FlowLayout):
@@ -253,24 +593,25 @@ class AdaptiveFlowLayout(FlowLayout):
 
     def setWidgetMinimumWidth(self, width: int):
         self._widgetMinimumWidth = width
+        self._rowsCache.clear()
 
     def widgetMinimumWidth(self):
         return self._widgetMinimumWidth
 
     def setWidgetMaximumWidth(self, width):
         self._widgetMaximumWidth = width
+        self._rowsCache.clear()
 
     def widgetMaximumWidth(self):
         return self._widgetMaximumWidth
 
-    def _doLayout(self, rect: QRect, move: bool):
-        aniRestart = False
+    def _layoutRows(self, rows: FlowLayoutRows, width: int):
         margin = self.contentsMargins()
         spaceX = self.horizontalSpacing()
         spaceY = self.verticalSpacing()
 
         # Calculate available width
-        availableWidth = rect.width() - margin.left() - margin.right()
+        availableWidth = width - margin.left() - margin.right()
 
         # Calculate the number of cards that fit per row
         if self._widgetMinimumWidth + spaceX > 0:
@@ -288,14 +629,17 @@ class AdaptiveFlowLayout(FlowLayout):
         if self._widgetMaximumWidth is not None and cardWidth > self._widgetMaximumWidth:
             cardWidth = self._widgetMaximumWidth
 
-        # Perform layout
-        x = rect.x() + margin.left()
-        y = rect.y() + margin.top()
+        # Perform layout, starting from a new row
+        bottom = rows.bottom()
+        x = margin.left()
+        y = margin.top() if bottom is None else bottom + spaceY
         rowHeight = 0
         colIndex = 0
 
-        for i, item in enumerate(self._items):
-            if item.widget() and not item.widget().isVisible() and self.isTight:
+        for i in range(rows.count(), len(self._items)):
+            item = self._items[i]
+            if self._isItemSkipped(item):
+                rows.addItem(None)
                 continue
 
             # Calculate next position
@@ -303,30 +647,19 @@ class AdaptiveFlowLayout(FlowLayout):
 
             # Need to wrap to new line
             if colIndex >= cardsPerRow and cardsPerRow > 0:
-                x = rect.x() + margin.left()
+                x = margin.left()
                 y = y + rowHeight + spaceY
                 nextX = x + cardWidth + spaceX
                 rowHeight = 0
                 colIndex = 0
 
-            if move:
-                # Set widget size to calculated card width, maintaining original height
-                targetSize = QSize(cardWidth, item.sizeHint().height())
-                target = QRect(QPoint(x, y), targetSize)
+            if colIndex == 0:
+                rows.addRow(i, y)
 
-                if not self.needAni:
-                    item.setGeometry(target)
-                elif i < len(self._anis) and target != self._anis[i].endValue():
-                    self._anis[i].stop()
-                    self._anis[i].setEndValue(target)
-                    aniRestart = True
+            # Set widget size to calculated card width, maintaining original height
+            height = self._itemSizeHint(item).height()
+            rows.addItem(QRect(x, y, cardWidth, height))
 
             x = nextX
-            rowHeight = max(rowHeight, item.sizeHint().height())
+            rowHeight = max(rowHeight, height)
             colIndex += 1
-
-        if self.needAni and aniRestart:
-            self._aniGroup.stop()
-            self._aniGroup.start()
-
-        return y + rowHeight + margin.bottom() - rect.y()
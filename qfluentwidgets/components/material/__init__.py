@@ -1,6 +1,14 @@
-from .acrylic_menu import AcrylicMenu, AcrylicLineEditMenu, AcrylicCheckableMenu, AcrylicCheckableSystemTrayMenu, AcrylicSystemTrayMenu
-from .acrylic_line_edit import AcrylicLineEditBase, AcrylicLineEdit, AcrylicSearchLineEdit
-from .acrylic_combo_box import AcrylicComboBox, AcrylicComboBoxSettingCard, AcrylicEditableComboBox
-from .acrylic_widget import AcrylicWidget, AcrylicBrush
-from .acrylic_flyout import AcrylicFlyoutView, AcrylicFlyoutViewBase, AcrylicFlyout
-from .acrylic_tool_tip import AcrylicToolTip, AcrylicToolTipFilter
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .acrylic_menu import AcrylicMenu, AcrylicLineEditMenu, AcrylicCheckableMenu, AcrylicCheckableSystemTrayMenu, AcrylicSystemTrayMenu
+    from .acrylic_line_edit import AcrylicLineEditBase, AcrylicLineEdit, AcrylicSearchLineEdit
+    from .acrylic_combo_box import AcrylicComboBox, AcrylicComboBoxSettingCard, AcrylicEditableComboBox
+    from .acrylic_widget import AcrylicWidget, AcrylicBrush
+    from .acrylic_flyout import AcrylicFlyoutView, AcrylicFlyoutViewBase, AcrylicFlyout
+    from .acrylic_tool_tip import AcrylicToolTip, AcrylicToolTipFilter
+
+__getattr__, __dir__ = lazyImport(__name__)
@@ -1,10 +1,19 @@
-from .navigation_widget import (NavigationWidget, NavigationPushButton, NavigationSeparator, NavigationToolButton,
-                                NavigationTreeWidget, NavigationTreeWidgetBase, NavigationAvatarWidget, NavigationItemHeader,
-                                NavigationUserCard)
-from .navigation_panel import NavigationPanel, NavigationItemPosition, NavigationDisplayMode
-from .navigation_interface import NavigationInterface
-from .navigation_bar import NavigationBarPushButton, NavigationBar
-from .pivot import Pivot, PivotItem
-from .segmented_widget import (SegmentedItem, SegmentedWidget, SegmentedToolItem, SegmentedToolWidget,
-                               SegmentedToggleToolItem, SegmentedToggleToolWidget)
-from .breadcrumb import BreadcrumbBar, BreadcrumbItem
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .navigation_widget import (NavigationWidget, NavigationPushButton, NavigationSeparator, NavigationToolButton,
+                                    NavigationTreeWidget, NavigationTreeWidgetBase, NavigationAvatarWidget, NavigationItemHeader,
+                                    NavigationUserCard)
+    from .navigation_panel import NavigationPanel, NavigationItemPosition, NavigationDisplayMode
+    from .navigation_tree_view import NavigationTreeView, NavigationTreeNode, NavigationTreeModel, NavigationTreeItemDelegate
+    from .navigation_interface import NavigationInterface
+    from .navigation_bar import NavigationBarPushButton, NavigationBar
+    from .pivot import Pivot, PivotItem
+    from .segmented_widget import (SegmentedItem, SegmentedWidget, SegmentedToolItem, SegmentedToolWidget,
+                                   SegmentedToggleToolItem, SegmentedToggleToolWidget)
+    from .breadcrumb import BreadcrumbBar, BreadcrumbItem
+
+__getattr__, __dir__ = lazyImport(__name__)
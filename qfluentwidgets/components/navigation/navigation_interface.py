@@ -364,6 +364,13 @@ class NavigationInterface(QWidget):
         """ set whether to update indicator position when collapese finished """
         self.panel.setUpdateIndicatorPosOnCollapseFinished(update)
 
+    def isVirtualized(self):
+        return self.panel.isVirtualized()
+
+    def setVirtualized(self, isVirtualized: bool):
+        """ set whether to render the tree items in scroll area with `NavigationTreeView` """
+        self.panel.setVirtualized(isVirtualized)
+
     def widget(self, routeKey: str):
         return self.panel.widget(routeKey)
 
@@ -8,6 +8,7 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QFrame, QApplication, QHBoxLay
 
 from .navigation_widget import (NavigationTreeWidgetBase, NavigationToolButton, NavigationWidget, NavigationSeparator,
                                 NavigationTreeWidget, NavigationFlyoutMenu, NavigationItemHeader, NavigationIndicator)
+from .navigation_tree_view import NavigationTreeView, NavigationTreeNode
 from ..widgets.acrylic_label import AcrylicBrush
 from ..widgets.scroll_area import ScrollArea
 from ..widgets.tool_tip import ToolTipFilter
@@ -89,6 +90,7 @@ class NavigationPanel(QFrame):
         self.scrollLayout = NavigationItemLayout(self.scrollWidget)
 
         self.items = {}   # type: Dict[str, NavigationItem]
+        self.treeView = None    # type: NavigationTreeView
         self.history = qrouter
         self._currentRouteKey = None
 
@@ -185,6 +187,39 @@ class NavigationPanel(QFrame):
     def setUpdateIndicatorPosOnCollapseFinished(self, update: bool):
         self._isUpdateIndicatorPosOnCollapseFinished = update
 
+    def isVirtualized(self):
+        return self.treeView is not None
+
+    def setVirtualized(self, isVirtualized: bool):
+        """ set whether to render the tree items in scroll area with `NavigationTreeView`
+
+        In virtualized mode, the items added to scroll area by `addItem()` and their children are
+        `NavigationTreeNode` painted by delegate instead of `NavigationTreeWidget`, which makes
+        the panel with thousands of tree items fast to build and expand. The tree view is placed
+        after the widgets already in scroll area, so it should be enabled before adding items.
+
+        Parameters
+        ----------
+        isVirtualized: bool
+            whether to enable virtualized mode, the nodes already added are kept if it's disabled
+        """
+        if isVirtualized == self.isVirtualized():
+            return
+
+        if not isVirtualized:
+            if self.treeView.model().roots:
+                return
+
+            self.scrollLayout.removeWidget(self.treeView)
+            self.treeView.deleteLater()
+            self.treeView = None
+            return
+
+        self.treeView = NavigationTreeView(self.scrollWidget)
+        self.treeView.setCompacted(self.displayMode not in [NavigationDisplayMode.EXPAND, NavigationDisplayMode.MENU])
+        self.scrollLayout.addWidget(self.treeView, 0, Qt.AlignTop)
+        self.treeView.adjustHeight()
+
     def widget(self, routeKey: str):
         if routeKey not in self.items:
             raise RouteKeyError(f"`{routeKey}` is illegal.")
@@ -285,7 +320,11 @@ class NavigationPanel(QFrame):
         if routeKey in self.items:
             return
 
-        w = NavigationTreeWidget(icon, text, selectable, self)
+        if self._isTreeNodePosition(position, parentRouteKey):
+            w = NavigationTreeNode(icon, text, selectable, self.treeView)
+        else:
+            w = NavigationTreeWidget(icon, text, selectable, self)
+
         self.insertWidget(index, routeKey, w, onClick, position, tooltip, parentRouteKey)
         return w
 
@@ -325,6 +364,16 @@ class NavigationPanel(QFrame):
         else:
             self._insertWidgetToLayout(index, widget, position)
 
+    def _isTreeNodePosition(self, position: NavigationItemPosition, parentRouteKey: str):
+        """ whether the item at position should be a node of tree view """
+        if not self.isVirtualized():
+            return False
+
+        if parentRouteKey:
+            return isinstance(self.widget(parentRouteKey), NavigationTreeNode)
+
+        return position == NavigationItemPosition.SCROLL
+
     def addSeparator(self, position=NavigationItemPosition.TOP):
         """ add separator
 
@@ -411,10 +460,16 @@ class NavigationPanel(QFrame):
 
         if tooltip:
             widget.setToolTip(tooltip)
-            widget.installEventFilter(NavigationToolTipFilter(widget, 1000))
+
+            # the tool tip of tree node is shown by the delegate of tree view
+            if isinstance(widget, QWidget):
+                widget.installEventFilter(NavigationToolTipFilter(widget, 1000))
 
     def _insertWidgetToLayout(self, index: int, widget: NavigationWidget, position: NavigationItemPosition):
         """ insert widget to layout """
+        if isinstance(widget, NavigationTreeNode):
+            return self.treeView.insertRoot(index, widget)
+
         if position == NavigationItemPosition.TOP:
             widget.setParent(self)
             self.topLayout.insertWidget(index, widget, 0, Qt.AlignTop)
@@ -443,11 +498,14 @@ class NavigationPanel(QFrame):
 
         item = self.items.pop(routeKey)
 
-        if item.parentRouteKey is not None:
+        if isinstance(item.widget, NavigationTreeNode):
+            self.treeView.removeNode(item.widget)
+        elif item.parentRouteKey is not None:
             self.widget(item.parentRouteKey).removeChild(item.widget)
 
-        if isinstance(item.widget, NavigationTreeWidgetBase):
-            for child in item.widget.findChildren(NavigationWidget, options=Qt.FindChildrenRecursively):
+        if isinstance(item.widget, (NavigationTreeWidgetBase, NavigationTreeNode)):
+            childType = NavigationTreeNode if isinstance(item.widget, NavigationTreeNode) else NavigationWidget
+            for child in item.widget.findChildren(childType, options=Qt.FindChildrenRecursively):
                 key = child.property('routeKey')
                 if key is None:
                     continue
@@ -551,7 +609,7 @@ class NavigationPanel(QFrame):
 
         for item in self.items.values():
             w = item.widget
-            if isinstance(w, NavigationTreeWidgetBase) and w.isRoot():
+            if isinstance(w, (NavigationTreeWidgetBase, NavigationTreeNode)) and w.isRoot():
                 w.saveExpandState()
                 w.setExpanded(False)
 
@@ -571,7 +629,7 @@ class NavigationPanel(QFrame):
     def _restoreTreeExpandState(self, useAni=True):
         for item in self.items.values():
             w = item.widget
-            if isinstance(w, NavigationTreeWidgetBase) and w.isRoot():
+            if isinstance(w, (NavigationTreeWidgetBase, NavigationTreeNode)) and w.isRoot():
                 w.restoreExpandState(useAni)
 
     def toggle(self):
@@ -602,9 +660,15 @@ class NavigationPanel(QFrame):
 
         # early return if indicator is not enabled or previous selected item is None
         if not (self.isIndicatorAnimationEnabled() and prevItem and prevIndicatorItem and newIndicatorItem):
-            for k, item in self.items.items():
-                item.widget.setSelected(k == routeKey)
+            if prevItem:
+                prevItem.setSelected(False)
+                self._updateTreeParents(prevItem)
+
+            if prevIndicatorItem:
+                prevIndicatorItem.setAboutSelected(False)
 
+            newItem.setSelected(True)
+            self._updateTreeParents(newItem)
             return
 
         # calculate the start and final geometry for animation
@@ -622,14 +686,28 @@ class NavigationPanel(QFrame):
         return self.widget(self._currentRouteKey) if self._currentRouteKey else None
 
     def _findIndicatorItem(self, item: NavigationWidget):
-        parent = item
+        """ find the item itself or its top collapsed tree parent, which shows the indicator """
+        if not item:
+            return None
+
+        indicatorItem = item
+        parent = item.treeParent
         while parent:
-            if isinstance(parent, NavigationWidget) and parent.isVisible():
-                break
+            if not getattr(parent, 'isExpanded', True):
+                indicatorItem = parent
 
-            parent = parent.parent()
+            parent = parent.treeParent
 
-        return parent
+        return indicatorItem if indicatorItem.isVisible() else None
+
+    def _updateTreeParents(self, item: NavigationWidget):
+        """ repaint the tree parents whose indicator depends on the selected child """
+        parent = item.treeParent
+        while parent:
+            if isinstance(parent, NavigationTreeWidget):
+                parent.itemWidget.update()
+
+            parent = parent.treeParent
 
     def _getIndicatorRect(self, item: NavigationWidget):
         if not item:
@@ -659,7 +737,7 @@ class NavigationPanel(QFrame):
 
         self.setCurrentItem(widget.property('routeKey'))
 
-        isLeaf = not isinstance(widget, NavigationTreeWidgetBase) or widget.isLeaf()
+        isLeaf = not isinstance(widget, (NavigationTreeWidgetBase, NavigationTreeNode)) or widget.isLeaf()
         if self.displayMode == NavigationDisplayMode.MENU and isLeaf:
             self.collapse()
         elif self.isCollapsed():
@@ -667,7 +745,7 @@ class NavigationPanel(QFrame):
 
     def _showFlyoutNavigationMenu(self, widget: NavigationTreeWidget):
         """ show flyout navigation menu """
-        if not (self.isCollapsed() and isinstance(widget, NavigationTreeWidget)):
+        if not (self.isCollapsed() and isinstance(widget, (NavigationTreeWidget, NavigationTreeNode))):
             return
 
         if not widget.isRoot() or widget.isLeaf():
@@ -761,14 +839,24 @@ class NavigationPanel(QFrame):
         for item in self.findChildren(NavigationWidget):
             item.setCompacted(isCompacted)
 
+        if self.treeView:
+            self.treeView.setCompacted(isCompacted)
+
     def layoutMinHeight(self):
         th = self.topLayout.minimumSize().height()
         bh = self.bottomLayout.minimumSize().height()
-        sh = sum(w.height() for w in self.findChildren(NavigationSeparator))
+        sh = sum(w.height() for w in self._layoutWidgets() if isinstance(w, NavigationSeparator))
         spacing = self.topLayout.count() * self.topLayout.spacing()
         spacing += self.bottomLayout.count() * self.bottomLayout.spacing()
         return 36 + th + bh + sh + spacing
 
+    def _layoutWidgets(self):
+        for layout in [self.topLayout, self.scrollLayout, self.bottomLayout]:
+            for i in range(layout.count()):
+                w = layout.itemAt(i).widget()
+                if w:
+                    yield w
+
     def _canDrawAcrylic(self):
         return self.acrylicBrush.isAvailable() and self.isAcrylicEnabled()
 
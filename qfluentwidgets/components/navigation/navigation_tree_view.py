@@ -0,0 +1,678 @@
+# coding:utf-8
+from typing import Dict, List, Union
+
+from PyQt5.QtCore import (Qt, pyqtSignal, pyqtProperty, QObject, QAbstractListModel, QModelIndex, QRect, QRectF,
+                          QPoint, QSize, QPropertyAnimation, QVariantAnimation, QEasingCurve)
+from PyQt5.QtGui import QColor, QPainter, QIcon, QHelpEvent
+from PyQt5.QtWidgets import (QListView, QStyledItemDelegate, QStyleOptionViewItem, QAbstractItemView, QWidget,
+                             QFrame)
+
+from .navigation_widget import NavigationWidget, NavigationTreeWidget
+from ..widgets.tool_tip import ItemViewToolTipDelegate, ItemViewToolTipType
+from ...common.config import isDarkTheme
+from ...common.icon import drawIcon, toQIcon
+from ...common.icon import FluentIcon as FIF
+from ...common.color import autoFallbackThemeColor
+from ...common.font import setFont
+
+
+class NavigationTreeNode(QObject):
+    """ Navigation tree node rendered by `NavigationTreeView`
+
+    It has the same interface as `NavigationTreeWidget`, but no widget is created for it.
+    """
+
+    clicked = pyqtSignal(bool)  # whether triggered by the user
+    selectedChanged = pyqtSignal(bool)
+    expanded = pyqtSignal()
+
+    def __init__(self, icon: Union[str, QIcon, FIF], text: str, isSelectable: bool, view: 'NavigationTreeView'):
+        super().__init__(view)
+        self.view = view
+        self.treeParent = None    # type: NavigationTreeNode
+        self.treeChildren = []    # type: List[NavigationTreeNode]
+        self.nodeDepth = 0
+
+        self.isSelected = False
+        self.isAboutSelected = False
+        self.isSelectable = isSelectable
+        self.isExpanded = False
+
+        self._icon = icon
+        self._text = text
+        self._toolTip = ""
+        self._arrowAngle = 0
+        self._rotateAni = None  # type: QPropertyAnimation
+        self._rememberExpandState = False
+        self._wasExpanded = False
+
+        self.lightTextColor = QColor(0, 0, 0)
+        self.darkTextColor = QColor(255, 255, 255)
+        self.lightIndicatorColor = QColor()
+        self.darkIndicatorColor = QColor()
+
+    @property
+    def isCompacted(self):
+        return self.view.isCompacted
+
+    def text(self):
+        return self._text
+
+    def setText(self, text: str):
+        self._text = text
+        self.view.updateNode(self)
+
+    def icon(self):
+        return toQIcon(self._icon)
+
+    def setIcon(self, icon: Union[str, QIcon, FIF]):
+        self._icon = icon
+        self.view.updateNode(self)
+
+    def toolTip(self):
+        return self._toolTip
+
+    def setToolTip(self, text: str):
+        self._toolTip = text
+
+    def textColor(self):
+        return self.darkTextColor if isDarkTheme() else self.lightTextColor
+
+    def setLightTextColor(self, color):
+        """ set the text color in light theme mode """
+        self.lightTextColor = QColor(color)
+        self.view.updateNode(self)
+
+    def setDarkTextColor(self, color):
+        """ set the text color in dark theme mode """
+        self.darkTextColor = QColor(color)
+        self.view.updateNode(self)
+
+    def setTextColor(self, light, dark):
+        """ set the text color in light/dark theme mode """
+        self.setLightTextColor(light)
+        self.setDarkTextColor(dark)
+
+    def setIndicatorColor(self, light, dark):
+        """ set the indicator color in light/dark theme mode """
+        self.lightIndicatorColor = QColor(light)
+        self.darkIndicatorColor = QColor(dark)
+        self.view.updateNode(self)
+
+    def click(self):
+        self.clicked.emit(True)
+
+    def setCompacted(self, isCompacted: bool):
+        """ set whether the tree view is compacted """
+        self.view.setCompacted(isCompacted)
+
+    def setSelected(self, isSelected: bool):
+        """ set whether the node is selected """
+        if not self.isSelectable:
+            return
+
+        self.isSelected = isSelected
+        self.isAboutSelected = False
+        self.view.setNodeSelected(self, isSelected)
+        self.selectedChanged.emit(isSelected)
+
+    def setAboutSelected(self, selected: bool):
+        self.isAboutSelected = selected
+        self.view.updateNode(self)
+
+    def addChild(self, child: 'NavigationTreeNode'):
+        self.insertChild(-1, child)
+
+    def insertChild(self, index: int, child: 'NavigationTreeNode'):
+        """ insert child node """
+        if not isinstance(child, NavigationTreeNode):
+            raise TypeError("The child of `NavigationTreeNode` should be `NavigationTreeNode`.")
+
+        if child.treeParent is self:
+            return
+
+        child.setParent(self)
+        child.treeParent = self
+        child.nodeDepth = self.nodeDepth + 1
+
+        if index < 0:
+            index = len(self.treeChildren)
+
+        self.treeChildren.insert(index, child)
+        self.view.model().insertNode(child)
+        self.view.updateNode(self)
+
+    def removeChild(self, child: 'NavigationTreeNode'):
+        self.view.model().removeNode(child)
+        self.treeChildren.remove(child)
+        self.view.updateNode(self)
+
+    def childItems(self) -> list:
+        return self.treeChildren
+
+    def isRoot(self):
+        return self.treeParent is None
+
+    def isLeaf(self):
+        return len(self.treeChildren) == 0
+
+    def isVisible(self):
+        """ whether the row of node is shown in tree view """
+        return self.view.isVisible() and self.view.model().isNodeShown(self)
+
+    def setExpanded(self, isExpanded: bool, ani=False):
+        """ set the expanded status """
+        if isExpanded == self.isExpanded:
+            return
+
+        self.isExpanded = isExpanded
+
+        if not self._rotateAni:
+            self._rotateAni = QPropertyAnimation(self, b'arrowAngle', self)
+            self._rotateAni.setDuration(150)
+
+        self._rotateAni.stop()
+        self._rotateAni.setEndValue(180 if isExpanded else 0)
+        self._rotateAni.start()
+
+        self.view.setNodeExpanded(self, isExpanded, ani)
+        self.expanded.emit()
+
+    def setRememberExpandState(self, remember: bool):
+        self._rememberExpandState = remember
+
+    def saveExpandState(self):
+        self._wasExpanded = self.isExpanded if self._rememberExpandState else False
+
+    def restoreExpandState(self, ani=True):
+        if self._wasExpanded:
+            self.setExpanded(True, ani)
+
+    def onClicked(self, triggerByUser: bool, clickArrow: bool):
+        if not self.isCompacted:
+            if self.isSelectable and not self.isSelected and not clickArrow:
+                self.setExpanded(True, ani=True)
+            else:
+                self.setExpanded(not self.isExpanded, ani=True)
+
+        if not clickArrow or self.isCompacted:
+            self.clicked.emit(triggerByUser)
+
+    def clone(self, parent: QWidget = None) -> NavigationTreeWidget:
+        """ create a `NavigationTreeWidget` with the same subtree, which is used by flyout menu """
+        root = NavigationTreeWidget(self._icon, self.text(), self.isSelectable, parent or self.view.parentWidget())
+        root.setSelected(self.isSelected)
+        root.setFixedSize(self.size())
+        root.setTextColor(self.lightTextColor, self.darkTextColor)
+        root.setIndicatorColor(self.lightIndicatorColor, self.darkIndicatorColor)
+        root.nodeDepth = self.nodeDepth
+
+        root.clicked.connect(self.clicked)
+        self.selectedChanged.connect(root.setSelected)
+
+        for child in self.treeChildren:
+            root.addChild(child.clone(root))
+
+        return root
+
+    def suitableWidth(self):
+        left = 57 + self.nodeDepth * 28 if not self.icon().isNull() else self.nodeDepth * 28 + 29
+        tw = self.view.fontMetrics().boundingRect(self.text()).width()
+        return left + tw + 20 * bool(self.treeChildren)
+
+    def indicatorRect(self):
+        """ get the indicator geometry """
+        return QRectF(self.nodeDepth * 28, 10, 3, 16)
+
+    def geometry(self):
+        """ get the geometry of node row in tree view """
+        return self.view.nodeRect(self)
+
+    def size(self):
+        return self.geometry().size()
+
+    def width(self):
+        return self.geometry().width()
+
+    def height(self):
+        return self.geometry().height()
+
+    def mapTo(self, widget: QWidget, pos: QPoint):
+        return self.view.mapTo(widget, self.geometry().topLeft() + pos)
+
+    def mapToGlobal(self, pos: QPoint):
+        return self.view.mapToGlobal(self.geometry().topLeft() + pos)
+
+    def getArrowAngle(self):
+        return self._arrowAngle
+
+    def setArrowAngle(self, angle):
+        self._arrowAngle = angle
+        self.view.updateNode(self)
+
+    arrowAngle = pyqtProperty(float, getArrowAngle, setArrowAngle)
+
+
+class NavigationTreeModel(QAbstractListModel):
+    """ Navigation tree model, each row is a node whose ancestors are all expanded """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.roots = []     # type: List[NavigationTreeNode]
+        self.nodes = []     # type: List[NavigationTreeNode]
+        self._rows = {}     # type: Dict[NavigationTreeNode, int]
+        self._isRowsDirty = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.nodes)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.nodes):
+            return None
+
+        node = self.nodes[index.row()]
+        if role == Qt.DisplayRole:
+            return node.text()
+        if role == Qt.DecorationRole:
+            return node.icon()
+        if role == Qt.ToolTipRole:
+            return node.toolTip()
+
+        return None
+
+    def node(self, index: QModelIndex) -> NavigationTreeNode:
+        return self.nodes[index.row()]
+
+    def row(self, node: NavigationTreeNode) -> int:
+        """ get the row of node, `-1` is returned if the node is not shown """
+        if self._isRowsDirty:
+            self._rows = {n: i for i, n in enumerate(self.nodes)}
+            self._isRowsDirty = False
+
+        return self._rows.get(node, -1)
+
+    def isNodeShown(self, node: NavigationTreeNode):
+        return self.row(node) >= 0
+
+    def insertRoot(self, index: int, node: NavigationTreeNode):
+        if index < 0 or index > len(self.roots):
+            index = len(self.roots)
+
+        self.roots.insert(index, node)
+        self.insertNode(node)
+
+    def removeRoot(self, node: NavigationTreeNode):
+        self.removeNode(node)
+        self.roots.remove(node)
+
+    def insertNode(self, node: NavigationTreeNode):
+        """ insert the rows of node which is already added to its parent """
+        parent = node.treeParent
+        if parent and not (parent.isExpanded and self.row(parent) >= 0):
+            return
+
+        siblings = parent.treeChildren if parent else self.roots
+        index = siblings.index(node)
+
+        if index > 0:
+            row = self._subtreeEnd(siblings[index - 1])
+        else:
+            row = self.row(parent) + 1 if parent else 0
+
+        self._insertRows(row, [node] + self._shownDescendants(node))
+
+    def removeNode(self, node: NavigationTreeNode):
+        """ remove the rows of node and its descendants """
+        row = self.row(node)
+        if row < 0:
+            return
+
+        self._removeRows(row, self._subtreeEnd(node) - row)
+
+    def expandNode(self, node: NavigationTreeNode):
+        row = self.row(node)
+        if row >= 0 and self._subtreeEnd(node) == row + 1:
+            self._insertRows(row + 1, self._shownDescendants(node))
+
+    def collapseNode(self, node: NavigationTreeNode):
+        row = self.row(node)
+        if row >= 0:
+            self._removeRows(row + 1, self._subtreeEnd(node) - row - 1)
+
+    def _subtreeEnd(self, node: NavigationTreeNode) -> int:
+        """ get the row after the shown descendants of node """
+        row = self.row(node) + 1
+        while row < len(self.nodes) and self.nodes[row].nodeDepth > node.nodeDepth:
+            row += 1
+
+        return row
+
+    def _shownDescendants(self, node: NavigationTreeNode) -> List[NavigationTreeNode]:
+        nodes = []
+        if not node.isExpanded:
+            return nodes
+
+        stack = list(reversed(node.treeChildren))
+        while stack:
+            child = stack.pop()
+            nodes.append(child)
+
+            if child.isExpanded:
+                stack.extend(reversed(child.treeChildren))
+
+        return nodes
+
+    def _insertRows(self, row: int, nodes: List[NavigationTreeNode]):
+        if not nodes:
+            return
+
+        self.beginInsertRows(QModelIndex(), row, row + len(nodes) - 1)
+
+        # appending rows doesn't change the rows of other nodes
+        if row == len(self.nodes) and not self._isRowsDirty:
+            self._rows.update((n, row + i) for i, n in enumerate(nodes))
+        else:
+            self._isRowsDirty = True
+
+        self.nodes[row:row] = nodes
+        self.endInsertRows()
+
+    def _removeRows(self, row: int, count: int):
+        if count <= 0:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self.nodes[row:row + count]
+        self._isRowsDirty = True
+        self.endRemoveRows()
+
+
+class NavigationTreeItemDelegate(QStyledItemDelegate):
+    """ Navigation tree item delegate """
+
+    def __init__(self, parent: 'NavigationTreeView'):
+        super().__init__(parent)
+        self.hoverRow = -1
+        self.pressedRow = -1
+        self.tooltipDelegate = ItemViewToolTipDelegate(parent, 1000, ItemViewToolTipType.LIST)
+
+    def setHoverRow(self, row: int):
+        self.hoverRow = row
+
+    def setPressedRow(self, row: int):
+        self.pressedRow = row
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), NavigationTreeView.ROW_HEIGHT)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        view = self.parent()  # type: NavigationTreeView
+        node = view.model().node(index)
+        rect = QRect(option.rect.topLeft(), QSize(option.rect.width(), NavigationTreeView.ITEM_HEIGHT))
+
+        painter.save()
+        painter.setRenderHints(QPainter.Antialiasing |
+                               QPainter.TextAntialiasing | QPainter.SmoothPixmapTransform)
+        painter.setPen(Qt.NoPen)
+
+        isHover = index.row() == self.hoverRow
+        if index.row() == self.pressedRow:
+            painter.setOpacity(0.7)
+        if not view.isEnabled():
+            painter.setOpacity(0.4)
+
+        # draw background
+        c = 255 if isDarkTheme() else 0
+        pl = node.nodeDepth * 28
+        pr = 20 * bool(node.treeChildren)
+        x, y = rect.x(), rect.y()
+
+        if self._canDrawIndicator(node):
+            painter.setBrush(QColor(c, c, c, 6 if isHover else 10))
+            painter.drawRoundedRect(rect, 5, 5)
+
+            # draw indicator
+            painter.setBrush(autoFallbackThemeColor(node.lightIndicatorColor, node.darkIndicatorColor))
+            painter.drawRoundedRect(node.indicatorRect().translated(x, y), 1.5, 1.5)
+        elif (isHover or node.isAboutSelected) and view.isEnabled():
+            painter.setBrush(QColor(c, c, c, 6 if node.isAboutSelected else 10))
+            painter.drawRoundedRect(rect, 5, 5)
+
+        drawIcon(node._icon, painter, QRectF(x + 11.5 + pl, y + 10, 16, 16))
+
+        if not view.isCompacted:
+            # draw text
+            painter.setFont(view.font())
+            painter.setPen(node.textColor())
+
+            left = 44 + pl if not node.icon().isNull() else pl + 16
+            textRect = QRectF(x + left, y, rect.width() - 13 - left - pr, rect.height())
+            painter.drawText(textRect, Qt.AlignVCenter, node.text())
+
+            # draw drop down arrow
+            if not node.isLeaf():
+                painter.setPen(Qt.NoPen)
+                painter.translate(rect.right() + 1 - 20, y + 18)
+                painter.rotate(node.arrowAngle)
+                FIF.ARROW_DOWN.render(painter, QRectF(-5, -5, 9.6, 9.6))
+
+        painter.restore()
+
+    def _canDrawIndicator(self, node: NavigationTreeNode):
+        if node.isLeaf() or node.isSelected:
+            return node.isSelected
+
+        # the selected descendant is hidden by collapsed node
+        return self.parent().indicatorNode() is node
+
+    def helpEvent(self, event: QHelpEvent, view: QAbstractItemView, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        # the tool tip is only shown in compact mode like `NavigationToolTipFilter`
+        if not self.parent().isCompacted:
+            self.tooltipDelegate.hideToolTip()
+            return True
+
+        return self.tooltipDelegate.helpEvent(event, view, option, index)
+
+
+class NavigationTreeView(QListView):
+    """ Navigation tree view
+
+    The tree nodes are flattened to the rows of list model and painted by delegate, so only
+    the visible rows cost painting time and no widget is created for each node. The height of
+    view always equals to its content height, which makes it a drop-in replacement of the
+    `NavigationTreeWidget` items inside the scroll area of navigation panel.
+    """
+
+    ITEM_HEIGHT = 36
+    ROW_HEIGHT = 40
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.isCompacted = True
+        self.selectedNode = None    # type: NavigationTreeNode
+
+        self._model = NavigationTreeModel(self)
+        self.delegate = NavigationTreeItemDelegate(self)
+        self.heightAni = QVariantAnimation(self)
+
+        self.setModel(self._model)
+        self.setItemDelegate(self.delegate)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setAutoScroll(False)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setStyleSheet("QListView{border: none; background: transparent}")
+        self.setFixedSize(40, 0)
+        setFont(self)
+
+        self.heightAni.setDuration(120)
+        self.heightAni.setEasingCurve(QEasingCurve.OutQuad)
+        self.heightAni.valueChanged.connect(self._setViewHeight)
+
+    def model(self) -> NavigationTreeModel:
+        return self._model
+
+    def insertRoot(self, index: int, node: NavigationTreeNode):
+        """ insert root node """
+        node.setParent(self)
+        node.treeParent = None
+        node.nodeDepth = 0
+        self._model.insertRoot(index, node)
+        self.adjustHeight()
+
+    def removeRoot(self, node: NavigationTreeNode):
+        """ remove root node """
+        self._model.removeRoot(node)
+        self.adjustHeight()
+
+    def removeNode(self, node: NavigationTreeNode):
+        """ remove node from its parent """
+        if node is self.selectedNode or self._isAncestor(node, self.selectedNode):
+            self.selectedNode = None
+
+        if node.isRoot():
+            self.removeRoot(node)
+        else:
+            node.treeParent.removeChild(node)
+            self.adjustHeight()
+
+    def setCompacted(self, isCompacted: bool):
+        """ set whether the view is compacted """
+        if isCompacted == self.isCompacted:
+            return
+
+        self.isCompacted = isCompacted
+        self.setFixedWidth(40 if isCompacted else NavigationWidget.EXPAND_WIDTH)
+        self.viewport().update()
+
+    def setNodeExpanded(self, node: NavigationTreeNode, isExpanded: bool, ani=False):
+        if isExpanded:
+            self._model.expandNode(node)
+        else:
+            self._model.collapseNode(node)
+
+        self.updateNode(node)
+        self.adjustHeight(ani)
+
+    def setNodeSelected(self, node: NavigationTreeNode, isSelected: bool):
+        prevNode = self.selectedNode
+
+        if isSelected:
+            self.selectedNode = node
+        elif node is self.selectedNode:
+            self.selectedNode = None
+
+        if prevNode is not None and prevNode is not node:
+            self.updateNode(prevNode)
+
+        self.updateNode(node)
+
+    def indicatorNode(self):
+        """ get the shown node which draws the indicator of selected node """
+        return self.shownNode(self.selectedNode)
+
+    def shownNode(self, node: NavigationTreeNode):
+        """ get the node itself or its nearest ancestor whose row is shown """
+        while node and self._model.row(node) < 0:
+            node = node.treeParent
+
+        return node
+
+    def nodeRect(self, node: NavigationTreeNode):
+        """ get the geometry of node row """
+        row = self._model.row(node)
+        return QRect(0, max(row, 0) * self.ROW_HEIGHT, self.width(), self.ITEM_HEIGHT)
+
+    def updateNode(self, node: NavigationTreeNode):
+        """ repaint the row of node or its shown ancestor """
+        node = self.shownNode(node)
+        if node is not None:
+            self.viewport().update(self.nodeRect(node))
+
+    def contentHeight(self):
+        return max(self._model.rowCount() * self.ROW_HEIGHT - 4, 0)
+
+    def adjustHeight(self, ani=False):
+        """ adjust the height of view to fit the rows """
+        self.heightAni.stop()
+        h = self.contentHeight()
+
+        if ani and self.isVisible():
+            self.heightAni.setStartValue(self.height())
+            self.heightAni.setEndValue(h)
+            self.heightAni.start()
+        else:
+            self._setViewHeight(h)
+
+    def _setViewHeight(self, height: int):
+        self.setFixedHeight(height)
+        self.setVisible(self._model.rowCount() > 0)
+
+    def _isAncestor(self, node: NavigationTreeNode, child: NavigationTreeNode):
+        while child:
+            if child is node:
+                return True
+
+            child = child.treeParent
+
+        return False
+
+    def _rowAt(self, pos: QPoint):
+        row = pos.y() // self.ROW_HEIGHT
+        if pos.y() < 0 or row >= self._model.rowCount() or pos.y() % self.ROW_HEIGHT >= self.ITEM_HEIGHT:
+            return -1
+
+        return row
+
+    def _setHoverRow(self, row: int):
+        if row == self.delegate.hoverRow:
+            return
+
+        self.delegate.setHoverRow(row)
+        self.viewport().update()
+
+    def updateGeometries(self):
+        super().updateGeometries()
+
+        # the view is scrolled by the scroll area of navigation panel
+        self.verticalScrollBar().setRange(0, 0)
+
+    def mouseMoveEvent(self, e):
+        self._setHoverRow(self._rowAt(e.pos()))
+
+    def mousePressEvent(self, e):
+        if e.button() != Qt.LeftButton:
+            return
+
+        self.delegate.setPressedRow(self._rowAt(e.pos()))
+        self.viewport().update()
+
+    def mouseReleaseEvent(self, e):
+        row = self.delegate.pressedRow
+        self.delegate.setPressedRow(-1)
+        self.viewport().update()
+
+        if e.button() != Qt.LeftButton or row < 0 or row != self._rowAt(e.pos()):
+            return
+
+        node = self._model.nodes[row]
+        y = row * self.ROW_HEIGHT
+        clickArrow = QRectF(self.width() - 30, y + 8, 20, 20).contains(e.pos())
+        node.onClicked(True, clickArrow and not node.isLeaf())
+
+    def mouseDoubleClickEvent(self, e):
+        self.mousePressEvent(e)
+
+    def leaveEvent(self, e):
+        super().leaveEvent(e)
+        self.delegate.setPressedRow(-1)
+        self._setHoverRow(-1)
+
+    def wheelEvent(self, e):
+        # let the scroll area of navigation panel handle the wheel event
+        e.ignore()
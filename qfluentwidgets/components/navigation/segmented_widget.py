@@ -65,7 +65,7 @@ class SegmentedToggleToolItem(TransparentToolButton):
     def _drawIcon(self, icon, painter: QPainter, rect: QRectF, state=QIcon.State.Off):
         if self.isSelected and isinstance(icon, FluentIconBase):
             theme = Theme.DARK if not isDarkTheme() else Theme.LIGHT
-            icon = icon.icon(theme)
+            return drawIcon(icon.icon(theme), painter, rect, state, key=(icon, theme))
 
         return drawIcon(icon, painter, rect, state)
 
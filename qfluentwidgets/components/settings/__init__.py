@@ -1,8 +1,16 @@
-from .setting_card import (SettingCard, SwitchSettingCard, RangeSettingCard,
-                           PushSettingCard, ColorSettingCard, HyperlinkCard,
-                           PrimaryPushSettingCard, ColorPickerButton, ComboBoxSettingCard)
-from .expand_setting_card import ExpandSettingCard, ExpandGroupSettingCard, SimpleExpandGroupSettingCard
-from .folder_list_setting_card import FolderListSettingCard
-from .options_setting_card import OptionsSettingCard
-from .custom_color_setting_card import CustomColorSettingCard
-from .setting_card_group import SettingCardGroup
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .setting_card import (SettingCard, SwitchSettingCard, RangeSettingCard,
+                               PushSettingCard, ColorSettingCard, HyperlinkCard,
+                               PrimaryPushSettingCard, ColorPickerButton, ComboBoxSettingCard)
+    from .expand_setting_card import ExpandSettingCard, ExpandGroupSettingCard, SimpleExpandGroupSettingCard
+    from .folder_list_setting_card import FolderListSettingCard
+    from .options_setting_card import OptionsSettingCard
+    from .custom_color_setting_card import CustomColorSettingCard
+    from .setting_card_group import SettingCardGroup
+
+__getattr__, __dir__ = lazyImport(__name__)
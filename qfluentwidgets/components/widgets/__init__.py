@@ -1,42 +1,50 @@
-from .button import (DropDownPushButton, DropDownToolButton, PrimaryPushButton, PushButton, RadioButton,
-                     HyperlinkButton, ToolButton, TransparentToolButton, ToggleButton, SplitWidgetBase,
-                     SplitPushButton, SplitToolButton, PrimaryToolButton, PrimarySplitPushButton,
-                     PrimarySplitToolButton, PrimaryDropDownPushButton, PrimaryDropDownToolButton,
-                     TogglePushButton, ToggleToolButton, TransparentPushButton, TransparentTogglePushButton,
-                     TransparentToggleToolButton, TransparentDropDownPushButton, TransparentDropDownToolButton,
-                     PillPushButton, PillToolButton)
-from .card_widget import CardWidget, ElevatedCardWidget, SimpleCardWidget, HeaderCardWidget, CardGroupWidget, GroupHeaderCardWidget
-from .check_box import CheckBox
-from .combo_box import ComboBox, EditableComboBox
-from .model_combo_box import ModelComboBox, EditableModelComboBox
-from .command_bar import CommandBar, CommandButton, CommandBarView
-from .flip_view import FlipView, HorizontalFlipView, VerticalFlipView, FlipImageDelegate
-from .line_edit import LineEdit, TextEdit, PlainTextEdit, LineEditButton, SearchLineEdit, PasswordLineEdit, TextBrowser
-from .icon_widget import IconWidget
-from .label import (PixmapLabel, CaptionLabel, StrongBodyLabel, BodyLabel, SubtitleLabel, TitleLabel,
-                    LargeTitleLabel, DisplayLabel, FluentLabelBase, ImageLabel, AvatarWidget, HyperlinkLabel)
-from .list_view import ListWidget, ListView, ListItemDelegate
-from .menu import (DWMMenu, LineEditMenu, RoundMenu, MenuAnimationManager, MenuAnimationType, IndicatorMenuItemDelegate,
-                   MenuItemDelegate, ShortcutMenuItemDelegate, CheckableMenu, MenuIndicatorType, SystemTrayMenu,
-                   CheckableSystemTrayMenu)
-from .info_bar import InfoBar, InfoBarIcon, InfoBarPosition, InfoBarManager
-from .info_badge import InfoBadge, InfoLevel, DotInfoBadge, IconInfoBadge, InfoBadgePosition, InfoBadgeManager
-from .scroll_area import SingleDirectionScrollArea, SmoothMode, SmoothScrollArea, ScrollArea
-from .slider import Slider, HollowHandleStyle, ClickableSlider
-from .spin_box import (SpinBox, DoubleSpinBox, DateEdit, DateTimeEdit, TimeEdit, CompactSpinBox,
-                       CompactDoubleSpinBox, CompactDateEdit, CompactDateTimeEdit, CompactTimeEdit)
-from .stacked_widget import PopUpAniStackedWidget, OpacityAniStackedWidget, TransitionStackedWidget, EntranceTransitionStackedWidget, DrillInTransitionStackedWidget
-from .state_tool_tip import StateToolTip
-from .switch_button import SwitchButton, IndicatorPosition
-from .table_view import TableView, TableWidget, TableItemDelegate
-from .tool_tip import ToolTip, ToolTipFilter, ToolTipPosition
-from .tree_view import TreeWidget, TreeView, TreeItemDelegate
-from .cycle_list_widget import CycleListWidget
-from .progress_bar import IndeterminateProgressBar, ProgressBar
-from .progress_ring import ProgressRing, IndeterminateProgressRing
-from .scroll_bar import ScrollBar, SmoothScrollBar, SmoothScrollDelegate, ScrollBarHandleDisplayMode
-from .teaching_tip import TeachingTip, TeachingTipTailPosition, TeachingTipView, PopupTeachingTip
-from .flyout import FlyoutView, FlyoutViewBase, Flyout, FlyoutAnimationType, FlyoutAnimationManager
-from .tab_view import TabBar, TabItem, TabCloseButtonDisplayMode, TabWidget
-from .pips_pager import PipsPager, VerticalPipsPager, HorizontalPipsPager, PipsScrollButtonDisplayMode
-from .separator import HorizontalSeparator, VerticalSeparator
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .button import (DropDownPushButton, DropDownToolButton, PrimaryPushButton, PushButton, RadioButton,
+                         HyperlinkButton, ToolButton, TransparentToolButton, ToggleButton, SplitWidgetBase,
+                         SplitPushButton, SplitToolButton, PrimaryToolButton, PrimarySplitPushButton,
+                         PrimarySplitToolButton, PrimaryDropDownPushButton, PrimaryDropDownToolButton,
+                         TogglePushButton, ToggleToolButton, TransparentPushButton, TransparentTogglePushButton,
+                         TransparentToggleToolButton, TransparentDropDownPushButton, TransparentDropDownToolButton,
+                         PillPushButton, PillToolButton)
+    from .card_widget import CardWidget, ElevatedCardWidget, SimpleCardWidget, HeaderCardWidget, CardGroupWidget, GroupHeaderCardWidget
+    from .check_box import CheckBox
+    from .combo_box import ComboBox, EditableComboBox
+    from .model_combo_box import ModelComboBox, EditableModelComboBox
+    from .command_bar import CommandBar, CommandButton, CommandBarView
+    from .flip_view import FlipView, HorizontalFlipView, VerticalFlipView, FlipImageDelegate
+    from .line_edit import LineEdit, TextEdit, PlainTextEdit, LineEditButton, SearchLineEdit, PasswordLineEdit, TextBrowser
+    from .icon_widget import IconWidget
+    from .label import (PixmapLabel, CaptionLabel, StrongBodyLabel, BodyLabel, SubtitleLabel, TitleLabel,
+                        LargeTitleLabel, DisplayLabel, FluentLabelBase, ImageLabel, AvatarWidget, HyperlinkLabel)
+    from .list_view import ListWidget, ListView, ListItemDelegate
+    from .menu import (DWMMenu, LineEditMenu, RoundMenu, MenuAnimationManager, MenuAnimationType, IndicatorMenuItemDelegate,
+                       MenuItemDelegate, ShortcutMenuItemDelegate, CheckableMenu, MenuIndicatorType, SystemTrayMenu,
+                       CheckableSystemTrayMenu, MenuItemModel, MenuItemListView)
+    from .info_bar import InfoBar, InfoBarIcon, InfoBarPosition, InfoBarManager
+    from .info_badge import InfoBadge, InfoLevel, DotInfoBadge, IconInfoBadge, InfoBadgePosition, InfoBadgeManager
+    from .scroll_area import SingleDirectionScrollArea, SmoothMode, SmoothScrollArea, ScrollArea
+    from .slider import Slider, HollowHandleStyle, ClickableSlider
+    from .spin_box import (SpinBox, DoubleSpinBox, DateEdit, DateTimeEdit, TimeEdit, CompactSpinBox,
+                           CompactDoubleSpinBox, CompactDateEdit, CompactDateTimeEdit, CompactTimeEdit)
+    from .stacked_widget import PopUpAniStackedWidget, OpacityAniStackedWidget, TransitionStackedWidget, EntranceTransitionStackedWidget, DrillInTransitionStackedWidget
+    from .state_tool_tip import StateToolTip
+    from .switch_button import SwitchButton, IndicatorPosition
+    from .table_view import TableView, TableWidget, TableItemDelegate
+    from .tool_tip import ToolTip, ToolTipFilter, ToolTipPosition
+    from .tree_view import TreeWidget, TreeView, TreeItemDelegate
+    from .cycle_list_widget import CycleListWidget, CycleListView, CycleItemModel
+    from .progress_bar import IndeterminateProgressBar, ProgressBar
+    from .progress_ring import ProgressRing, IndeterminateProgressRing
+    from .scroll_bar import ScrollBar, SmoothScrollBar, SmoothScrollDelegate, ScrollBarHandleDisplayMode
+    from .teaching_tip import TeachingTip, TeachingTipTailPosition, TeachingTipView, PopupTeachingTip
+    from .flyout import FlyoutView, FlyoutViewBase, Flyout, FlyoutAnimationType, FlyoutAnimationManager
+    from .tab_view import TabBar, TabItem, TabCloseButtonDisplayMode, TabWidget, VirtualTabBar, TabModelItem
+    from .pips_pager import PipsPager, VerticalPipsPager, HorizontalPipsPager, PipsScrollButtonDisplayMode
+    from .separator import HorizontalSeparator, VerticalSeparator
+
+__getattr__, __dir__ = lazyImport(__name__)
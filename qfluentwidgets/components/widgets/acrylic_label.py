@@ -1,4 +1,5 @@
 # coding:utf-8
+from collections import OrderedDict
 import warnings
 from  typing import Union
 
@@ -9,13 +10,13 @@ from PyQt5.QtWidgets import QLabel, QApplication, QWidget
 from ...common.screen import getCurrentScreen
 
 try:
-    from ...common.image_utils import gaussianBlur
+    from ...common.image_utils import gaussianBlur, BlurEngine
 
     isAcrylicAvailable = True
 except ImportError as e:
     isAcrylicAvailable = False
 
-    def gaussianBlur(imagePath, blurRadius=18, brightFactor=1, blurPicSize=None):
+    def gaussianBlur(imagePath, blurRadius=18, brightFactor=1, blurPicSize=None, **kwargs):
         return QPixmap(imagePath)
 
 
@@ -160,9 +161,47 @@ class AcrylicLabel(QLabel):
                 self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
 
 
+class AcrylicBlurCache:
+    """ Least recently used cache of the blurred acrylic background """
+
+    def __init__(self, maxSize=8):
+        self.maxSize = maxSize
+        self._pixmaps = OrderedDict()
+
+    def key(self, image: QPixmap, *args):
+        """ get the cache key of image, `args` should contain all the blur parameters """
+        # a thumbnail is enough to identify the region, because the fine details are blurred anyway
+        thumbnail = image.toImage().scaled(32, 32, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+        thumbnail = thumbnail.convertToFormat(QImage.Format_RGB32)
+        bits = thumbnail.constBits()
+        bits.setsize(thumbnail.sizeInBytes())
+        return (image.width(), image.height(), bytes(bits)) + args
+
+    def get(self, key) -> QPixmap:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+
+        return pixmap
+
+    def add(self, key, pixmap: QPixmap):
+        self._pixmaps[key] = pixmap
+        if len(self._pixmaps) > self.maxSize:
+            self._pixmaps.popitem(last=False)
+
+    def clear(self):
+        self._pixmaps.clear()
+
+
+acrylicBlurCache = AcrylicBlurCache()
+
+
 class AcrylicBrush:
     """ Acrylic brush """
 
+    _noiseImage = None
+    _blurEngine = None
+
     def __init__(self, device: QWidget, blurRadius: int, tintColor=QColor(242, 242, 242, 150),
                  luminosityColor=QColor(255, 255, 255, 10), noiseOpacity=0.03):
         self.device = device
@@ -171,12 +210,35 @@ class AcrylicBrush:
         self.tintColor = QColor(tintColor)
         self.luminosityColor = QColor(luminosityColor)
         self.noiseOpacity = noiseOpacity
-        self.noiseImage = QImage(':/qfluentwidgets/images/acrylic/noise.png')
+        self.noiseImage = self._loadNoiseImage()
         self.originalImage = QPixmap()
         self.image = QPixmap()
 
         self.clipPath = QPainterPath()
 
+        self._blurTaskId = 0
+        self._blurKey = None
+        self._isEngineConnected = False
+        self._texture = QImage()
+        self._textureKey = None
+        self._scaledImage = QPixmap()
+        self._scaledKey = None
+
+    @classmethod
+    def _loadNoiseImage(cls):
+        if cls._noiseImage is None:
+            cls._noiseImage = QImage(':/qfluentwidgets/images/acrylic/noise.png')
+
+        return cls._noiseImage
+
+    @classmethod
+    def blurEngine(cls):
+        """ get the blur engine shared by all acrylic brushes """
+        if cls._blurEngine is None:
+            cls._blurEngine = BlurEngine()
+
+        return cls._blurEngine
+
     def setBlurRadius(self, radius: int):
         if radius == self.blurRadius:
             return
@@ -195,13 +257,17 @@ class AcrylicBrush:
     def isAvailable(self):
         return isAcrylicAvailable
 
-    def grabImage(self, rect: QRect):
+    def grabImage(self, rect: QRect, background=True):
         """ grab image from screen
 
         Parameters
         ----------
         rect: QRect
             grabbed region
+
+        background: bool
+            whether to blur the image in background thread, the screen itself
+            can only be grabbed in the GUI thread
         """
         screen = getCurrentScreen()
         if not screen:
@@ -210,23 +276,72 @@ class AcrylicBrush:
         x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
         x -= screen.geometry().x()
         y -= screen.geometry().y()
-        self.setImage(screen.grabWindow(0, x, y, w, h))
+        self.setImage(screen.grabWindow(0, x, y, w, h), background)
+
+    def setImage(self, image: Union[str, QImage, QPixmap], background=False):
+        """ set blurred image
 
-    def setImage(self, image: Union[str, QImage, QPixmap]):
-        """ set blurred image """
+        Parameters
+        ----------
+        image: str | QImage | QPixmap
+            the image to be blurred
+
+        background: bool
+            whether to blur the image in background thread, a placeholder tint
+            is painted until the blurred image is ready
+        """
         if isinstance(image, str):
             image = QPixmap(image)
         elif isinstance(image, QImage):
             image = QPixmap.fromImage(image)
 
         self.originalImage = image
+        self._blurTaskId = 0
+
         if not image.isNull():
             checkAcrylicAvailability()
 
-            self.image = gaussianBlur(image, self.blurRadius, blurPicSize=self.blurPicSize)
+            downscale = self.blurDownscale()
+            key = acrylicBlurCache.key(image, self.blurRadius, self.blurPicSize, downscale)
+            pixmap = acrylicBlurCache.get(key)
+
+            if pixmap is not None:
+                self.image = pixmap
+            elif background and isAcrylicAvailable:
+                self._blurInBackground(image, key, downscale)
+            else:
+                self.image = gaussianBlur(image, self.blurRadius, blurPicSize=self.blurPicSize, downscale=downscale)
+                acrylicBlurCache.add(key, self.image)
 
         self.device.update()
 
+    def isBlurring(self):
+        """ whether the image is being blurred in background thread """
+        return self._blurTaskId != 0
+
+    def _blurInBackground(self, image: QPixmap, key, downscale):
+        engine = self.blurEngine()
+        if not self._isEngineConnected:
+            engine.blurFinished.connect(self._onBlurFinished)
+            self._isEngineConnected = True
+
+        self.image = QPixmap()
+        self._blurKey = key
+        self._blurTaskId = engine.blur(image, self.blurRadius, blurPicSize=self.blurPicSize, downscale=downscale)
+
+    def _onBlurFinished(self, taskId: int, image: QImage):
+        if taskId != self._blurTaskId:
+            return
+
+        self._blurTaskId = 0
+        self.image = QPixmap.fromImage(image)
+        acrylicBlurCache.add(self._blurKey, self.image)
+
+        try:
+            self.device.update()
+        except RuntimeError:
+            pass
+
     def setClipPath(self, path: QPainterPath):
         self.clipPath = path
         self.device.update()
@@ -234,7 +349,15 @@ class AcrylicBrush:
     def setBlurPicSize(self, size: QSize):
         self.blurPicSize = (size.width(), size.height())
 
+    def blurDownscale(self):
+        """ the factor used to shrink the image before blurring, large radius allows more shrinking """
+        return min(max(self.blurRadius / 8, 1), 4)
+
     def textureImage(self):
+        key = (self.tintColor.rgba(), self.luminosityColor.rgba(), self.noiseOpacity)
+        if key == self._textureKey:
+            return self._texture
+
         texture = QImage(64, 64, QImage.Format_ARGB32_Premultiplied)
         texture.fill(self.luminosityColor)
 
@@ -245,9 +368,21 @@ class AcrylicBrush:
         # paint noise
         painter.setOpacity(self.noiseOpacity)
         painter.drawImage(texture.rect(), self.noiseImage)
+        painter.end()
 
+        self._texture = texture
+        self._textureKey = key
         return texture
 
+    def scaledImage(self, size: QSize):
+        """ get the blurred image scaled to the size of device """
+        key = (self.image.cacheKey(), size.width(), size.height())
+        if key != self._scaledKey:
+            self._scaledImage = self.image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            self._scaledKey = key
+
+        return self._scaledImage
+
     def paint(self):
         device = self.device
 
@@ -257,9 +392,13 @@ class AcrylicBrush:
         if not self.clipPath.isEmpty():
             painter.setClipPath(self.clipPath)
 
-        # paint image
-        image = self.image.scaled(device.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        painter.drawPixmap(0, 0, image)
+        # paint image, the opaque tint is used as placeholder before the image is blurred
+        if self.isBlurring():
+            color = QColor(self.tintColor)
+            color.setAlpha(255)
+            painter.fillRect(device.rect(), color)
+        else:
+            painter.drawPixmap(0, 0, self.scaledImage(device.size()))
 
         # paint acrylic texture
         painter.fillRect(device.rect(), QBrush(self.textureImage()))
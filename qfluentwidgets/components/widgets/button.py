@@ -132,14 +132,13 @@ class PrimaryPushButton(PushButton):
     """
 
     def _drawIcon(self, icon, painter, rect, state=QIcon.Off):
-        if isinstance(icon, FluentIconBase) and self.isEnabled():
-            # reverse icon color
-            theme = Theme.DARK if not isDarkTheme() else Theme.LIGHT
-            icon = icon.icon(theme)
-        elif not self.isEnabled():
+        if not self.isEnabled():
             painter.setOpacity(0.786 if isDarkTheme() else 0.9)
-            if isinstance(icon, FluentIconBase):
-                icon = icon.icon(Theme.DARK)
+
+        if isinstance(icon, FluentIconBase):
+            # reverse icon color
+            theme = Theme.DARK if not isDarkTheme() or not self.isEnabled() else Theme.LIGHT
+            return drawIcon(icon.icon(theme), painter, rect, state, key=(icon, theme))
 
         PushButton._drawIcon(self, icon, painter, rect, state)
 
@@ -237,7 +236,8 @@ class HyperlinkButton(PushButton):
 
     def _drawIcon(self, icon, painter, rect, state=QIcon.Off):
         if isinstance(icon, FluentIconBase) and self.isEnabled():
-            icon = icon.icon(color=themeColor())
+            color = themeColor().name()
+            return drawIcon(icon.icon(color=color), painter, rect, state, key=(icon, color))
         elif not self.isEnabled():
             painter.setOpacity(0.3628 if isDarkTheme() else 0.36)
 
@@ -502,17 +502,15 @@ class PrimaryToolButton(ToolButton):
     """
 
     def _drawIcon(self, icon, painter: QPainter, rect: QRectF, state=QIcon.Off):
-        if isinstance(icon, FluentIconBase) and self.isEnabled():
-            # reverse icon color
-            theme = Theme.DARK if not isDarkTheme() else Theme.LIGHT
-            icon = icon.icon(theme)
-        elif isinstance(icon, Icon) and self.isEnabled():
-            theme = Theme.DARK if not isDarkTheme() else Theme.LIGHT
-            icon = icon.fluentIcon.icon(theme)
+        if isinstance(icon, Icon) and self.isEnabled():
+            icon = icon.fluentIcon
         elif not self.isEnabled():
             painter.setOpacity(0.786 if isDarkTheme() else 0.9)
-            if isinstance(icon, FluentIconBase):
-                icon = icon.icon(Theme.DARK)
+
+        if isinstance(icon, FluentIconBase):
+            # reverse icon color
+            theme = Theme.DARK if not isDarkTheme() or not self.isEnabled() else Theme.LIGHT
+            return drawIcon(icon.icon(theme), painter, rect, state, key=(icon, theme))
 
         return drawIcon(icon, painter, rect, state)
 
@@ -762,7 +760,11 @@ class PrimarySplitDropButton(PrimaryToolButton):
             painter.setOpacity(1)
 
         if isinstance(icon, FluentIconBase):
-            icon = icon.icon(Theme.DARK if not isDarkTheme() else Theme.LIGHT)
+            if not self.isEnabled():
+                painter.setOpacity(0.786 if isDarkTheme() else 0.9)
+
+            theme = Theme.DARK if not isDarkTheme() else Theme.LIGHT
+            return drawIcon(icon.icon(theme), painter, rect, key=(icon, theme))
 
         super()._drawIcon(icon, painter, rect)
 
@@ -1,15 +1,16 @@
 # coding:utf-8
 import sys
-from typing import Union, List, Iterable
+from typing import Union, List, Iterable, Dict
 
-from PyQt5.QtCore import Qt, pyqtSignal, QRectF, QPoint, QObject, QEvent
-from PyQt5.QtGui import QPainter, QCursor, QIcon
-from PyQt5.QtWidgets import QAction, QPushButton, QApplication
+from PyQt5.QtCore import Qt, pyqtSignal, QRectF, QPoint, QObject, QEvent, QSize, QModelIndex
+from PyQt5.QtGui import QPainter, QCursor, QIcon, QPixmap
+from PyQt5.QtWidgets import QAction, QPushButton, QApplication, QAbstractItemView
 
-from .menu import RoundMenu, MenuAnimationType, IndicatorMenuItemDelegate
+from .menu import (RoundMenu, MenuAnimationType, IndicatorMenuItemDelegate, MenuItemModel,
+                   MenuItemListView)
 from .line_edit import LineEdit, LineEditButton
 from ...common.animation import TranslateYAnimation
-from ...common.icon import FluentIconBase, isDarkTheme
+from ...common.icon import FluentIconBase, FluentIconEngine, isDarkTheme
 from ...common.icon import FluentIcon as FIF
 from ...common.font import setFont
 from ...common.style_sheet import FluentStyleSheet
@@ -73,6 +74,16 @@ class ComboBoxBase(QObject):
         self.dropMenu = None
         self._placeholderText = ""
 
+        # hash indexes of text and user data, which are rebuilt lazily
+        self._textIndexes = {}  # type: Dict[str, int]
+        self._dataIndexes = {}  # type: Dict[object, int]
+        self._isIndexDirty = False
+        self._hasUnhashableData = False
+        self._itemsVersion = 0
+
+        self._isVirtualized = False
+        self._virtualMenu = None
+
         FluentStyleSheet.COMBO_BOX.apply(self)
         self.installEventFilter(self)
 
@@ -101,6 +112,8 @@ class ComboBoxBase(QObject):
         """
         item = ComboItem(text, icon, userData)
         self.items.append(item)
+        self._appendIndexes(len(self.items) - 1, [item])
+
         if len(self.items) == 1:
             self.setCurrentIndex(0)
 
@@ -112,8 +125,16 @@ class ComboBoxBase(QObject):
         text: Iterable[str]
             the text of item
         """
-        for text in texts:
-            self.addItem(text)
+        items = [ComboItem(text) for text in texts]
+        if not items:
+            return
+
+        first = len(self.items)
+        self.items.extend(items)
+        self._appendIndexes(first, items)
+
+        if first == 0:
+            self.setCurrentIndex(0)
 
     def removeItem(self, index: int):
         """ Removes the item at the given index from the combobox.
@@ -123,6 +144,7 @@ class ComboBoxBase(QObject):
             return
 
         self.items.pop(index)
+        self._markItemsChanged()
 
         if index < self.currentIndex():
             self.setCurrentIndex(self._currentIndex - 1)
@@ -208,6 +230,8 @@ class ComboBoxBase(QObject):
             return
 
         self.items[index].text = text
+        self._markItemsChanged()
+
         if self.currentIndex() == index:
             self.setText(text)
 
@@ -236,19 +260,36 @@ class ComboBoxBase(QObject):
         """ Sets the data role for the item on the given index """
         if 0 <= index < len(self.items):
             self.items[index].userData = value
+            self._markItemsChanged()
 
     def setItemIcon(self, index: int, icon: Union[str, QIcon, FluentIconBase]):
         """ Sets the data role for the item on the given index """
         if 0 <= index < len(self.items):
             self.items[index].icon = icon
+            self._markItemsChanged(False)
 
     def setItemEnabled(self, index: int, isEnabled: bool):
         """ Sets the enabled status of the item on the given index """
         if 0 <= index < len(self.items):
             self.items[index].isEnabled = isEnabled
+            self._markItemsChanged(False)
 
     def findData(self, data):
         """ Returns the index of the item containing the given data, otherwise returns -1 """
+        self._updateIndexes()
+
+        try:
+            index = self._dataIndexes.get(data, -1)
+        except TypeError:
+            index = -1
+            hashable = False
+        else:
+            hashable = True
+
+        if index >= 0 or (hashable and not self._hasUnhashableData):
+            return index
+
+        # fall back to linear search if the data can not be hashed
         for i, item in enumerate(self.items):
             if item.userData == data:
                 return i
@@ -257,11 +298,44 @@ class ComboBoxBase(QObject):
 
     def findText(self, text: str):
         """ Returns the index of the item containing the given text; otherwise returns -1. """
+        self._updateIndexes()
+        return self._textIndexes.get(text, -1)
+
+    def _markItemsChanged(self, isIndexDirty=True):
+        self._itemsVersion += 1
+        self._isIndexDirty = self._isIndexDirty or isIndexDirty
+
+    def _appendIndexes(self, first: int, items: List[ComboItem]):
+        """ add the indexes of items appended to the end """
+        self._itemsVersion += 1
+        if self._isIndexDirty:
+            return
+
+        for i, item in enumerate(items, first):
+            self._addIndex(i, item)
+
+    def _addIndex(self, index: int, item: ComboItem):
+        # only the first item of duplicated keys is indexed
+        self._textIndexes.setdefault(item.text, index)
+
+        try:
+            self._dataIndexes.setdefault(item.userData, index)
+        except TypeError:
+            self._hasUnhashableData = True
+
+    def _updateIndexes(self):
+        """ rebuild the hash indexes if items are inserted, removed or modified """
+        if not self._isIndexDirty:
+            return
+
+        self._textIndexes.clear()
+        self._dataIndexes.clear()
+        self._hasUnhashableData = False
+
         for i, item in enumerate(self.items):
-            if item.text == text:
-                return i
+            self._addIndex(i, item)
 
-        return -1
+        self._isIndexDirty = False
 
     def clear(self):
         """ Clears the combobox, removing all items. """
@@ -269,6 +343,11 @@ class ComboBoxBase(QObject):
             self.setText('')
 
         self.items.clear()
+        self._textIndexes.clear()
+        self._dataIndexes.clear()
+        self._isIndexDirty = False
+        self._hasUnhashableData = False
+        self._itemsVersion += 1
         self._currentIndex = -1
 
     def count(self):
@@ -279,20 +358,22 @@ class ComboBoxBase(QObject):
         """ Inserts item into the combobox at the given index. """
         item = ComboItem(text, icon, userData)
         self.items.insert(index, item)
+        self._markItemsChanged()
 
         if index <= self.currentIndex():
             self.setCurrentIndex(self.currentIndex() + 1)
 
     def insertItems(self, index: int, texts: Iterable[str]):
         """ Inserts items into the combobox, starting at the index specified. """
-        pos = index
-        for text in texts:
-            item = ComboItem(text)
-            self.items.insert(pos, item)
-            pos += 1
+        items = [ComboItem(text) for text in texts]
+        if not items:
+            return
+
+        self.items[index:index] = items
+        self._markItemsChanged()
 
         if index <= self.currentIndex():
-            self.setCurrentIndex(self.currentIndex() + pos - index)
+            self.setCurrentIndex(self.currentIndex() + len(items))
 
     def setMaxVisibleItems(self, num: int):
         self._maxVisibleItems = num
@@ -300,6 +381,29 @@ class ComboBoxBase(QObject):
     def maxVisibleItems(self):
         return self._maxVisibleItems
 
+    def setVirtualized(self, isVirtualized: bool):
+        """ set whether to use the virtualized drop down menu
+
+        Parameters
+        ----------
+        isVirtualized: bool
+            if `True`, the drop down menu shows the items through a data model and only the
+            visible rows are painted, the menu is reused across openings. It is useful
+            for combo box with thousands of items
+        """
+        if isVirtualized == self._isVirtualized:
+            return
+
+        self._closeComboMenu()
+        self._isVirtualized = isVirtualized
+
+        if not isVirtualized and self._virtualMenu:
+            self._virtualMenu.deleteLater()
+            self._virtualMenu = None
+
+    def isVirtualized(self):
+        return self._isVirtualized
+
     def _closeComboMenu(self):
         if not self.dropMenu:
             return
@@ -323,10 +427,16 @@ class ComboBoxBase(QObject):
     def _createComboMenu(self):
         return ComboBoxMenu(self)
 
+    def _createVirtualComboMenu(self):
+        return VirtualComboBoxMenu(self)
+
     def _showComboMenu(self):
         if not self.items:
             return
 
+        if self.isVirtualized():
+            return self._showVirtualComboMenu()
+
         menu = self._createComboMenu()
         for i, item in enumerate(self.items):
             action = QAction(item.icon, item.text, triggered=lambda c, x=i: self._onItemClicked(x))
@@ -361,6 +471,36 @@ class ComboBoxBase(QObject):
             menu.view.adjustSize(pu, MenuAnimationType.PULL_UP)
             menu.exec(pu, aniType=MenuAnimationType.PULL_UP)
 
+    def _showVirtualComboMenu(self):
+        menu = self._virtualMenu
+        if menu is None:
+            menu = self._createVirtualComboMenu()
+            menu.itemActivated.connect(self._onItemClicked)
+            menu.closedSignal.connect(self._onDropMenuClosed)
+            self._virtualMenu = menu
+
+        # the model is only reset if the items are changed since last opening
+        menu.sync(self.items, self._itemsVersion)
+        menu.view.setMinimumWidth(self.width())
+        menu.setMaxVisibleItems(self.maxVisibleItems())
+        menu.setCurrentRow(self.currentIndex())
+        self.dropMenu = menu
+
+        # determine the animation type by choosing the maximum height of view
+        x = -menu.width()//2 + menu.layout().contentsMargins().left() + self.width()//2
+        pd = self.mapToGlobal(QPoint(x, self.height()))
+        hd = menu.view.heightForAnimation(pd, MenuAnimationType.DROP_DOWN)
+
+        pu = self.mapToGlobal(QPoint(x, 0))
+        hu = menu.view.heightForAnimation(pu, MenuAnimationType.PULL_UP)
+
+        if hd >= hu:
+            menu.exec(pd, aniType=MenuAnimationType.DROP_DOWN)
+        else:
+            menu.exec(pu, aniType=MenuAnimationType.PULL_UP)
+
+        menu.scrollToCurrentRow()
+
     def _toggleComboMenu(self):
         if self.dropMenu:
             self._closeComboMenu()
@@ -500,11 +640,10 @@ class EditableComboBox(LineEdit, ComboBoxBase):
         self._currentIndex = -1
         self.currentTextChanged.emit(text)
 
-        for i, item in enumerate(self.items):
-            if item.text == text:
-                self._currentIndex = i
-                self.currentIndexChanged.emit(i)
-                return
+        index = self.findText(text)
+        if index >= 0:
+            self._currentIndex = index
+            self.currentIndexChanged.emit(index)
 
     def _onDropMenuClosed(self):
         self.dropMenu = None
@@ -530,4 +669,132 @@ class ComboBoxMenu(RoundMenu):
     def exec(self, pos, ani=True, aniType=MenuAnimationType.DROP_DOWN):
         self.view.adjustSize(pos, aniType)
         self.adjustSize()
-        return super().exec(pos, ani, aniType)
\ No newline at end of file
+        return super().exec(pos, ani, aniType)
+
+class ComboItemModel(MenuItemModel):
+    """ Data model of combo box items """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.items = []     # type: List[ComboItem]
+        self._hasIcon = False
+        self._blankIcon = QIcon()
+
+    def setItems(self, items: List[ComboItem], iconSize=QSize(14, 14)):
+        """ set the items of model, the list is not copied """
+        self.beginResetModel()
+        self.items = items
+        self._hasIcon = any(not i.icon.isNull() for i in items)
+
+        pixmap = QPixmap(iconSize)
+        pixmap.fill(Qt.transparent)
+        self._blankIcon = QIcon(pixmap)
+
+        self.endResetModel()
+
+    def hasIcon(self):
+        return self._hasIcon
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def flags(self, index: QModelIndex):
+        if not self._isValidIndex(index) or not self.items[index.row()].isEnabled:
+            return Qt.NoItemFlags
+
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not self._isValidIndex(index):
+            return None
+
+        item = self.items[index.row()]
+
+        if role == Qt.DisplayRole:
+            # add a blank character to increase space between icon and text
+            return " " + item.text if self._hasIcon else item.text
+        if role == Qt.DecorationRole and self._hasIcon:
+            icon = item.icon
+            return self._blankIcon if icon.isNull() else QIcon(FluentIconEngine(icon))
+        if role == Qt.UserRole:
+            return item.userData
+
+        return super().data(index, role)
+
+    def _isValidIndex(self, index: QModelIndex):
+        return index.isValid() and index.row() < len(self.items)
+
+
+class ComboItemListView(MenuItemListView):
+    """ List view of combo menu which only lays out and paints the visible items """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.itemModel = ComboItemModel(self)
+        self.setModel(self.itemModel)
+
+    def setItems(self, items: List[ComboItem]):
+        """ set the items shown in view """
+        self.itemModel.setItems(items, self.iconSize())
+
+        # compute the width of the longest item once instead of creating an item for each entry
+        fm = self.fontMetrics()
+        if not items:
+            w = 0
+        elif self.itemModel.hasIcon():
+            space = 4 - fm.width(" ")
+            w = 60 + max(fm.width(" " + i.text) for i in items) + space
+        else:
+            w = 40 + max(fm.width(i.text) for i in items)
+
+        self.setItemWidth(w)
+        self.adjustSize()
+
+
+class VirtualComboBoxMenu(ComboBoxMenu):
+    """ Virtualized combo box menu, which is reused across openings """
+
+    itemActivated = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._itemsVersion = None
+
+    def _createView(self):
+        return ComboItemListView(self)
+
+    def sync(self, items: List[ComboItem], version=None):
+        """ update the items of menu
+
+        Parameters
+        ----------
+        items: List[ComboItem]
+            combo box items
+
+        version: Any
+            the version of items, the model is not reset if it's the same as the last one
+        """
+        if version is not None and version == self._itemsVersion:
+            return
+
+        self._itemsVersion = version
+        self.view.setItems(items)
+        self.adjustSize()
+
+    def setCurrentRow(self, row: int):
+        self.view.setCurrentRow(row)
+
+    def scrollToCurrentRow(self):
+        index = self.view.currentIndex()
+        if index.isValid():
+            self.view.scrollTo(index, QAbstractItemView.PositionAtCenter)
+
+    def _onItemClicked(self, index: QModelIndex):
+        if not index.flags() & Qt.ItemIsEnabled:
+            return
+
+        self._hideMenu(False)
+        self.itemActivated.emit(index.row())
+
+    def _onItemEntered(self, index: QModelIndex):
+        self.lastHoverItem = index
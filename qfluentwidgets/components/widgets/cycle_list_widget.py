@@ -1,12 +1,15 @@
 # coding:utf-8
-from typing import Iterable
+from typing import Dict, Iterable, List
 
-from PyQt5.QtCore import Qt, pyqtSignal, QSize, QEvent, QRectF, QEasingCurve, QTime
+from PyQt5.QtCore import (Qt, pyqtSignal, QSize, QEvent, QRectF, QEasingCurve, QTime, QModelIndex,
+                          QAbstractListModel)
 from PyQt5.QtGui import QPainter
-from PyQt5.QtWidgets import QListWidget, QListWidgetItem, QToolButton
+from PyQt5.QtWidgets import (QListWidget, QListWidgetItem, QToolButton, QListView, QStyledItemDelegate,
+                             QStyleOptionViewItem, QStyle)
 
 from .scroll_area import SmoothScrollBar
 from ...common.icon import FluentIcon, isDarkTheme
+from ...common.font import textAtlas
 
 
 class ScrollButton(QToolButton):
@@ -48,10 +51,143 @@ class ScrollButton(QToolButton):
             self._icon.render(painter, QRectF(x, y, w, h))
 
 
-class CycleListWidget(QListWidget):
-    """ Cycle list widget """
+class CycleItemModel(QAbstractListModel):
+    """ Cycle item model
 
-    currentItemChanged = pyqtSignal(QListWidgetItem)
+    Each value is stored once, and the value of row is mapped with modulo arithmetic. In cycle
+    mode, the rows show the values circularly starting from the value at `offset()`, so the
+    number of rows doesn't depend on the number of values. Otherwise, the values are shown
+    once with empty rows before and after them.
+    """
+
+    def __init__(self, itemSize: QSize, align=Qt.AlignCenter, parent=None):
+        super().__init__(parent=parent)
+        self.itemSize = QSize(itemSize)
+        self.align = align | Qt.AlignVCenter
+        self._values = []   # type: List[str]
+        self._indexes = {}  # type: Dict[str, int]
+        self._cycleRows = 0
+        self._padding = 0
+        self._offset = 0
+        self._count = 0
+
+    def setItems(self, items: Iterable, cycleRows=0, padding=0):
+        """ set items
+
+        Parameters
+        ----------
+        items: Iterable[Any]
+            the items to be added
+
+        cycleRows: int
+            the number of rows in cycle mode, `0` to disable cycle mode
+
+        padding: int
+            the number of empty rows before and after items if cycle mode is disabled
+        """
+        self.beginResetModel()
+        self._values = [str(i) for i in items]
+        self._cycleRows = cycleRows if self._values else 0
+        self._padding = 0 if self._cycleRows else padding
+        self._offset = 0
+
+        self._indexes.clear()
+        for i, v in enumerate(self._values):
+            self._indexes.setdefault(v, i)
+
+        self._count = self._cycleRows or len(self._values) + 2 * padding
+        self.endResetModel()
+
+    def values(self) -> List[str]:
+        return self._values
+
+    def isCycle(self):
+        return self._cycleRows > 0
+
+    def indexOf(self, text: str) -> int:
+        """ Returns the index of value, or -1 if not found """
+        return self._indexes.get(text, -1)
+
+    def offset(self):
+        return self._offset
+
+    def setOffset(self, offset: int):
+        """ set the index of value shown in the first row of cycle """
+        if not self.isCycle():
+            return
+
+        self._offset = offset % len(self._values)
+        if self._count:
+            self.dataChanged.emit(self.index(0), self.index(self._count - 1))
+
+    def rotate(self, rows: int):
+        """ move the values up by `rows` rows in cycle mode """
+        self.setOffset(self._offset + rows)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def text(self, row: int) -> str:
+        """ Returns the text of row, empty row returns empty string """
+        if not 0 <= row < self._count:
+            return ''
+
+        if self._cycleRows:
+            return self._values[(self._offset + row) % len(self._values)]
+
+        i = row - self._padding
+        return self._values[i] if 0 <= i < len(self._values) else ''
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            return self.text(index.row())
+        if role == Qt.SizeHintRole:
+            return self.itemSize
+        if role == Qt.TextAlignmentRole:
+            return int(self.align)
+
+        return None
+
+    def flags(self, index: QModelIndex):
+        i = index.row() - self._padding
+        if not self._cycleRows and not 0 <= i < len(self._values):
+            return Qt.NoItemFlags
+
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class CycleItemDelegate(QStyledItemDelegate):
+    """ Cycle item delegate, the text of item is blitted from text atlas """
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        widget = option.widget
+        model = index.model()
+        if not widget or not isinstance(model, CycleItemModel):
+            return super().paint(painter, option, index)
+
+        style = widget.style()
+        opt = QStyleOptionViewItem(option)
+        opt.features |= QStyleOptionViewItem.HasDisplay
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, opt, painter, widget)
+
+        text = model.text(index.row())
+        if not text:
+            return
+
+        # use the same text rect as the style, which respects the margin and padding of item
+        rect = style.subElementRect(QStyle.SE_ItemViewItemText, opt, widget)
+        margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, widget) + 1
+        rect = QRectF(rect.adjusted(margin, 0, -margin, 0))
+
+        color = Qt.white if isDarkTheme() else Qt.black
+        textAtlas.draw(painter, rect, text, opt.font, color, model.align)
+
+
+class CycleListBase:
+    """ Cycle list base class """
 
     def __init__(self, items: Iterable, itemSize: QSize, align=Qt.AlignCenter, parent=None):
         """
@@ -84,7 +220,7 @@ class CycleListWidget(QListWidget):
         self.visibleNumber = 9
 
         # repeat adding items to achieve circular scrolling
-        self.setItems(items)
+        self.setItems(self.originItems)
 
         self.setVerticalScrollMode(self.ScrollPerPixel)
         self.vScrollBar.setScrollAnimation(self.scrollDuration)
@@ -98,7 +234,6 @@ class CycleListWidget(QListWidget):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-        self.itemClicked.connect(self._onItemClicked)
         self.installEventFilter(self)
 
         # enable auto-repeat by default
@@ -112,6 +247,125 @@ class CycleListWidget(QListWidget):
         self.setScrollButtonRepeatEnabled(True)
         self._setButtonsVisible(False)
 
+    def setItems(self, items: list):
+        raise NotImplementedError
+
+    def _scrollToCurrentItem(self):
+        """ scroll current item to the center with animation """
+        raise NotImplementedError
+
+    def _scrollToRow(self, row: int, hint=QListView.PositionAtCenter):
+        """ scroll to row immediately """
+        self.scrollTo(self.model().index(row, 0), hint)
+
+    def _rotateItems(self, rows: int):
+        """ move the items up by `rows` rows after the view jumps to keep the same items visible """
+        pass
+
+    def wheelEvent(self, e):
+        if e.angleDelta().y() < 0:
+            self.scrollDown()
+        else:
+            self.scrollUp()
+
+    def setScrollButtonRepeatEnabled(self, isEnabled: bool):
+        """ set whether to enable scroll button auto repeat """
+        if self._scrollButtonRepeatEnabled == isEnabled:
+            return
+
+        self._scrollButtonRepeatEnabled = isEnabled
+        self.upButton.setAutoRepeat(isEnabled)
+        self.downButton.setAutoRepeat(isEnabled)
+
+    def _scrollWithAnimation(self, index: int):
+        """ scroll with adaptive animation """
+        t = QTime.currentTime()
+        elapsed = self._lastScrollTime.msecsTo(t)
+        self._lastScrollTime = t
+
+        # fast linear animation for rapid repeat, smooth for single click
+        if (self.upButton.isDown() or self.downButton.isDown()) and elapsed < 200:
+            duration, easing = 100, QEasingCurve.Linear
+        else:
+            duration, easing = 250, QEasingCurve.OutQuad
+
+        self.vScrollBar.setScrollAnimation(duration, easing)
+        self.setCurrentIndex(index)
+        self._scrollToCurrentItem()
+
+    def scrollDown(self):
+        """ scroll down an item """
+        self._scrollWithAnimation(self.currentIndex() + 1)
+
+    def scrollUp(self):
+        """ scroll up an item """
+        self._scrollWithAnimation(self.currentIndex() - 1)
+
+    def _setButtonsVisible(self, visible: bool):
+        """ set scroll buttons visibility """
+        self.upButton.setVisible(visible)
+        self.downButton.setVisible(visible)
+
+    def enterEvent(self, e):
+        self._setButtonsVisible(True)
+
+    def leaveEvent(self, e):
+        self._setButtonsVisible(False)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        w, h = self.width(), 34
+        self.upButton.resize(w, h)
+        self.downButton.resize(w, h)
+        self.downButton.move(0, self.height() - h)
+
+    def eventFilter(self, obj, e: QEvent):
+        if obj is not self or e.type() != QEvent.KeyPress:
+            return super().eventFilter(obj, e)
+
+        if e.key() == Qt.Key_Down:
+            self.scrollDown()
+            return True
+        elif e.key() == Qt.Key_Up:
+            self.scrollUp()
+            return True
+
+        return super().eventFilter(obj, e)
+
+    def currentIndex(self):
+        return self._currentIndex
+
+    def setCurrentIndex(self, index: int):
+        if not self.isCycle:
+            n = self.visibleNumber // 2
+            self._currentIndex = max(
+                n, min(n + len(self.originItems) - 1, index))
+        else:
+            count = self.model().rowCount()
+            N = count // 2
+            m = (self.visibleNumber + 1) // 2
+            self._currentIndex = index
+
+            # scroll to center to achieve circular scrolling
+            if index >= count - m:
+                self._currentIndex = N + index - count
+                self._rotateItems(count - N)
+                self._scrollToRow(self.currentIndex() - 1)
+            elif index <= m - 1:
+                self._currentIndex = N + index
+                self._rotateItems(-N)
+                self._scrollToRow(N + index + 1)
+
+
+class CycleListWidget(CycleListBase, QListWidget):
+    """ Cycle list widget """
+
+    currentItemChanged = pyqtSignal(QListWidgetItem)
+
+    def __init__(self, items: Iterable, itemSize: QSize, align=Qt.AlignCenter, parent=None):
+        super().__init__(items, itemSize, align, parent)
+        self.itemClicked.connect(self._onItemClicked)
+
     def setItems(self, items: list):
         """ set items in the list
 
@@ -127,7 +381,8 @@ class CycleListWidget(QListWidget):
             the text alignment of item
         """
         self.clear()
-        self._createItems(items)
+        self.originItems = list(items)
+        self._createItems(self.originItems)
 
     def _createItems(self, items: list):
         N = len(items)
@@ -192,95 +447,95 @@ class CycleListWidget(QListWidget):
 
         self.currentItemChanged.emit(item)
 
-    def wheelEvent(self, e):
-        if e.angleDelta().y() < 0:
-            self.scrollDown()
-        else:
-            self.scrollUp()
+    def _scrollToCurrentItem(self):
+        self.scrollToItem(self.currentItem())
 
-    def setScrollButtonRepeatEnabled(self, isEnabled: bool):
-        """ set whether to enable scroll button auto repeat """
-        if self._scrollButtonRepeatEnabled == isEnabled:
-            return
+    def currentItem(self):
+        return self.item(self.currentIndex())
 
-        self._scrollButtonRepeatEnabled = isEnabled
-        self.upButton.setAutoRepeat(isEnabled)
-        self.downButton.setAutoRepeat(isEnabled)
 
-    def _scrollWithAnimation(self, index: int):
-        """ scroll with adaptive animation """
-        t = QTime.currentTime()
-        elapsed = self._lastScrollTime.msecsTo(t)
-        self._lastScrollTime = t
+class CycleListView(CycleListBase, QListView):
+    """ Cycle list view, whose items are provided by `CycleItemModel`
 
-        # fast linear animation for rapid repeat, smooth for single click
-        if (self.upButton.isDown() or self.downButton.isDown()) and elapsed < 200:
-            duration, easing = 100, QEasingCurve.Linear
-        else:
-            duration, easing = 250, QEasingCurve.OutQuad
+    Each item is stored once and the row of item is found by hash index. The number of rows
+    is bounded in cycle mode, so it's suitable for the columns with lots of items.
+    """
 
-        self.vScrollBar.setScrollAnimation(duration, easing)
-        self.setCurrentIndex(index)
-        self.scrollToItem(self.currentItem())
+    currentTextChanged = pyqtSignal(str)
 
-    def scrollDown(self):
-        """ scroll down an item """
-        self._scrollWithAnimation(self.currentIndex() + 1)
+    def __init__(self, items: Iterable, itemSize: QSize, align=Qt.AlignCenter, parent=None):
+        super().__init__(items, itemSize, align, parent)
+        self.clicked.connect(self._onIndexClicked)
 
-    def scrollUp(self):
-        """ scroll up an item """
-        self._scrollWithAnimation(self.currentIndex() - 1)
+    def setItems(self, items: Iterable):
+        """ set items in the list
 
-    def _setButtonsVisible(self, visible: bool):
-        """ set scroll buttons visibility """
-        self.upButton.setVisible(visible)
-        self.downButton.setVisible(visible)
+        Parameters
+        ----------
+        items: Iterable[Any]
+            the items to be added
+        """
+        if not isinstance(self.model(), CycleItemModel):
+            self.setUniformItemSizes(True)
+            self.setItemDelegate(CycleItemDelegate(self))
+            self.setModel(CycleItemModel(self.itemSize, self.align, self))
 
-    def enterEvent(self, e):
-        self._setButtonsVisible(True)
+        self.originItems = list(items)
+        self.isCycle = len(self.originItems) > self.visibleNumber
 
-    def leaveEvent(self, e):
-        self._setButtonsVisible(False)
+        if self.isCycle:
+            # the rows of cycle are enough for scrolling and jumping back to the center
+            rows = min(2 * len(self.originItems), 4 * self.visibleNumber)
+            self.model().setItems(self.originItems, rows)
+            self._currentIndex = rows // 2
+            self.model().setOffset(-self.currentIndex())
+            self._scrollToRow(self.currentIndex() - self.visibleNumber//2, self.PositionAtTop)
+        else:
+            n = self.visibleNumber // 2  # add empty items to enable scrolling
+            self.model().setItems(self.originItems, 0, n)
+            self._currentIndex = n
 
-    def resizeEvent(self, e):
-        w, h = self.width(), 34
-        self.upButton.resize(w, h)
-        self.downButton.resize(w, h)
-        self.downButton.move(0, self.height() - h)
+    def _onIndexClicked(self, index: QModelIndex):
+        self.setCurrentIndex(index.row())
+        self._scrollToCurrentItem()
 
-    def eventFilter(self, obj, e: QEvent):
-        if obj is not self or e.type() != QEvent.KeyPress:
-            return super().eventFilter(obj, e)
+    def setSelectedItem(self, text: str):
+        """ set the selected item """
+        if text is None:
+            return
 
-        if e.key() == Qt.Key_Down:
-            self.scrollDown()
-            return True
-        elif e.key() == Qt.Key_Up:
-            self.scrollUp()
-            return True
+        model = self.model()
+        i = model.indexOf(str(text))
+        if i < 0:
+            return
 
-        return super().eventFilter(obj, e)
+        if self.isCycle:
+            # show the item in the center row of cycle
+            row = model.rowCount() // 2
+            model.setOffset(i - row)
+        else:
+            row = self.visibleNumber // 2 + i
 
-    def currentItem(self):
-        return self.item(self.currentIndex())
+        self.setCurrentIndex(row)
+        self._scrollToRow(self.currentIndex())
 
-    def currentIndex(self):
-        return self._currentIndex
+    def scrollToRow(self, row: int):
+        """ scroll the item of row to the center with animation """
+        y = self.itemSize.height() * (row - self.visibleNumber // 2)
+        self.vScrollBar.scrollTo(y)
 
-    def setCurrentIndex(self, index: int):
-        if not self.isCycle:
-            n = self.visibleNumber // 2
-            self._currentIndex = max(
-                n, min(n + len(self.originItems) - 1, index))
-        else:
-            N = self.count() // 2
-            m = (self.visibleNumber + 1) // 2
-            self._currentIndex = index
+        # clear selection
+        self.clearSelection()
+        self.currentTextChanged.emit(self.model().text(row))
 
-            # scroll to center to achieve circular scrolling
-            if index >= self.count() - m:
-                self._currentIndex = N + index - self.count()
-                super().scrollToItem(self.item(self.currentIndex() - 1), self.PositionAtCenter)
-            elif index <= m - 1:
-                self._currentIndex = N + index
-                super().scrollToItem(self.item(N + index + 1), self.PositionAtCenter)
+    def _scrollToCurrentItem(self):
+        self.scrollToRow(self.currentIndex())
+
+    def _rotateItems(self, rows: int):
+        self.model().rotate(rows)
+
+    def currentText(self) -> str:
+        return self.model().text(self.currentIndex())
+
+    def textAt(self, row: int) -> str:
+        return self.model().text(row)
@@ -1,7 +1,9 @@
 # coding:utf-8
-from typing import List, Union
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Union
 
-from PyQt5.QtCore import Qt, pyqtSignal, QModelIndex, QSize, pyqtProperty, QRectF, QPropertyAnimation, QSizeF
+from PyQt5.QtCore import (Qt, pyqtSignal, QModelIndex, QSize, pyqtProperty, QRectF, QPropertyAnimation, QRect,
+                          QObject, QRunnable, QThreadPool)
 from PyQt5.QtGui import QPixmap, QPainter, QColor, QImage, QWheelEvent, QPainterPath, QImageReader
 from PyQt5.QtWidgets import QStyleOptionViewItem, QListWidget, QStyledItemDelegate, QListWidgetItem
 
@@ -72,6 +74,208 @@ class ScrollButton(ToolButton):
         drawIcon(self._icon, painter, QRectF(x, y, s, s), fill=color.name())
 
 
+def scaleImage(image: QImage, size: QSize, mode=Qt.AspectRatioMode.IgnoreAspectRatio) -> QImage:
+    """ scale image to size, the image is center cropped if mode is `KeepAspectRatioByExpanding` """
+    if image.isNull() or size.isEmpty():
+        return QImage()
+
+    image = image.scaled(size, mode, Qt.SmoothTransformation)
+
+    if mode == Qt.AspectRatioMode.KeepAspectRatioByExpanding:
+        x, y = (image.width() - size.width()) // 2, (image.height() - size.height()) // 2
+        image = image.copy(x, y, size.width(), size.height())
+
+    return image
+
+
+def readImage(path: str, size: QSize, mode=Qt.AspectRatioMode.IgnoreAspectRatio):
+    """ decode image at the specified size, the image is scaled while decoding if possible
+
+    Returns
+    -------
+    image: QImage
+        the decoded image, null image if failed
+
+    originalSize: QSize
+        the original size of image
+    """
+    reader = QImageReader(path)
+    originalSize = reader.size()
+    if not originalSize.isValid() or size.isEmpty():
+        image = reader.read()
+        return scaleImage(image, size, mode), image.size()
+
+    scaledSize = originalSize.scaled(size, mode)
+    reader.setScaledSize(scaledSize)
+
+    if mode == Qt.AspectRatioMode.KeepAspectRatioByExpanding:
+        x, y = (scaledSize.width() - size.width()) // 2, (scaledSize.height() - size.height()) // 2
+        reader.setScaledClipRect(QRect(x, y, size.width(), size.height()))
+
+    return reader.read(), originalSize
+
+
+class FlipImageTask(QRunnable):
+    """ Task to decode image in thread pool """
+
+    def __init__(self, loader: "FlipImageLoader", key: Hashable, path: str, size: QSize, mode: Qt.AspectRatioMode):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.path = path
+        self.size = size
+        self.mode = mode
+        self._isCanceled = False
+
+    def cancel(self):
+        self._isCanceled = True
+
+    def isCanceled(self):
+        return self._isCanceled
+
+    def run(self):
+        if self.isCanceled():
+            return
+
+        image, _ = readImage(self.path, self.size, self.mode)
+
+        try:
+            self.loader._taskFinished.emit(self, image)
+        except RuntimeError:
+            pass
+
+
+class FlipImageSizeTask(QRunnable):
+    """ Task to read the original size of images in thread pool """
+
+    def __init__(self, loader: "FlipImageLoader", paths: List[str]):
+        super().__init__()
+        self.loader = loader
+        self.paths = paths
+
+    def run(self):
+        sizes = {}
+        for path in self.paths:
+            sizes[path] = QImageReader(path).size()
+
+        try:
+            self.loader.sizesRead.emit(sizes)
+        except RuntimeError:
+            pass
+
+
+class FlipImageLoader(QObject):
+    """ Image loader of flip view
+
+    The images are decoded at the size they are painted in a thread pool, and the decoded
+    images are kept in a least recently used cache whose total size is limited.
+    """
+
+    imageLoaded = pyqtSignal(str)
+    sizesRead = pyqtSignal(object)
+    _taskFinished = pyqtSignal(object, QImage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.threadPool = QThreadPool(self)
+        self.threadPool.setMaxThreadCount(2)
+
+        self._cacheLimit = 64 * 1024
+        self._cost = 0
+        self._images = OrderedDict()    # type: Dict[Hashable, QImage]
+        self._tasks = {}                # type: Dict[Hashable, FlipImageTask]
+
+        self._taskFinished.connect(self._onTaskFinished)
+
+    def setCacheLimit(self, limit: int):
+        """ set the maximum size of decoded images in kilobytes """
+        self._cacheLimit = limit
+        self._trim()
+
+    def cacheLimit(self) -> int:
+        return self._cacheLimit
+
+    def image(self, key: Hashable) -> QImage:
+        """ get the cached image, or `None` if the image is not cached """
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+
+        return image
+
+    def insert(self, key: Hashable, image: QImage):
+        """ insert image to cache """
+        self._remove(key)
+        self._images[key] = image
+        self._cost += image.sizeInBytes()
+        self._trim()
+
+    def load(self, path: str, size: QSize, mode=Qt.AspectRatioMode.IgnoreAspectRatio) -> QImage:
+        """ get the image decoded at the specified size, the image is decoded in thread pool
+        if it is not cached, and `imageLoaded` is emitted when it is ready
+
+        Returns
+        -------
+        image: QImage | None
+            the cached image, or `None` if the image is being decoded
+        """
+        key = self.key(path, size, mode)
+        image = self.image(key)
+        if image is not None:
+            return image
+
+        if key not in self._tasks:
+            task = self._tasks[key] = FlipImageTask(self, key, path, size, mode)
+            self.threadPool.start(task)
+
+        return None
+
+    def readSizes(self, paths: List[str]):
+        """ read the original size of images in thread pool, `sizesRead` is emitted when finished """
+        if paths:
+            self.threadPool.start(FlipImageSizeTask(self, paths))
+
+    def cancel(self, keys=()):
+        """ cancel the decoding tasks which are not started, except the tasks of keys """
+        keys = set(keys)
+        for key in list(self._tasks):
+            if key not in keys:
+                self._tasks.pop(key).cancel()
+
+    def clear(self):
+        """ clear the cached images and cancel all the tasks """
+        self.cancel()
+        self._images.clear()
+        self._cost = 0
+
+    def waitForDone(self, msecs=-1):
+        return self.threadPool.waitForDone(msecs)
+
+    @staticmethod
+    def key(path: str, size: QSize, mode=Qt.AspectRatioMode.IgnoreAspectRatio):
+        return path, size.width(), size.height(), int(mode)
+
+    def _onTaskFinished(self, task: FlipImageTask, image: QImage):
+        if self._tasks.get(task.key) is task:
+            self._tasks.pop(task.key)
+
+        # the image is cached even if the task is canceled since it has been decoded, and the
+        # null image of invalid path is cached as well to avoid decoding it again
+        self.insert(task.key, image)
+        self.imageLoaded.emit(task.path)
+
+    def _remove(self, key):
+        image = self._images.pop(key, None)
+        if image is not None:
+            self._cost -= image.sizeInBytes()
+
+    def _trim(self):
+        # the most recently used image is always kept, otherwise it will be decoded again and again
+        while self._cost > self._cacheLimit * 1024 and len(self._images) > 1:
+            _, image = self._images.popitem(last=False)
+            self._cost -= image.sizeInBytes()
+
+
 class FlipImageDelegate(QStyledItemDelegate):
     """ Flip view image delegate """
 
@@ -95,17 +299,11 @@ class FlipImageDelegate(QStyledItemDelegate):
         size = self.itemSize(index.row())  # type: QSize
         p = self.parent()  # type: FlipView
 
-        # draw image
-        r = p.devicePixelRatioF()
-        image = index.data(Qt.UserRole)  # type: QImage
-        if image is None:
+        # get the image scaled to item size, which may be decoding in thread pool
+        image = p._scaledImage(index.row(), size * p.devicePixelRatioF())
+        if image is None or image.isNull():
             return painter.restore()
 
-        # lazy load image
-        if image.isNull() and index.data(Qt.ItemDataRole.DisplayRole):
-            image.load(index.data(Qt.ItemDataRole.DisplayRole))
-            index.model().setData(index, image, Qt.ItemDataRole.UserRole)
-
         x = option.rect.x() + int((option.rect.width() - size.width()) / 2)
         y = option.rect.y() + int((option.rect.height() - size.height()) / 2)
         rect = QRectF(x, y, size.width(), size.height())
@@ -117,16 +315,7 @@ class FlipImageDelegate(QStyledItemDelegate):
         subPath.addRoundedRect(QRectF(p.rect()), self.borderRadius, self.borderRadius)
         path = path.intersected(subPath)
 
-        image = image.scaled(size * r, p.aspectRatioMode, Qt.SmoothTransformation)
         painter.setClipPath(path)
-
-        # center crop image
-        if p.aspectRatioMode == Qt.AspectRatioMode.KeepAspectRatioByExpanding:
-            iw, ih = image.width(), image.height()
-            size = QSizeF(size) * r
-            x, y = (iw - size.width()) / 2, (ih - size.height()) / 2
-            image = image.copy(int(x), int(y), int(size.width()), int(size.height()))
-
         painter.drawImage(rect, image)
         painter.restore()
 
@@ -159,8 +348,10 @@ class FlipView(QListWidget):
         self._currentIndex = -1
         self._aspectRatioMode = Qt.AspectRatioMode.IgnoreAspectRatio
         self._itemSize = QSize(480, 270)  # 16:9
+        self._prefetchCount = 2
 
         self.delegate = FlipImageDelegate(self)
+        self.imageLoader = FlipImageLoader(self)
         self.scrollBar = SmoothScrollBar(self.orientation, self)
 
         self.scrollBar.setScrollAnimation(500)
@@ -191,6 +382,8 @@ class FlipView(QListWidget):
         # connect signal to slot
         self.preButton.clicked.connect(self.scrollPrevious)
         self.nextButton.clicked.connect(self.scrollNext)
+        self.imageLoader.imageLoaded.connect(self.viewport().update)
+        self.imageLoader.sizesRead.connect(self._onImageSizesRead)
 
     def isHorizontal(self):
         return self.orientation == Qt.Horizontal
@@ -205,6 +398,7 @@ class FlipView(QListWidget):
         for i in range(self.count()):
             self._adjustItemSize(self.item(i))
 
+        self._prefetch()
         self.viewport().update()
 
     def getItemSize(self):
@@ -218,6 +412,14 @@ class FlipView(QListWidget):
     def getBorderRadius(self):
         return self.delegate.borderRadius
 
+    def setPrefetchCount(self, count: int):
+        """ set the number of images decoded in advance before and after current image """
+        self._prefetchCount = max(0, count)
+        self._prefetch()
+
+    def prefetchCount(self):
+        return self._prefetchCount
+
     def scrollPrevious(self):
         """ scroll to previous item """
         self.setCurrentIndex(self.currentIndex() - 1)
@@ -247,11 +449,12 @@ class FlipView(QListWidget):
         # fire signal
         self.currentIndexChanged.emit(index)
 
-    def scrollToIndex(self, index):
+    def scrollToIndex(self, index, useAni=True):
         if not 0 <= index < self.count():
             return
 
         self._currentIndex = index
+        self._prefetch()
 
         if self.isHorizontal():
             value = sum(self.item(i).sizeHint().width() for i in range(index))
@@ -259,7 +462,7 @@ class FlipView(QListWidget):
             value = sum(self.item(i).sizeHint().height() for i in range(index))
 
         value += (2 * index + 1) * self.spacing()
-        self.scrollBar.scrollTo(value)
+        self.scrollBar.scrollTo(value, useAni)
 
     def currentIndex(self):
         return self._currentIndex
@@ -283,39 +486,49 @@ class FlipView(QListWidget):
         self.addItems([''] * len(images))
 
         for i in range(N, self.count()):
-            self.setItemImage(i, images[i - N], targetSize=targetSize)
+            self._setItemImage(i, images[i - N])
+
+        self._readImageSizes(range(N, self.count()))
 
         if self.currentIndex() < 0:
             self._currentIndex = 0
 
+        self._prefetch()
+
     def setItemImage(self, index: int, image: Union[QImage, QPixmap, str], targetSize: QSize = None):
         """ set the image of specified item """
         if not 0 <= index < self.count():
             return
 
+        self._setItemImage(index, image)
+        self._readImageSizes([index])
+        self._prefetch()
+        self.viewport().update()
+
+    def _setItemImage(self, index: int, image: Union[QImage, QPixmap, str]):
         item = self.item(index)
 
         # convert image to QImage
         if isinstance(image, QPixmap):
             image = image.toImage()
 
-        # lazy load
+        # lazy load, the original size of image is read in thread pool
         if isinstance(image, QImage):
             item.setData(Qt.ItemDataRole.UserRole, image)
+            item.setData(Qt.ItemDataRole.DisplayRole, '')
+            item.setData(Qt.ItemDataRole.UserRole + 1, image.size())
         else:
             item.setData(Qt.ItemDataRole.UserRole, QImage())
             item.setData(Qt.ItemDataRole.DisplayRole, image)
+            item.setData(Qt.ItemDataRole.UserRole + 1, None)
 
         self._adjustItemSize(item)
 
     def _adjustItemSize(self, item: QListWidgetItem):
-        image = self.itemImage(self.row(item), load=False)
-
-        if not image.isNull():
-            size = image.size()
-        else:
-            imagePath = item.data(Qt.ItemDataRole.DisplayRole) or ""
-            size = QImageReader(imagePath).size().expandedTo(QSize(1, 1))
+        # use the item size before the original size of image is read
+        size = item.data(Qt.ItemDataRole.UserRole + 1)  # type: QSize
+        if not size or size.isEmpty():
+            size = self.itemSize
 
         if self.aspectRatioMode == Qt.AspectRatioMode.KeepAspectRatio:
             if self.isHorizontal():
@@ -338,7 +551,7 @@ class FlipView(QListWidget):
             the index of image
 
         load: bool
-            whether to load image data
+            whether to load image data, the image loaded from path is not kept by flip view
         """
         if not 0 <= index < self.count():
             return
@@ -351,10 +564,92 @@ class FlipView(QListWidget):
 
         imagePath = item.data(Qt.ItemDataRole.DisplayRole)
         if image.isNull() and imagePath and load:
-            image.load(imagePath)
+            return QImage(imagePath)
 
         return image
 
+    def _scaledImage(self, index: int, size: QSize) -> QImage:
+        """ get the image of item scaled to size, or `None` if the image is being decoded """
+        item = self.item(index)
+        image = item.data(Qt.ItemDataRole.UserRole)  # type: QImage
+        if image is None:
+            return None
+
+        imagePath = item.data(Qt.ItemDataRole.DisplayRole)
+        if image.isNull() and imagePath:
+            if not self._isItemSizeReady(item):
+                return None
+
+            return self.imageLoader.load(imagePath, size, self.aspectRatioMode)
+
+        # the scaled image is cached to avoid scaling it in every paint event
+        key = FlipImageLoader.key(image.cacheKey(), size, self.aspectRatioMode)
+        scaledImage = self.imageLoader.image(key)
+        if scaledImage is None:
+            scaledImage = scaleImage(image, size, self.aspectRatioMode)
+            self.imageLoader.insert(key, scaledImage)
+
+        return scaledImage
+
+    def _prefetch(self):
+        """ decode the images around current index, the other decoding tasks are canceled """
+        index = self.currentIndex()
+        if index < 0 or not self.isVisible():
+            return
+
+        r = self.devicePixelRatioF()
+        keys = []
+        for i in range(max(0, index - self.prefetchCount()), min(self.count(), index + self.prefetchCount() + 1)):
+            item = self.item(i)
+            imagePath = item.data(Qt.ItemDataRole.DisplayRole)
+            if not imagePath or not item.data(Qt.ItemDataRole.UserRole).isNull() or not self._isItemSizeReady(item):
+                continue
+
+            size = item.sizeHint() * r
+            keys.append(FlipImageLoader.key(imagePath, size, self.aspectRatioMode))
+            self.imageLoader.load(imagePath, size, self.aspectRatioMode)
+
+        self.imageLoader.cancel(keys)
+
+    def _isItemSizeReady(self, item: QListWidgetItem):
+        """ whether the size of item is known, the item size depends on image size in `KeepAspectRatio` mode """
+        return self.aspectRatioMode != Qt.AspectRatioMode.KeepAspectRatio or \
+            item.data(Qt.ItemDataRole.UserRole + 1) is not None
+
+    def _readImageSizes(self, indexes):
+        """ read the original size of images in thread pool, which is required by `KeepAspectRatio` """
+        if self.aspectRatioMode != Qt.AspectRatioMode.KeepAspectRatio:
+            return
+
+        paths = []
+        for i in indexes:
+            item = self.item(i)
+            imagePath = item.data(Qt.ItemDataRole.DisplayRole)
+            if imagePath and item.data(Qt.ItemDataRole.UserRole + 1) is None:
+                paths.append(imagePath)
+
+        self.imageLoader.readSizes(paths)
+
+    def _onImageSizesRead(self, sizes: Dict[str, QSize]):
+        isChanged = False
+        for i in range(self.count()):
+            item = self.item(i)
+            imagePath = item.data(Qt.ItemDataRole.DisplayRole)
+            if imagePath not in sizes or item.data(Qt.ItemDataRole.UserRole + 1) is not None:
+                continue
+
+            item.setData(Qt.ItemDataRole.UserRole + 1, sizes[imagePath].expandedTo(QSize(1, 1)))
+            self._adjustItemSize(item)
+            isChanged = True
+
+        if not isChanged:
+            return
+
+        # keep current item in place after the size of items changes
+        self.doItemsLayout()
+        isAnimating = self.scrollBar.ani.state() == QPropertyAnimation.Running
+        self.scrollToIndex(self.currentIndex(), isAnimating)
+
     def resizeEvent(self, e):
         w, h = self.width(), self.height()
         bw, bh = self.preButton.width(), self.preButton.height()
@@ -409,6 +704,8 @@ class FlipView(QListWidget):
         for i in range(self.count()):
             self._adjustItemSize(self.item(i))
 
+        self._readImageSizes(range(self.count()))
+        self._prefetch()
         self.viewport().update()
 
     itemSize = pyqtProperty(QSize, getItemSize, setItemSize)
@@ -12,8 +12,10 @@ from ...common.icon import isDarkTheme, FluentIconBase, drawIcon
 from ...common.icon import FluentIcon as FIF
 from ...common.font import setFont
 from ...common.color import FluentSystemColor, autoFallbackThemeColor
+from ...common.completion import CompletionEngine
 from .tool_tip import ToolTipFilter
-from .menu import LineEditMenu, TextEditMenu, RoundMenu, MenuAnimationType, IndicatorMenuItemDelegate
+from .menu import (LineEditMenu, TextEditMenu, RoundMenu, MenuAnimationType, IndicatorMenuItemDelegate,
+                   MenuItemModel, MenuItemListView)
 from .scroll_bar import SmoothScrollDelegate
 
 
@@ -91,6 +93,7 @@ class LineEdit(QLineEdit):
         self._isClearButtonEnabled = False
         self._completer = None  # type: QCompleter
         self._completerMenu = None  # type: CompleterMenu
+        self._completionEngine = None  # type: CompletionEngine
         self._isError = False
         self.lightFocusedBorderColor = QColor()
         self.darkFocusedBorderColor = QColor()
@@ -161,6 +164,29 @@ class LineEdit(QLineEdit):
     def completer(self):
         return self._completer
 
+    def setCompletionEngine(self, engine: CompletionEngine):
+        """ set completion engine, which filters the candidates instead of completer
+
+        The candidates are matched in the thread pool of engine, and the results are shown
+        in a virtualized completer menu. If a completer is set too, its `activated` signal
+        is still emitted when an item is selected.
+
+        Parameters
+        ----------
+        engine: CompletionEngine
+            completion engine, `None` to filter the candidates by completer
+        """
+        if self._completionEngine:
+            self._completionEngine.cancel()
+            self._completionEngine.completionFinished.disconnect(self._onCompletionFinished)
+
+        self._completionEngine = engine
+        if engine:
+            engine.completionFinished.connect(self._onCompletionFinished)
+
+    def completionEngine(self):
+        return self._completionEngine
+
     def addAction(self, action: QAction, position=QLineEdit.ActionPosition.TrailingPosition):
         QWidget.addAction(self, action)
 
@@ -205,12 +231,17 @@ class LineEdit(QLineEdit):
             self.clearButton.setVisible(bool(text) and self.hasFocus())
 
     def __onTextEdited(self, text):
-        if not self.completer():
+        if not self.completer() and not self.completionEngine():
             return
 
         if self.text():
             QTimer.singleShot(50, self._showCompleterMenu)
-        elif self._completerMenu:
+            return
+
+        if self.completionEngine():
+            self.completionEngine().cancel()
+
+        if self._completerMenu:
             self._completerMenu.close()
 
     def setCompleterMenu(self, menu):
@@ -221,11 +252,17 @@ class LineEdit(QLineEdit):
         menu: CompleterMenu
             completer menu
         """
-        menu.activated.connect(self._completer.activated)
-        menu.indexActivated.connect(lambda idx: self._completer.activated[QModelIndex].emit(idx))
+        if self._completer:
+            menu.activated.connect(self._completer.activated)
+            menu.indexActivated.connect(lambda idx: self._completer.activated[QModelIndex].emit(idx))
+
         self._completerMenu = menu
 
     def _showCompleterMenu(self):
+        if self.completionEngine() and self.text():
+            self.completionEngine().complete(self.text())
+            return
+
         if not self.completer() or not self.text():
             return
 
@@ -242,6 +279,22 @@ class LineEdit(QLineEdit):
         if changed:
             self._completerMenu.popup()
 
+    def _onCompletionFinished(self, pattern: str, rows: List[int]):
+        # the text may be edited before the completion finished
+        if pattern != self.text():
+            return
+
+        if not isinstance(self._completerMenu, VirtualCompleterMenu):
+            self.setCompleterMenu(VirtualCompleterMenu(self))
+
+        menu = self._completerMenu
+        changed = menu.setResults(self.completionEngine(), rows)
+        if self.completer():
+            menu.setMaxVisibleItems(self.completer().maxVisibleItems())
+
+        if changed:
+            menu.popup()
+
     def contextMenuEvent(self, e):
         menu = LineEditMenu(self)
         menu.exec_(e.globalPos())
@@ -327,7 +380,7 @@ class CompleterMenu(RoundMenu):
         if e.key() == Qt.Key_Escape:
             self.close()
         if e.key() in [Qt.Key_Enter, Qt.Key_Return] and self.view.currentRow() >= 0:
-            self._onCompletionItemSelected(self.view.currentItem().text(), self.view.currentRow())
+            self._onCompletionItemSelected(self.view.currentIndex().data(), self.view.currentRow())
             self.close()
 
         return super().eventFilter(obj, e)
@@ -382,6 +435,95 @@ class CompleterMenu(RoundMenu):
         p.setFocus()
 
 
+class CompleterItemModel(MenuItemModel):
+    """ Data model of completion results """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.items = []     # type: List[str]
+
+    def setItems(self, items: List[str]):
+        self.beginResetModel()
+        self.items = items
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.items):
+            return None
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self.items[index.row()]
+
+        return super().data(index, role)
+
+
+class VirtualCompleterMenu(CompleterMenu):
+    """ Completer menu which shows the results of completion engine in a virtualized view """
+
+    def __init__(self, lineEdit: LineEdit):
+        super().__init__(lineEdit)
+        self.rows = []          # type: List[int]
+        self.engine = None      # type: CompletionEngine
+        self.itemModel = CompleterItemModel(self)
+
+        self.view.setModel(self.itemModel)
+        self.setMaxVisibleItems(7)
+
+    def _createView(self):
+        return MenuItemListView(self)
+
+    def setResults(self, engine: CompletionEngine, rows: List[int]):
+        """ set the results of completion engine
+
+        Parameters
+        ----------
+        engine: CompletionEngine
+            completion engine
+
+        rows: List[int]
+            the rows of matched candidates
+
+        Returns
+        -------
+        changed: bool
+            whether the results are changed
+        """
+        candidates = engine.items()
+        items = [candidates[i] for i in rows]
+        if self.items == items and self.isVisible():
+            return False
+
+        self.engine = engine
+        self.rows = rows
+        self.indexes.clear()
+        self.setItems(items)
+        return True
+
+    def setItems(self, items: List[str]):
+        """ set completion items """
+        self.items = items
+        self.itemModel.setItems(items)
+        self.view.adjustSize()
+
+    def _onItemClicked(self, index: QModelIndex):
+        self._hideMenu(False)
+        self._onCompletionItemSelected(index.data(), index.row())
+
+    def _onItemEntered(self, index: QModelIndex):
+        self.lastHoverItem = index
+
+    def _onCompletionItemSelected(self, text, row):
+        super()._onCompletionItemSelected(text, row)
+
+        if self.engine and not self.indexes and 0 <= row < len(self.rows):
+            index = self.engine.index(self.rows[row])
+            if index.isValid():
+                self.indexActivated.emit(index)
+
+
 class SearchLineEdit(LineEdit):
     """ Search line edit """
 
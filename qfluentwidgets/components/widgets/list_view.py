@@ -1,7 +1,7 @@
 # coding:utf-8
 from typing import List, Union
 
-from PyQt5.QtCore import Qt, pyqtSignal, QModelIndex, QItemSelectionModel, pyqtProperty
+from PyQt5.QtCore import Qt, pyqtSignal, QModelIndex, QItemSelectionModel, pyqtProperty, QItemSelection
 from PyQt5.QtGui import QPainter
 from PyQt5.QtWidgets import QStyleOptionViewItem, QListView, QListWidgetItem, QListView, QListWidget, QWidget
 
@@ -23,7 +23,7 @@ class ListItemDelegate(TableItemDelegate):
     def _drawIndicator(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
         y, h = option.rect.y(), option.rect.height()
         ph = round(0.35*h if self.pressedRow == index.row() else 0.257*h)
-        painter.setBrush(autoFallbackThemeColor(self.lightCheckedColor, self.darkCheckedColor))
+        painter.setBrush(self._checkedColor)
         painter.drawRoundedRect(0, ph + y, 3, h - 2*ph, 1.5, 1.5)
 
 
@@ -42,18 +42,29 @@ class ListBase:
         self.entered.connect(lambda i: self._setHoverRow(i.row()))
         self.pressed.connect(lambda i: self._setPressedRow(i.row()))
 
+        # the widget classes set their own model without calling `setModel()`
+        self._connectedModel = None
+        self._connectModel(self.model())
+
     def _setHoverRow(self, row: int):
         """ set hovered row """
+        oldRow = self.delegate.hoverRow
+        if row == oldRow:
+            return
+
         self.delegate.setHoverRow(row)
-        self.viewport().update()
+        self._updateRow(oldRow)
+        self._updateRow(row)
 
     def _setPressedRow(self, row: int):
         """ set pressed row """
         if self.selectionMode() == QListView.SelectionMode.NoSelection:
             return
 
+        oldRow = self.delegate.pressedRow
         self.delegate.setPressedRow(row)
-        self.viewport().update()
+        self._updateRow(oldRow)
+        self._updateRow(row)
 
     def _setSelectedRows(self, indexes: List[QModelIndex]):
         if self.selectionMode() ==  QListView.SelectionMode.NoSelection:
@@ -62,6 +73,69 @@ class ListBase:
         self.delegate.setSelectedRows(indexes)
         self.viewport().update()
 
+    def _updateRow(self, row: int):
+        """ repaint the item of row """
+        if row < 0 or not self.model():
+            return
+
+        index = self.model().index(row, self.modelColumn(), self.rootIndex())
+        self.viewport().update(self.visualRect(index))
+
+    def selectionChanged(self, selected: QItemSelection, deselected: QItemSelection):
+        QListView.selectionChanged(self, selected, deselected)
+        if self.selectionMode() != QListView.SelectionMode.NoSelection:
+            self.delegate.updateSelectedRows(selected, deselected)
+
+    def rowsInserted(self, parent: QModelIndex, start: int, end: int):
+        QListView.rowsInserted(self, parent, start, end)
+        self.delegate.invalidateSelectedRows()
+
+    def rowsAboutToBeRemoved(self, parent: QModelIndex, start: int, end: int):
+        QListView.rowsAboutToBeRemoved(self, parent, start, end)
+        self.delegate.invalidateSelectedRows()
+
+    def reset(self):
+        QListView.reset(self)
+        self.delegate.invalidateSelectedRows()
+
+    def doItemsLayout(self):
+        QListView.doItemsLayout(self)
+        self.delegate.invalidateSelectedRows()
+
+    def setModel(self, model):
+        QListView.setModel(self, model)
+        self._connectModel(model)
+
+    def _connectModel(self, model):
+        """ invalidate the selected rows of delegate when the rows of model are sorted, moved or
+        removed, since the selection model updates the selection without emitting signals """
+        if model is self._connectedModel:
+            return
+
+        if self._connectedModel is not None:
+            try:
+                self._connectedModel.layoutChanged.disconnect(self._onModelLayoutChanged)
+                self._connectedModel.rowsMoved.disconnect(self._onModelLayoutChanged)
+                self._connectedModel.rowsRemoved.disconnect(self._onModelLayoutChanged)
+            except (TypeError, RuntimeError):
+                pass
+
+        self._connectedModel = model
+        if model is not None:
+            model.layoutChanged.connect(self._onModelLayoutChanged)
+            model.rowsMoved.connect(self._onModelLayoutChanged)
+            model.rowsRemoved.connect(self._onModelLayoutChanged)
+
+        self.delegate.invalidateSelectedRows()
+
+    def _onModelLayoutChanged(self, *args):
+        self.delegate.invalidateSelectedRows()
+        self.viewport().update()
+
+    def paintEvent(self, e):
+        self.delegate.updatePaintState()
+        QListView.paintEvent(self, e)
+
     def leaveEvent(self, e):
         QListView.leaveEvent(self, e)
         self._setHoverRow(-1)
@@ -93,6 +167,7 @@ class ListBase:
 
     def setItemDelegate(self, delegate: ListItemDelegate):
         self.delegate = delegate
+        self.delegate.invalidateSelectedRows()
         super().setItemDelegate(delegate)
 
     def clearSelection(self):
@@ -104,7 +179,13 @@ class ListBase:
         self.updateSelectedRows()
 
     def updateSelectedRows(self):
-        self._setSelectedRows(self.selectedIndexes())
+        """ release the pressed row once it is selected, the selected rows of delegate are
+        updated incrementally in `selectionChanged()` """
+        if self.selectionMode() == QListView.SelectionMode.NoSelection:
+            return
+
+        if self.delegate.pressedRow >= 0 and self.delegate.isRowSelected(self.delegate.pressedRow):
+            self._setPressedRow(-1)
 
     def setCheckedColor(self, light, dark):
         """ set the color in checked status
@@ -4,13 +4,13 @@ from typing import List, Union
 import math
 
 from qframelesswindow import WindowEffect
-from PyQt5.QtCore import (QEasingCurve, QEvent, QPropertyAnimation, QObject, QModelIndex,
+from PyQt5.QtCore import (QEasingCurve, QEvent, QPropertyAnimation, QObject, QModelIndex, QAbstractListModel,
                           Qt, QSize, QRectF, pyqtSignal, QPoint, QTimer, QParallelAnimationGroup, QRect, QPointF)
 from PyQt5.QtGui import (QIcon, QColor, QPainter, QPen, QPixmap, QRegion, QCursor, QTextCursor, QHoverEvent,
                          QFontMetrics, QKeySequence, QTextLayout)
 from PyQt5.QtWidgets import (QAction, QApplication, QMenu, QProxyStyle, QStyle,
-                             QGraphicsDropShadowEffect, QListWidget, QWidget, QHBoxLayout,
-                             QListWidgetItem, QLineEdit, QTextEdit, QStyledItemDelegate, QStyleOptionViewItem, QLabel)
+                             QGraphicsDropShadowEffect, QListWidget, QListView, QAbstractItemView, QWidget,
+                             QHBoxLayout, QListWidgetItem, QLineEdit, QTextEdit, QStyledItemDelegate, QStyleOptionViewItem, QLabel)
 
 from ...common.icon import FluentIcon as FIF
 from ...common.icon import FluentIconEngine, Action, FluentIconBase, Icon
@@ -275,6 +275,146 @@ class MenuActionListWidget(QListWidget):
         return h + m.top() + m.bottom()
 
 
+class MenuItemModel(QAbstractListModel):
+    """ Base class of the data model of virtualized menu, all the items have the same size """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.itemSize = QSize(1, 28)
+
+    def setItemSize(self, size: QSize):
+        """ set the size hint of items """
+        if size == self.itemSize:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        self.itemSize = QSize(size)
+        self.layoutChanged.emit()
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role == Qt.SizeHintRole and index.isValid():
+            return self.itemSize
+
+        return None
+
+
+class MenuItemListView(QListView):
+    """ Virtualized list view of menu, only the visible items are laid out and painted
+
+    The model should be an instance of `MenuItemModel`, so the size of view is computed
+    without iterating over the items
+    """
+
+    itemClicked = pyqtSignal(QModelIndex)
+    itemEntered = pyqtSignal(QModelIndex)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._itemHeight = 28
+        self._maxVisibleItems = -1  # adjust visible items according to the size of screen
+
+        self.setUniformItemSizes(True)
+        self.setViewportMargins(0, 6, 0, 6)
+        self.setTextElideMode(Qt.ElideNone)
+        self.setDragEnabled(False)
+        self.setMouseTracking(True)
+        self.setIconSize(QSize(14, 14))
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setItemDelegate(ShortcutMenuItemDelegate(self))
+
+        self.scrollDelegate = SmoothScrollDelegate(self)
+        self.setStyleSheet('MenuItemListView{' + fontStyleSheet(getFont()) + '}')
+
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        self.clicked.connect(self.itemClicked)
+        self.entered.connect(self.itemEntered)
+
+    def setModel(self, model: MenuItemModel):
+        super().setModel(model)
+        model.setItemSize(QSize(model.itemSize.width(), self._itemHeight))
+        self.adjustSize()
+
+    def count(self):
+        return self.model().rowCount() if self.model() else 0
+
+    def itemSize(self):
+        return self.model().itemSize if self.model() else QSize(1, self._itemHeight)
+
+    def setItemWidth(self, width: int):
+        """ set the width of items """
+        if self.model():
+            self.model().setItemSize(QSize(width, self._itemHeight))
+
+    def currentRow(self):
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row: int):
+        """ select the item of row, the selection is cleared if row is invalid """
+        if not 0 <= row < self.count():
+            self.clearSelection()
+            return self.setCurrentIndex(QModelIndex())
+
+        self.setCurrentIndex(self.model().index(row, 0))
+
+    def adjustSize(self, pos=None, aniType=MenuAnimationType.NONE):
+        itemSize = self.itemSize()
+        size = QSize(max(itemSize.width(), 1), max(self.count() * itemSize.height(), 1))
+
+        # adjust the height of viewport
+        w, h = self._availableViewSize(pos, aniType)
+
+        # adjust the height of list view
+        m = self.viewportMargins()
+        size += QSize(m.left()+m.right()+2, m.top()+m.bottom())
+        size.setHeight(min(h, size.height()+3))
+        size.setWidth(max(min(w, size.width()), self.minimumWidth()))
+
+        if self.maxVisibleItems() > 0:
+            size.setHeight(min(
+                size.height(), self.maxVisibleItems() * self._itemHeight + m.top()+m.bottom() + 3))
+
+        self.setFixedSize(size)
+
+    def _availableViewSize(self, pos: QPoint, aniType: MenuAnimationType):
+        manager = MenuAnimationManager.make(self, aniType)
+        size = manager.availableViewSize(pos)
+
+        # the animation is parented to view, delete it to avoid leaking memory in the reused view
+        manager.ani.deleteLater()
+        return size
+
+    def setItemHeight(self, height: int):
+        """ set the height of item """
+        if height == self._itemHeight:
+            return
+
+        self._itemHeight = height
+        self.setItemWidth(self.itemSize().width())
+        self.adjustSize()
+
+    def setMaxVisibleItems(self, num: int):
+        """ set the maximum visible items """
+        self._maxVisibleItems = num
+        self.adjustSize()
+
+    def maxVisibleItems(self):
+        return self._maxVisibleItems
+
+    def heightForAnimation(self, pos: QPoint, aniType: MenuAnimationType):
+        """ height for animation """
+        ih = self.itemsHeight()
+        _, sh = self._availableViewSize(pos, aniType)
+        return min(ih, sh)
+
+    def itemsHeight(self):
+        """ Return the height of all items """
+        N = self.count() if self.maxVisibleItems() < 0 else min(self.maxVisibleItems(), self.count())
+        m = self.viewportMargins()
+        return N * self._itemHeight + m.top() + m.bottom()
+
+
 class RoundMenu(QMenu):
     """ Round corner menu """
 
@@ -296,7 +436,7 @@ class RoundMenu(QMenu):
         self.itemHeight = 28
 
         self.hBoxLayout = QHBoxLayout(self)
-        self.view = MenuActionListWidget(self)
+        self.view = self._createView()
 
         self.aniManager = None
         self.timer = QTimer(self)
@@ -322,6 +462,9 @@ class RoundMenu(QMenu):
         self.view.itemClicked.connect(self._onItemClicked)
         self.view.itemEntered.connect(self._onItemEntered)
 
+    def _createView(self):
+        return MenuActionListWidget(self)
+
     def setMaxVisibleItems(self, num: int):
         """ set the maximum visible items """
         self.view.setMaxVisibleItems(num)
@@ -793,6 +936,10 @@ class RoundMenu(QMenu):
         #if self.isVisible():
         #    aniType = MenuAnimationType.NONE
 
+        # release the animation of last pop-up, the menu may be reused
+        if self.aniManager:
+            self.aniManager.ani.deleteLater()
+
         self.aniManager = MenuAnimationManager.make(self, aniType)
         self.aniManager.exec(pos)
 
@@ -3,17 +3,18 @@ from copy import deepcopy
 from enum import Enum
 from typing import Dict, List, Union
 from uuid import uuid1
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtProperty, QRectF, QSize, QPoint, QPropertyAnimation, QEasingCurve, QRect
+from PyQt5.QtCore import (Qt, pyqtSignal, pyqtProperty, QRectF, QSize, QPoint, QPropertyAnimation, QEasingCurve, QRect,
+                          QVariantAnimation, QEvent, QObject)
 from PyQt5.QtGui import QPainter, QColor, QIcon, QPainterPath, QLinearGradient, QPen, QBrush, QMouseEvent
 from PyQt5.QtWidgets import QWidget, QGraphicsDropShadowEffect, QHBoxLayout, QVBoxLayout, QApplication, QStackedWidget
 
-from ...common.icon import FluentIcon, FluentIconBase, drawIcon
+from ...common.icon import FluentIcon, FluentIconBase, drawIcon, toQIcon
 from ...common.style_sheet import isDarkTheme, FluentStyleSheet
 from ...common.font import setFont
 from ...common.router import qrouter
 from .button import TransparentToolButton, PushButton
 from .scroll_area import SingleDirectionScrollArea
-from .tool_tip import ToolTipFilter
+from .tool_tip import ToolTipFilter, ToolTip
 
 
 class TabCloseButtonDisplayMode(Enum):
@@ -60,8 +61,7 @@ class TabToolButton(TransparentToolButton):
 
     def _drawIcon(self, icon, painter: QPainter, rect: QRectF, state=QIcon.Off):
         color = '#eaeaea' if isDarkTheme() else '#484848'
-        icon = icon.icon(color=color)
-        super()._drawIcon(icon, painter, rect, state)
+        drawIcon(icon.icon(color=color), painter, rect, state, key=(icon, color))
 
 
 class TabItem(PushButton):
@@ -505,13 +505,16 @@ class TabBar(SingleDirectionScrollArea):
         # remove tab
         item = self.items.pop(index)
         self.itemMap.pop(item.routeKey())
-        self.hBoxLayout.removeWidget(item)
         qrouter.remove(item.routeKey())
-        item.deleteLater()
+        self._deleteItem(item)
 
         # remove shadow
         self.update()
 
+    def _deleteItem(self, item: TabItem):
+        self.hBoxLayout.removeWidget(item)
+        item.deleteLater()
+
     def removeTabByKey(self, routeKey: str):
         if routeKey not in self.itemMap:
             return
@@ -843,6 +846,814 @@ class TabBar(SingleDirectionScrollArea):
     tabShadowEnabled = pyqtProperty(bool, isTabShadowEnabled, setTabShadowEnabled)
 
 
+class TabModelItem:
+    """ Tab item of `VirtualTabBar`, which is painted by tab bar instead of being a widget """
+
+    def __init__(self, tabBar: 'VirtualTabBar', routeKey: str, text: str,
+                 icon: Union[QIcon, str, FluentIconBase] = None):
+        self.tabBar = tabBar
+        self.textColor = None   # type: QColor
+        self.onClick = None
+        self._routeKey = routeKey
+        self._text = text
+        self._icon = icon or QIcon()
+        self._toolTip = ''
+        self._isEnabled = True
+        self._isVisible = True
+        self._properties = {}
+
+    def setRouteKey(self, key: str):
+        self._routeKey = key
+
+    def routeKey(self):
+        return self._routeKey
+
+    def text(self):
+        return self._text
+
+    def setText(self, text: str):
+        self._text = text
+        self._update()
+
+    def icon(self):
+        return toQIcon(self._icon)
+
+    def setIcon(self, icon: Union[QIcon, str, FluentIconBase]):
+        self._icon = icon or QIcon()
+        self._update()
+
+    def toolTip(self):
+        return self._toolTip
+
+    def setToolTip(self, toolTip: str):
+        self._toolTip = toolTip
+
+    def setTextColor(self, color: QColor):
+        self.textColor = QColor(color)
+        self._update()
+
+    def isEnabled(self):
+        return self._isEnabled
+
+    def setEnabled(self, isEnabled: bool):
+        self._isEnabled = isEnabled
+        self._update()
+
+    def isVisible(self):
+        return self._isVisible
+
+    def setVisible(self, isVisible: bool):
+        if isVisible == self._isVisible:
+            return
+
+        self._isVisible = isVisible
+        self.tabBar.canvas.invalidate()
+
+    def property(self, name: str):
+        return self._properties.get(name)
+
+    def setProperty(self, name: str, value):
+        self._properties[name] = value
+
+    def _update(self):
+        self.tabBar.canvas.updateItem(self)
+
+
+class TabItemToolTipFilter(ToolTipFilter):
+    """ Tool tip filter of the tab items painted by canvas """
+
+    def eventFilter(self, obj: QObject, e: QEvent) -> bool:
+        # the hovered tab is unknown until the mouse moves
+        if e.type() == QEvent.Enter:
+            return QObject.eventFilter(self, obj, e)
+
+        return super().eventFilter(obj, e)
+
+    def setHoverItem(self, item: TabModelItem):
+        """ restart the timer of tool tip when the hovered tab changes """
+        self.hideToolTip()
+        if not item or not item.toolTip():
+            return
+
+        if self._tooltip is None:
+            self._tooltip = self._createToolTip()
+            self._tooltip.setDuration(-1)
+
+        self.isEnter = True
+        self.timer.start(self._tooltipDelay)
+
+    def _createToolTip(self):
+        return ToolTip('', self.parent().window())
+
+    def showToolTip(self):
+        canvas = self.parent()  # type: TabItemCanvas
+        item = canvas.hoverItem
+        if not self.isEnter or not item or not item.toolTip():
+            return
+
+        self._tooltip.setText(item.toolTip())
+
+        rect = canvas.itemRect(item).toRect()
+        pos = canvas.mapToGlobal(QPoint(rect.center().x(), rect.top()))
+        self._tooltip.move(pos.x() - self._tooltip.width() // 2, pos.y() - self._tooltip.height())
+        self._tooltip.show()
+
+
+class TabItemCanvas(QWidget):
+    """ Canvas which paints the tab items of `VirtualTabBar`
+
+    All the visible tabs have the same width, so the geometry of tab is computed from its
+    visual index and only the tabs intersecting with the exposed region are painted. The
+    close buttons are pooled and only bound to the visible or hovered tabs.
+    """
+
+    def __init__(self, tabBar: 'VirtualTabBar'):
+        super().__init__(tabBar.view)
+        self.tabBar = tabBar
+        self.borderRadius = 5
+        self.hoverItem = None       # type: TabModelItem
+        self.pressedItem = None     # type: TabModelItem
+        self.isDragging = False
+        self.dragPos = QPoint()
+
+        self.offsets = {}       # type: Dict[TabModelItem, float]
+        self.slideAnis = {}     # type: Dict[TabModelItem, QVariantAnimation]
+        self.closeButtons = {}  # type: Dict[TabModelItem, TabToolButton]
+        self._buttonPool = []   # type: List[TabToolButton]
+
+        self._visibleItems = []     # type: List[TabModelItem]
+        self._visualIndexes = {}    # type: Dict[TabModelItem, int]
+        self._isDirty = False
+
+        self.toolTipFilter = TabItemToolTipFilter(self, 1000)
+
+        setFont(self, 12)
+        self.setFixedHeight(36)
+        self.setMouseTracking(True)
+        self.installEventFilter(self.toolTipFilter)
+        self.adjustWidth()
+
+    def visibleItems(self) -> List[TabModelItem]:
+        """ returns the visible tab items in visual order """
+        if self._isDirty:
+            self._visibleItems = [i for i in self.tabBar.items if i.isVisible()]
+            self._visualIndexes = {item: i for i, item in enumerate(self._visibleItems)}
+            self._isDirty = False
+
+        return self._visibleItems
+
+    def visualIndex(self, item: TabModelItem):
+        self.visibleItems()
+        return self._visualIndexes.get(item, -1)
+
+    def insertItem(self, item: TabModelItem):
+        """ add the tab item which has been inserted into tab bar """
+        isAppended = self.tabBar.items and self.tabBar.items[-1] is item
+        if not self._isDirty and isAppended and item.isVisible():
+            self._visualIndexes[item] = len(self._visibleItems)
+            self._visibleItems.append(item)
+        else:
+            self._isDirty = True
+
+        self.adjustWidth()
+        self.update()
+        self.updateCloseButtons()
+
+    def removeItem(self, item: TabModelItem):
+        """ release the resources of the tab item which has been removed from tab bar """
+        self._stopSlide(item)
+
+        if item in self.closeButtons:
+            self._releaseCloseButton(item)
+
+        if item is self.hoverItem:
+            self.hoverItem = None
+            self.toolTipFilter.hideToolTip()
+
+        if item is self.pressedItem:
+            self.pressedItem = None
+
+        self.invalidate()
+
+    def invalidate(self):
+        """ relayout the tabs after the visibility or order of tabs changes """
+        self._isDirty = True
+        self.adjustWidth()
+        self.update()
+        self.updateCloseButtons()
+
+    def adjustWidth(self):
+        n = len(self.visibleItems())
+        maxWidth = n * self.tabBar.tabMaximumWidth()
+        minWidth = maxWidth if self.tabBar.isScrollable() else n * self.tabBar.tabMinimumWidth()
+        self.setMinimumWidth(minWidth)
+        self.setMaximumWidth(maxWidth)
+
+    def sizeHint(self):
+        return QSize(self.maximumWidth(), 36)
+
+    def tabWidth(self) -> float:
+        n = len(self.visibleItems())
+        return self.width() / n if n else 0
+
+    def slotRect(self, item: TabModelItem) -> QRectF:
+        """ returns the rect of tab when it isn't sliding """
+        w = self.tabWidth()
+        return QRectF(self.visualIndex(item) * w, 0, w, self.height())
+
+    def itemRect(self, item: TabModelItem) -> QRectF:
+        """ returns the visual rect of tab """
+        return self.slotRect(item).translated(self.offsets.get(item, 0), 0)
+
+    def itemAt(self, pos: QPoint) -> TabModelItem:
+        items = self.visibleItems()
+        if not items or not 0 <= pos.x() < self.width():
+            return None
+
+        return items[min(int(pos.x() // self.tabWidth()), len(items) - 1)]
+
+    def updateItem(self, item: TabModelItem):
+        """ repaint the tab and its separators """
+        if item is None or self.visualIndex(item) < 0:
+            return
+
+        self.update(self.itemRect(item).adjusted(-2, 0, 2, 0).toAlignedRect())
+
+    def exposedRect(self) -> QRect:
+        """ returns the rect of canvas which is visible in the viewport of tab bar """
+        viewport = self.tabBar.viewport()
+        return QRect(self.mapFrom(viewport, QPoint(0, 0)), viewport.size()) & self.rect()
+
+    def _visibleRange(self, rect: QRect):
+        n, w = len(self.visibleItems()), self.tabWidth()
+        if not n or not w or rect.isEmpty():
+            return 0, -1
+
+        first = max(0, int(rect.left() // w))
+        last = min(n - 1, int(rect.right() // w))
+        return first, last
+
+    def updateCloseButtons(self):
+        """ bind the pooled close buttons to the tabs which should show them """
+        mode = self.tabBar.closeButtonDisplayMode
+
+        if not self.isVisible() or mode == TabCloseButtonDisplayMode.NEVER:
+            items = []
+        elif mode == TabCloseButtonDisplayMode.ALWAYS:
+            first, last = self._visibleRange(self.exposedRect())
+            items = self.visibleItems()[first:last+1]
+            items.extend(i for i in self.offsets if i not in items)
+        else:
+            items = [i for i in (self.hoverItem, self.tabBar.currentTab()) if i and i.isVisible()]
+
+        for item in [i for i in self.closeButtons if i not in items]:
+            self._releaseCloseButton(item)
+
+        for item in items:
+            button = self.closeButtons.get(item) or self._takeCloseButton(item)
+            rect = self.itemRect(item)
+            button.move(int(rect.right()) - 6 - button.width(), (self.height() - button.height()) // 2)
+
+    def _takeCloseButton(self, item: TabModelItem) -> TabToolButton:
+        if self._buttonPool:
+            button = self._buttonPool.pop()
+        else:
+            button = TabToolButton(FluentIcon.CLOSE, self)
+            button.setIconSize(QSize(10, 10))
+            button.clicked.connect(lambda: self._onCloseButtonClicked(button))
+
+        button.tabItem = item
+        button.show()
+        self.closeButtons[item] = button
+        return button
+
+    def _releaseCloseButton(self, item: TabModelItem):
+        button = self.closeButtons.pop(item)
+        button.tabItem = None
+        button.hide()
+        self._buttonPool.append(button)
+
+    def _onCloseButtonClicked(self, button: TabToolButton):
+        if button.tabItem is not None:
+            self.tabBar.tabCloseRequested.emit(self.tabBar.indexOf(button.tabItem))
+
+    def _setHoverItem(self, item: TabModelItem):
+        if item and not item.isEnabled():
+            item = None
+
+        if item is self.hoverItem:
+            return
+
+        oldItem, self.hoverItem = self.hoverItem, item
+        self.updateItem(oldItem)
+        self.updateItem(item)
+        self.toolTipFilter.setHoverItem(item)
+
+        if self.tabBar.closeButtonDisplayMode == TabCloseButtonDisplayMode.ON_HOVER:
+            self.updateCloseButtons()
+
+    def _setOffset(self, item: TabModelItem, offset: float):
+        rect = self.itemRect(item)
+        self.offsets[item] = offset
+        self.update(rect.united(self.itemRect(item)).adjusted(-2, 0, 2, 0).toAlignedRect())
+
+        if item in self.closeButtons:
+            self.updateCloseButtons()
+
+    def _slide(self, item: TabModelItem, offset: float, duration=250):
+        """ slide the tab from offset to its slot """
+        ani = self.slideAnis.get(item)
+        if ani is None:
+            ani = QVariantAnimation(self)
+            ani.setEasingCurve(QEasingCurve.InOutQuad)
+            ani.valueChanged.connect(lambda v: self._setOffset(item, v))
+            ani.finished.connect(lambda: self._stopSlide(item))
+            self.slideAnis[item] = ani
+
+        ani.stop()
+        self.offsets[item] = offset
+        ani.setStartValue(float(offset))
+        ani.setEndValue(0.0)
+        ani.setDuration(duration)
+        ani.start()
+
+    def _stopSlide(self, item: TabModelItem):
+        ani = self.slideAnis.pop(item, None)
+        if ani:
+            ani.stop()
+            ani.deleteLater()
+
+        if self.offsets.pop(item, None) is not None and self.visualIndex(item) >= 0:
+            self.update()
+            self.updateCloseButtons()
+
+    def _dragItem(self, pos: QPoint):
+        item = self.tabBar.currentTab()
+        items = self.visibleItems()
+        index = self.visualIndex(item)
+        if len(items) <= 1 or index < 0:
+            return
+
+        dx = pos.x() - self.dragPos.x()
+        self.dragPos = pos
+
+        # the tab can't be dragged out of canvas
+        rect = self.itemRect(item)
+        dx = max(-rect.left(), min(dx, self.width() - rect.right()))
+        if dx == 0:
+            return
+
+        ani = self.slideAnis.pop(item, None)
+        if ani:
+            ani.stop()
+            ani.deleteLater()
+
+        self.isDragging = True
+        self._setOffset(item, self.offsets.get(item, 0) + dx)
+
+        # swap with the sibling once the tab passes over its center
+        w = self.tabWidth()
+        rect = self.itemRect(item)
+        if dx < 0 and index > 0 and rect.left() < (index - 0.5) * w:
+            self._swapItem(item, items[index - 1])
+        elif dx > 0 and index < len(items) - 1 and rect.right() > (index + 1.5) * w:
+            self._swapItem(item, items[index + 1])
+
+    def _swapItem(self, item: TabModelItem, sibling: TabModelItem):
+        i, j = self._visualIndexes[item], self._visualIndexes[sibling]
+        self._visibleItems[i], self._visibleItems[j] = sibling, item
+        self._visualIndexes[item], self._visualIndexes[sibling] = j, i
+
+        # keep the visual positions of tabs, then slide the sibling to its new slot
+        dx = (j - i) * self.tabWidth()
+        self.offsets[item] -= dx
+        self._slide(sibling, self.offsets.get(sibling, 0) + dx)
+
+        self.tabBar._moveTab(item, sibling)
+
+    def mousePressEvent(self, e: QMouseEvent):
+        item = self.itemAt(e.pos())
+        if e.button() != Qt.LeftButton or not item or not item.isEnabled():
+            return super().mousePressEvent(e)
+
+        self.toolTipFilter.hideToolTip()
+        self.pressedItem = item
+        self.dragPos = e.pos()
+        self.updateItem(item)
+        self.tabBar._onTabPressed(item)
+
+    def mouseMoveEvent(self, e: QMouseEvent):
+        if self.pressedItem and self.tabBar.isMovable() and e.buttons() & Qt.LeftButton:
+            self._dragItem(e.pos())
+        else:
+            self._setHoverItem(self.itemAt(e.pos()))
+
+    def mouseReleaseEvent(self, e: QMouseEvent):
+        item, self.pressedItem = self.pressedItem, None
+        self.updateItem(item)
+
+        if not self.isDragging:
+            return
+
+        self.isDragging = False
+        self._setHoverItem(self.itemAt(e.pos()))
+
+        item = self.tabBar.currentTab()
+        offset = self.offsets.get(item, 0)
+        if offset:
+            self._slide(item, offset, int(abs(offset) * 250 / self.tabWidth()))
+
+    def mouseDoubleClickEvent(self, e: QMouseEvent):
+        item = self.itemAt(e.pos())
+        if e.button() == Qt.LeftButton and item and item.isEnabled():
+            self.tabBar.tabBarDoubleClicked.emit(self.tabBar.indexOf(item))
+
+        self.mousePressEvent(e)
+
+    def leaveEvent(self, e):
+        super().leaveEvent(e)
+        self._setHoverItem(None)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self.updateCloseButtons()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self.updateCloseButtons()
+
+    def paintEvent(self, e):
+        items = self.visibleItems()
+        first, last = self._visibleRange(e.rect())
+        if first > last:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHints(QPainter.Antialiasing)
+        self._drawSeparators(painter, first, last)
+
+        # the selected and sliding tabs are painted on top of others
+        currentItem = self.tabBar.currentTab()
+        for item in items[first:last+1]:
+            if item not in self.offsets and item is not currentItem:
+                self._drawItem(painter, item)
+
+        for item in self.offsets:
+            if item is not currentItem:
+                self._drawItem(painter, item)
+
+        if currentItem and currentItem.isVisible():
+            self._drawItem(painter, currentItem)
+
+    def _drawSeparators(self, painter: QPainter, first: int, last: int):
+        if isDarkTheme():
+            painter.setPen(QColor(255, 255, 255, 21))
+        else:
+            painter.setPen(QColor(0, 0, 0, 15))
+
+        items = self.visibleItems()
+        w = self.tabWidth()
+        currentItem = self.tabBar.currentTab()
+        highlightItems = (self.hoverItem, currentItem)
+
+        for i in range(first, last + 1):
+            if items[i] in highlightItems or (i < len(items) - 1 and items[i + 1] in highlightItems):
+                continue
+
+            x = int((i + 1) * w) - 1
+            y = self.height() // 2 - 8
+            painter.drawLine(x, y, x, y + 16)
+
+    def _drawItem(self, painter: QPainter, item: TabModelItem):
+        rect = self.itemRect(item)
+        isSelected = item is self.tabBar.currentTab()
+
+        painter.save()
+        painter.translate(rect.topLeft())
+        w, h = rect.width(), rect.height()
+
+        if isSelected:
+            self._drawSelectedBackground(painter, item, w, h)
+        else:
+            self._drawNotSelectedBackground(painter, item, w, h)
+
+        # draw icon
+        if not isSelected:
+            painter.setOpacity(0.79 if isDarkTheme() else 0.61)
+
+        drawIcon(item._icon, painter, QRectF(10, 10, 16, 16))
+
+        # draw text
+        self._drawText(painter, item, w, h)
+        painter.restore()
+
+    def _drawSelectedBackground(self, painter: QPainter, item: TabModelItem, w: float, h: float):
+        r = self.borderRadius
+        d = 2 * r
+
+        isDark = isDarkTheme()
+        isPressed = item is self.pressedItem
+        isHover = item is self.hoverItem
+
+        # draw shadow
+        if self.tabBar.isTabShadowEnabled():
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 20))
+            painter.drawRoundedRect(QRectF(1, 2, w - 2, h - 2), r, r)
+
+        # draw top border
+        path = QPainterPath()
+        path.arcMoveTo(1, h - d - 1, d, d, 225)
+        path.arcTo(1, h - d - 1, d, d, 225, -45)
+        path.lineTo(1, r)
+        path.arcTo(1, 1, d, d, -180, -90)
+        path.lineTo(w - r, 1)
+        path.arcTo(w - d - 1, 1, d, d, 90, -90)
+        path.lineTo(w - 1, h - r)
+        path.arcTo(w - d - 1, h - d - 1, d, d, 0, -45)
+
+        topBorderColor = QColor(0, 0, 0, 20)
+        if isDark:
+            if isPressed:
+                topBorderColor = QColor(255, 255, 255, 18)
+            elif isHover:
+                topBorderColor = QColor(255, 255, 255, 13)
+        else:
+            topBorderColor = QColor(0, 0, 0, 16)
+
+        painter.strokePath(path, topBorderColor)
+
+        # draw bottom border
+        path = QPainterPath()
+        path.arcMoveTo(1, h - d - 1, d, d, 225)
+        path.arcTo(1, h - d - 1, d, d, 225, 45)
+        path.lineTo(w - r - 1, h - 1)
+        path.arcTo(w - d - 1, h - d - 1, d, d, 270, 45)
+
+        bottomBorderColor = topBorderColor
+        if not isDark:
+            bottomBorderColor = QColor(0, 0, 0, 63)
+
+        painter.strokePath(path, bottomBorderColor)
+
+        # draw background
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(
+            self.tabBar.darkSelectedBackgroundColor if isDark else self.tabBar.lightSelectedBackgroundColor)
+        painter.drawRoundedRect(QRectF(1, 1, w - 2, h - 2), r, r)
+
+    def _drawNotSelectedBackground(self, painter: QPainter, item: TabModelItem, w: float, h: float):
+        isPressed = item is self.pressedItem
+        if not (isPressed or item is self.hoverItem):
+            return
+
+        isDark = isDarkTheme()
+
+        if isPressed:
+            color = QColor(255, 255, 255, 12) if isDark else QColor(0, 0, 0, 7)
+        else:
+            color = QColor(255, 255, 255, 15) if isDark else QColor(0, 0, 0, 10)
+
+        painter.setBrush(color)
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(QRectF(1, 1, w - 2, h - 2), self.borderRadius, self.borderRadius)
+
+    def _drawText(self, painter: QPainter, item: TabModelItem, w: float, h: float):
+        tw = self.fontMetrics().width(item.text())
+        isCloseButtonVisible = item in self.closeButtons
+
+        if item.icon().isNull():
+            dw = 47 if isCloseButtonVisible else 20
+            rect = QRectF(10, 0, w - dw, h)
+        else:
+            dw = 70 if isCloseButtonVisible else 45
+            rect = QRectF(33, 0, w - dw, h)
+
+        pen = QPen()
+        color = Qt.white if isDarkTheme() else Qt.black
+        color = item.textColor or color
+        rw = rect.width()
+
+        if tw > rw:
+            gradient = QLinearGradient(rect.x(), 0, tw+rect.x(), 0)
+            gradient.setColorAt(0, color)
+            gradient.setColorAt(max(0, (rw - 10) / tw), color)
+            gradient.setColorAt(max(0, rw / tw), Qt.transparent)
+            gradient.setColorAt(1, Qt.transparent)
+            pen.setBrush(QBrush(gradient))
+        else:
+            pen.setColor(color)
+
+        painter.setPen(pen)
+        painter.setFont(self.font())
+        painter.drawText(rect, Qt.AlignVCenter | Qt.AlignLeft, item.text())
+
+
+class VirtualTabBar(TabBar):
+    """ Virtual tab bar
+
+    Unlike `TabBar`, no widget is created for each tab. The tabs are lightweight
+    `TabModelItem` painted by a single canvas, and only the close buttons of visible
+    or hovered tabs are created, which is suitable for hundreds of tabs.
+
+    Usage::
+
+        tabWidget.setTabBar(VirtualTabBar())
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []     # type: List[TabModelItem]
+        self.itemMap = {}   # type: Dict[str, TabModelItem]
+        self._indexes = {}  # type: Dict[TabModelItem, int]
+        self._isIndexDirty = False
+
+        self.canvas = TabItemCanvas(self)
+        self.itemLayout.addWidget(self.canvas, 1)
+        self.horizontalScrollBar().valueChanged.connect(self.canvas.updateCloseButtons)
+
+    def insertTab(self, index: int, routeKey: str, text: str, icon: Union[QIcon, str, FluentIconBase] = None,
+                  onClick=None):
+        """ insert tab
+
+        Parameters
+        ----------
+        index: int
+            the insert position of tab item
+
+        routeKey: str
+            the unique name of tab item
+
+        text: str
+            the text of tab item
+
+        text: str
+            the icon of tab item
+
+        onClick: callable
+            the slot called when the tab is pressed
+        """
+        if routeKey in self.itemMap:
+            raise ValueError(f"The route key `{routeKey}` is duplicated.")
+
+        if index == -1:
+            index = len(self.items)
+
+        # adjust current index
+        if index <= self.currentIndex() and self.currentIndex() >= 0:
+            self._currentIndex += 1
+
+        item = TabModelItem(self, routeKey, text, icon)
+        item.onClick = onClick
+
+        if index >= len(self.items) and not self._isIndexDirty:
+            self._indexes[item] = len(self.items)
+        else:
+            self._isIndexDirty = True
+
+        self.items.insert(index, item)
+        self.itemMap[routeKey] = item
+        self.canvas.insertItem(item)
+
+        if len(self.items) == 1:
+            self.setCurrentIndex(0)
+
+        return item
+
+    def _deleteItem(self, item: TabModelItem):
+        self._isIndexDirty = True
+        self.canvas.removeItem(item)
+
+    def indexOf(self, item: TabModelItem):
+        """ returns the index of tab item, or -1 if the item isn't found """
+        if self._isIndexDirty:
+            self._indexes = {item: i for i, item in enumerate(self.items)}
+            self._isIndexDirty = False
+
+        return self._indexes.get(item, -1)
+
+    def removeTabByKey(self, routeKey: str):
+        if routeKey not in self.itemMap:
+            return
+
+        self.removeTab(self.indexOf(self.tab(routeKey)))
+
+    def setCurrentIndex(self, index: int):
+        """ set current index """
+        if index == self._currentIndex:
+            return
+
+        prevItem = self.currentTab()
+        self._currentIndex = index
+        self.canvas.updateItem(prevItem)
+        self.canvas.updateItem(self.items[index])
+
+        if self.closeButtonDisplayMode == TabCloseButtonDisplayMode.ON_HOVER:
+            self.canvas.updateCloseButtons()
+
+    def setCurrentTab(self, routeKey: str):
+        if routeKey not in self.itemMap:
+            return
+
+        self.setCurrentIndex(self.indexOf(self.tab(routeKey)))
+
+    def _onTabPressed(self, item: TabModelItem):
+        index = self.indexOf(item)
+        self.tabBarClicked.emit(index)
+
+        if index != self.currentIndex():
+            self.setCurrentIndex(index)
+            self.currentChanged.emit(index)
+
+        if item.onClick:
+            item.onClick()
+
+    def _moveTab(self, item: TabModelItem, sibling: TabModelItem):
+        """ move the tab to the position of its sibling """
+        i, j = self.indexOf(item), self.indexOf(sibling)
+
+        if abs(i - j) == 1:
+            self.items[i], self.items[j] = sibling, item
+            self._indexes[item], self._indexes[sibling] = j, i
+        else:
+            # there are hidden tabs between them
+            self.items.insert(j, self.items.pop(i))
+            self._isIndexDirty = True
+
+        self._currentIndex = j
+        self.tabMoved.emit(i, j)
+
+    def setCloseButtonDisplayMode(self, mode: TabCloseButtonDisplayMode):
+        """ set close button display mode """
+        if mode == self.closeButtonDisplayMode:
+            return
+
+        self.closeButtonDisplayMode = mode
+        self.canvas.updateCloseButtons()
+        self.canvas.update()
+
+    @checkIndex()
+    def tabRect(self, index: int):
+        """ return the visual rectangle of the tab at position index """
+        item = self.tabItem(index)
+        if not item.isVisible():
+            return QRect()
+
+        rect = self.canvas.slotRect(item)
+        return QRect(int(rect.x()), self.canvas.y(), int(rect.width()), self.canvas.height())
+
+    @checkIndex(False)
+    def isTabVisible(self, index: int):
+        return self.tabItem(index).isVisible()
+
+    def setTabSelectedBackgroundColor(self, light: QColor, dark: QColor):
+        """ set the background in selected state """
+        self.lightSelectedBackgroundColor = QColor(light)
+        self.darkSelectedBackgroundColor = QColor(dark)
+        self.canvas.updateItem(self.currentTab())
+
+    def setTabShadowEnabled(self, isEnabled: bool):
+        """ set whether the shadow of tab is enabled """
+        if isEnabled == self.isTabShadowEnabled():
+            return
+
+        self._isTabShadowEnabled = isEnabled
+        self.canvas.updateItem(self.currentTab())
+
+    def setScrollable(self, scrollable: bool):
+        self._isScrollable = scrollable
+        self.canvas.adjustWidth()
+
+    def setTabMaximumWidth(self, width: int):
+        """ set the maximum width of tab """
+        if width == self._tabMaxWidth:
+            return
+
+        self._tabMaxWidth = width
+        self.canvas.adjustWidth()
+
+    def setTabMinimumWidth(self, width: int):
+        """ set the minimum width of tab """
+        if width == self._tabMinWidth:
+            return
+
+        self._tabMinWidth = width
+        self.canvas.adjustWidth()
+
+    def paintEvent(self, e):
+        # the separators are painted by canvas
+        pass
+
+    def mousePressEvent(self, e: QMouseEvent):
+        SingleDirectionScrollArea.mousePressEvent(self, e)
+
+    def mouseMoveEvent(self, e: QMouseEvent):
+        SingleDirectionScrollArea.mouseMoveEvent(self, e)
+
+    def mouseReleaseEvent(self, e: QMouseEvent):
+        SingleDirectionScrollArea.mouseReleaseEvent(self, e)
+
+
 class TabWidget(QWidget):
 
     currentChanged = pyqtSignal(int)
@@ -1,8 +1,10 @@
 # coding: utf-8
-from typing import List, Union
+from itertools import chain
+from typing import Dict, List, Union
 
-from PyQt5.QtCore import Qt, QMargins, QModelIndex, QItemSelectionModel, pyqtProperty, QRectF, QEvent
-from PyQt5.QtGui import QHelpEvent, QPainter, QColor, QKeyEvent, QPalette, QBrush
+from PyQt5.QtCore import (Qt, QMargins, QModelIndex, QItemSelectionModel, pyqtProperty, QRectF, QEvent, QRect,
+                          QItemSelection)
+from PyQt5.QtGui import QHelpEvent, QPainter, QColor, QKeyEvent, QPalette, QBrush, QFont
 from PyQt5.QtWidgets import (QAbstractItemView, QStyledItemDelegate, QApplication, QStyleOptionViewItem,
                              QTableView, QTableWidget, QWidget, QTableWidgetItem, QStyle,
                              QStyleOptionButton)
@@ -10,6 +12,7 @@ from PyQt5.QtWidgets import (QAbstractItemView, QStyledItemDelegate, QApplicatio
 from .check_box import CheckBoxIcon
 from ...common.font import getFont
 from ...common.color import autoFallbackThemeColor
+from ...common.config import qconfig, Theme
 from ...common.style_sheet import isDarkTheme, FluentStyleSheet, themeColor, setCustomStyleSheet
 from .line_edit import LineEdit
 from .scroll_bar import SmoothScrollDelegate
@@ -24,9 +27,19 @@ class TableItemDelegate(QStyledItemDelegate):
         self.hoverRow = -1
         self.pressedRow = -1
         self.selectedRows = set()
+        self._isSelectionDirty = False
         self.lightCheckedColor = QColor()
         self.darkCheckedColor = QColor()
 
+        # paint state shared by all the cells, refreshed when theme or font changes
+        self._paintKey = None
+        self._isDark = False
+        self._font = QFont()
+        self._textColor = QColor()
+        self._checkedColor = QColor()
+        self._backgroundColors = {}     # type: Dict[int, QColor]
+        self._columnCount = 0
+
         if isinstance(parent, QTableView):
             self.tooltipDelegate = ItemViewToolTipDelegate(parent, 100, ItemViewToolTipType.TABLE)
         else:
@@ -40,11 +53,63 @@ class TableItemDelegate(QStyledItemDelegate):
 
     def setSelectedRows(self, indexes: List[QModelIndex]):
         self.selectedRows.clear()
+        self._isSelectionDirty = False
+
         for index in indexes:
             self.selectedRows.add(index.row())
             if index.row() == self.pressedRow:
                 self.pressedRow = -1
 
+    def updateSelectedRows(self, selected: QItemSelection, deselected: QItemSelection):
+        """ update the selected rows incrementally
+
+        Parameters
+        ----------
+        selected, deselected: QItemSelection
+            the changes of selection, usually from `QItemSelectionModel.selectionChanged`
+        """
+        # the selection may change while rows are being removed, so the dirty rows are
+        # rebuilt before next painting instead of now
+        if self._isSelectionDirty:
+            return
+
+        selectionModel = self.parent().selectionModel()
+        if not selectionModel.hasSelection():
+            return self.selectedRows.clear()
+
+        # a row is still selected if any of its cells is selected
+        for r in deselected:
+            for row in range(r.top(), r.bottom() + 1):
+                if not selectionModel.rowIntersectsSelection(row, r.parent()):
+                    self.selectedRows.discard(row)
+
+        for r in selected:
+            self.selectedRows.update(range(r.top(), r.bottom() + 1))
+
+    def invalidateSelectedRows(self):
+        """ rebuild the selected rows before next painting, which is required when rows are
+        inserted or removed since the selection model updates without emitting signals """
+        self._isSelectionDirty = True
+
+    def syncSelectedRows(self):
+        """ rebuild the selected rows from the ranges of selection """
+        self.selectedRows.clear()
+        self._isSelectionDirty = False
+
+        view = self.parent()    # type: QAbstractItemView
+        if not view.selectionModel():
+            return
+
+        for r in view.selectionModel().selection():
+            if r.parent() == view.rootIndex():
+                self.selectedRows.update(range(r.top(), r.bottom() + 1))
+
+    def isRowSelected(self, row: int):
+        if self._isSelectionDirty:
+            self.syncSelectedRows()
+
+        return row in self.selectedRows
+
     def sizeHint(self, option, index):
         # increase original sizeHint to accommodate space needed for border
         size = super().sizeHint(option, index)
@@ -78,15 +143,45 @@ class TableItemDelegate(QStyledItemDelegate):
         """
         self.lightCheckedColor = QColor(light)
         self.darkCheckedColor = QColor(dark)
+        self._paintKey = None
         self.parent().viewport().update()
 
+    def updatePaintState(self):
+        """ refresh the paint state shared by all the cells, the view should call it before
+        painting a pass of cells """
+        self._checkPaintKey()
+
+        view = self.parent()
+        if isinstance(view, QTableView):
+            self._columnCount = view.horizontalHeader().count()
+
+    def _checkPaintKey(self):
+        key = (qconfig.theme, qconfig.get(qconfig.fontFamilies), qconfig.get(qconfig.themeColor))
+        if key == self._paintKey:
+            return
+
+        self._paintKey = key
+        self._isDark = key[0] == Theme.DARK
+        self._font = getFont(13)
+        self._textColor = QColor(Qt.white if self._isDark else Qt.black)
+        self._checkedColor = autoFallbackThemeColor(self.lightCheckedColor, self.darkCheckedColor)
+        self._backgroundColors.clear()
+
+    def _backgroundColor(self, alpha: int):
+        color = self._backgroundColors.get(alpha)
+        if color is None:
+            c = 255 if self._isDark else 0
+            color = self._backgroundColors[alpha] = QColor(c, c, c, alpha)
+
+        return color
+
     def _drawBackground(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
         """ draw row background """
         r = 5
         if index.column() == 0:
             rect = option.rect.adjusted(4, 0, r + 1, 0)
             painter.drawRoundedRect(rect, r, r)
-        elif index.column() == index.model().columnCount(index.parent()) - 1:
+        elif index.column() == self._columnCount - 1:
             rect = option.rect.adjusted(-r - 1, 0, -4, 0)
             painter.drawRoundedRect(rect, r, r)
         else:
@@ -97,17 +192,18 @@ class TableItemDelegate(QStyledItemDelegate):
         """ draw indicator """
         y, h = option.rect.y(), option.rect.height()
         ph = round(0.35*h if self.pressedRow == index.row() else 0.257*h)
-        painter.setBrush(autoFallbackThemeColor(self.lightCheckedColor, self.darkCheckedColor))
+        painter.setBrush(self._checkedColor)
         painter.drawRoundedRect(4, ph + y, 3, h - 2*ph, 1.5, 1.5)
 
     def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
         super().initStyleOption(option, index)
+        self._checkPaintKey()
 
         # font
-        option.font = index.data(Qt.FontRole) or getFont(13)
+        option.font = index.data(Qt.FontRole) or self._font
 
         # text color
-        textColor = Qt.white if isDarkTheme() else Qt.black
+        textColor = self._textColor
         textBrush = index.data(Qt.TextColorRole)   # type: QBrush
         if textBrush is not None:
             textColor = QBrush(textBrush).color()
@@ -116,6 +212,11 @@ class TableItemDelegate(QStyledItemDelegate):
         option.palette.setColor(QPalette.HighlightedText, textColor)
 
     def paint(self, painter, option, index):
+        if self._isSelectionDirty:
+            self.syncSelectedRows()
+
+        self._checkPaintKey()
+
         painter.save()
         painter.setPen(Qt.NoPen)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -131,9 +232,8 @@ class TableItemDelegate(QStyledItemDelegate):
         isHover = self.hoverRow == index.row()
         isPressed = self.pressedRow == index.row()
         isAlternate = index.row() % 2 == 0 and self.parent().alternatingRowColors()
-        isDark = isDarkTheme()
+        isDark = self._isDark
 
-        c = 255 if isDark else 0
         alpha = 0
 
         if index.row() not in self.selectedRows:
@@ -151,10 +251,11 @@ class TableItemDelegate(QStyledItemDelegate):
             else:
                 alpha = 17
 
-        if index.data(Qt.ItemDataRole.BackgroundRole):
-            painter.setBrush(index.data(Qt.ItemDataRole.BackgroundRole))
+        background = index.data(Qt.ItemDataRole.BackgroundRole)
+        if background:
+            painter.setBrush(background)
         else:
-            painter.setBrush(QColor(c, c, c, alpha))
+            painter.setBrush(self._backgroundColor(alpha))
 
         self._drawBackground(painter, option, index)
 
@@ -172,7 +273,7 @@ class TableItemDelegate(QStyledItemDelegate):
         painter.save()
         checkState = index.data(Qt.CheckStateRole)
 
-        isDark = isDarkTheme()
+        isDark = self._isDark
 
         r = 4.5
         x = option.rect.x() + 15
@@ -184,7 +285,7 @@ class TableItemDelegate(QStyledItemDelegate):
             painter.setPen(QColor(255, 255, 255, 142) if isDark else QColor(0, 0, 0, 122))
             painter.drawRoundedRect(rect, r, r)
         else:
-            color = autoFallbackThemeColor(self.lightCheckedColor, self.darkCheckedColor)
+            color = self._checkedColor
             painter.setPen(color)
             painter.setBrush(color)
             painter.drawRoundedRect(rect, r, r)
@@ -226,6 +327,10 @@ class TableBase:
         self.pressed.connect(lambda i: self._setPressedRow(i.row()))
         self.verticalHeader().sectionClicked.connect(self.selectRow)
 
+        # the widget classes set their own model without calling `setModel()`
+        self._connectedModel = None
+        self._connectModel(self.model())
+
     def setBorderVisible(self, isVisible: bool):
         """ set the visibility of border """
         self.setProperty("isBorderVisible", isVisible)
@@ -248,16 +353,23 @@ class TableBase:
 
     def _setHoverRow(self, row: int):
         """ set hovered row """
+        oldRow = self.delegate.hoverRow
+        if row == oldRow:
+            return
+
         self.delegate.setHoverRow(row)
-        self.viewport().update()
+        self._updateRows(oldRow, oldRow)
+        self._updateRows(row, row)
 
     def _setPressedRow(self, row: int):
         """ set pressed row """
         if self.selectionMode() == QTableView.SelectionMode.NoSelection:
             return
 
+        oldRow = self.delegate.pressedRow
         self.delegate.setPressedRow(row)
-        self.viewport().update()
+        self._updateRows(oldRow, oldRow)
+        self._updateRows(row, row)
 
     def _setSelectedRows(self, indexes: List[QModelIndex]):
         if self.selectionMode() == QTableView.SelectionMode.NoSelection:
@@ -266,6 +378,78 @@ class TableBase:
         self.delegate.setSelectedRows(indexes)
         self.viewport().update()
 
+    def _updateRows(self, first: int, last: int):
+        """ repaint the rows between first and last """
+        if first < 0:
+            return
+
+        y = self.rowViewportPosition(first)
+        h = self.rowViewportPosition(last) + self.rowHeight(last) - y
+        rect = QRect(0, y, self.viewport().width(), h) & self.viewport().rect()
+        if not rect.isEmpty():
+            self.viewport().update(rect)
+
+    def selectionChanged(self, selected: QItemSelection, deselected: QItemSelection):
+        QTableView.selectionChanged(self, selected, deselected)
+        if self.selectionMode() == QTableView.SelectionMode.NoSelection:
+            return
+
+        self.delegate.updateSelectedRows(selected, deselected)
+
+        # the whole row is highlighted even if only part of cells are selected
+        for r in chain(selected, deselected):
+            self._updateRows(r.top(), r.bottom())
+
+    def rowsInserted(self, parent: QModelIndex, start: int, end: int):
+        QTableView.rowsInserted(self, parent, start, end)
+        self.delegate.invalidateSelectedRows()
+
+    def rowsAboutToBeRemoved(self, parent: QModelIndex, start: int, end: int):
+        QTableView.rowsAboutToBeRemoved(self, parent, start, end)
+        self.delegate.invalidateSelectedRows()
+
+    def reset(self):
+        QTableView.reset(self)
+        self.delegate.invalidateSelectedRows()
+
+    def doItemsLayout(self):
+        QTableView.doItemsLayout(self)
+        self.delegate.invalidateSelectedRows()
+
+    def setModel(self, model):
+        QTableView.setModel(self, model)
+        self._connectModel(model)
+
+    def _connectModel(self, model):
+        """ invalidate the selected rows of delegate when the rows of model are sorted, moved or
+        removed, since the selection model updates the selection without emitting signals """
+        if model is self._connectedModel:
+            return
+
+        if self._connectedModel is not None:
+            try:
+                self._connectedModel.layoutChanged.disconnect(self._onModelLayoutChanged)
+                self._connectedModel.rowsMoved.disconnect(self._onModelLayoutChanged)
+                self._connectedModel.rowsRemoved.disconnect(self._onModelLayoutChanged)
+            except (TypeError, RuntimeError):
+                pass
+
+        self._connectedModel = model
+        if model is not None:
+            model.layoutChanged.connect(self._onModelLayoutChanged)
+            model.rowsMoved.connect(self._onModelLayoutChanged)
+            model.rowsRemoved.connect(self._onModelLayoutChanged)
+
+        self.delegate.invalidateSelectedRows()
+
+    def _onModelLayoutChanged(self, *args):
+        self.delegate.invalidateSelectedRows()
+        self.viewport().update()
+
+    def paintEvent(self, e):
+        self.delegate.updatePaintState()
+        QTableView.paintEvent(self, e)
+
     def leaveEvent(self, e):
         QTableView.leaveEvent(self, e)
         self._setHoverRow(-1)
@@ -297,6 +481,7 @@ class TableBase:
 
     def setItemDelegate(self, delegate: TableItemDelegate):
         self.delegate = delegate
+        self.delegate.invalidateSelectedRows()
         super().setItemDelegate(delegate)
 
     def selectAll(self):
@@ -316,7 +501,13 @@ class TableBase:
         self.updateSelectedRows()
 
     def updateSelectedRows(self):
-        self._setSelectedRows(self.selectedIndexes())
+        """ release the pressed row once it is selected, the selected rows of delegate are
+        updated incrementally in `selectionChanged()` """
+        if self.selectionMode() == QTableView.SelectionMode.NoSelection:
+            return
+
+        if self.delegate.pressedRow >= 0 and self.delegate.isRowSelected(self.delegate.pressedRow):
+            self._setPressedRow(-1)
 
 
 class TableWidget(TableBase, QTableWidget):
@@ -0,0 +1,114 @@
+# coding:utf-8
+""" Import time report of qfluentwidgets
+
+Usage::
+
+    python -m qfluentwidgets.import_report [-n 30] [-a] [PushButton FluentWindow ...]
+
+The attributes of `qfluentwidgets` given in command line are accessed after importing
+the package, so the cost of lazy imports is reported as well.
+"""
+import argparse
+import subprocess
+import sys
+from typing import List
+
+
+class ImportRecord:
+    """ Import time record of module """
+
+    def __init__(self, module: str, selfTime: int, cumulativeTime: int, depth: int):
+        self.module = module
+        self.selfTime = selfTime        # microseconds
+        self.cumulativeTime = cumulativeTime
+        self.depth = depth
+
+    def isInternal(self):
+        return self.module.split('.')[0] == 'qfluentwidgets'
+
+
+def parseImportTime(output: str) -> List[ImportRecord]:
+    """ parse the output of `python -X importtime` """
+    records = []
+
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        records.append(ImportRecord(module, int(fields[0]), int(fields[1]), depth))
+
+    return records
+
+
+def importRecords(attributes: List[str] = None, python=sys.executable) -> List[ImportRecord]:
+    """ import qfluentwidgets in a new interpreter and get the import time records
+
+    Parameters
+    ----------
+    attributes: List[str]
+        the attributes of qfluentwidgets to be accessed after importing
+
+    python: str
+        the path of python interpreter
+    """
+    code = "import qfluentwidgets"
+    for attribute in attributes or []:
+        code += f"; qfluentwidgets.{attribute}"
+
+    process = subprocess.run([python, '-X', 'importtime', '-c', code], capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    return parseImportTime(process.stderr)
+
+
+def report(records: List[ImportRecord], number=30, showAll=False) -> str:
+    """ format the import time records
+
+    Parameters
+    ----------
+    records: List[ImportRecord]
+        import time records
+
+    number: int
+        the maximum number of rows
+
+    showAll: bool
+        whether to show the external modules
+    """
+    total = sum(i.selfTime for i in records)
+    internal = sum(i.selfTime for i in records if i.isInternal())
+    rows = [i for i in records if showAll or i.isInternal() or i.depth == 0]
+    rows.sort(key=lambda i: i.cumulativeTime, reverse=True)
+
+    lines = [
+        f"total: {total / 1000:.1f} ms, qfluentwidgets: {internal / 1000:.1f} ms, modules: {len(records)}",
+        "",
+        f"{'self (ms)':>10} {'cumulative (ms)':>16}  module",
+    ]
+
+    for record in rows[:number]:
+        lines.append(f"{record.selfTime / 1000:>10.1f} {record.cumulativeTime / 1000:>16.1f}  {record.module}")
+
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report the import time of qfluentwidgets")
+    parser.add_argument('attributes', nargs='*', help="attributes of qfluentwidgets accessed after importing")
+    parser.add_argument('-n', '--number', type=int, default=30, help="the maximum number of rows")
+    parser.add_argument('-a', '--all', action='store_true', help="show the external modules")
+    args = parser.parse_args(argv)
+
+    print(report(importRecords(args.attributes), args.number, args.all))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,11 @@
-from .fluent_window import FluentWindow, MSFluentWindow, SplitFluentWindow, FluentTitleBar, MSFluentTitleBar, SplitTitleBar, FluentBackgroundTheme, FluentWidget, FluentWidgetTitleBar, FluentTitleBarButton
-from .splash_screen import SplashScreen
\ No newline at end of file
+# coding:utf-8
+from typing import TYPE_CHECKING
+
+from .._lazy import lazyImport
+
+if TYPE_CHECKING:
+    from .fluent_window import FluentWindow, MSFluentWindow, SplitFluentWindow, FluentTitleBar, MSFluentTitleBar, SplitTitleBar, FluentBackgroundTheme, FluentWidget, FluentWidgetTitleBar, FluentTitleBarButton
+    from .splash_screen import SplashScreen
+    from .stacked_widget import LazyInterface
+
+__getattr__, __dir__ = lazyImport(__name__)
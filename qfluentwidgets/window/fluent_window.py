@@ -1,8 +1,9 @@
 # coding:utf-8
-from typing import Union
+from collections import OrderedDict
+from typing import Callable, Dict, List, Union
 import sys
 
-from PyQt5.QtCore import Qt, QSize, QRect, QRectF
+from PyQt5.QtCore import Qt, QSize, QRect, QRectF, QTimer
 from PyQt5.QtGui import QIcon, QPainter, QColor
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QApplication
 
@@ -15,7 +16,7 @@ from ..components.widgets.frameless_window import FramelessWindow
 from ..components.widgets.label import CaptionLabel
 from ..components.navigation import (NavigationInterface, NavigationBar, NavigationItemPosition,
                                      NavigationBarPushButton, NavigationTreeWidget)
-from .stacked_widget import StackedWidget
+from .stacked_widget import StackedWidget, LazyInterface
 
 from qframelesswindow import TitleBar, TitleBarBase, TitleBarButton
 
@@ -122,6 +123,14 @@ class FluentWindowBase(FluentWidget):
         self.stackedWidget = StackedWidget(self)
         self.navigationInterface = None
 
+        # lazy sub interfaces, ordered from the least recently shown one
+        self._lazyInterfaces = OrderedDict()    # type: Dict[str, LazyInterface]
+        self._maxCreatedInterfaceCount = None
+        self._prewarmQueue = []     # type: List[str]
+        self._prewarmTimer = QTimer(self)
+        self._prewarmTimer.setSingleShot(True)
+        self._prewarmTimer.timeout.connect(self._prewarmNextInterface)
+
         # initialize layout
         self.hBoxLayout.setSpacing(0)
         self.hBoxLayout.setContentsMargins(0, 0, 0, 0)
@@ -133,6 +142,11 @@ class FluentWindowBase(FluentWidget):
         """ add sub interface """
         raise NotImplementedError
 
+    def addLazySubInterface(self, routeKey: str, factory: Callable[[], QWidget], icon: Union[FluentIconBase, QIcon, str],
+                            text: str, position=NavigationItemPosition.TOP):
+        """ add sub interface which is created by `factory` on first show """
+        raise NotImplementedError
+
     def removeInterface(self, interface: QWidget, isDelete=False):
         """ remove sub interface
 
@@ -147,13 +161,91 @@ class FluentWindowBase(FluentWidget):
         raise NotImplementedError
 
     def switchTo(self, interface: QWidget):
-        self.stackedWidget.setCurrentWidget(interface, popOut=False)
+        self.stackedWidget.setCurrentWidget(self._stackedInterface(interface), popOut=False)
+
+    def setMaxCreatedInterfaceCount(self, count: int):
+        """ set the maximum number of created lazy sub interfaces, the least recently
+        shown ones will be deleted and created again on next show
+
+        Parameters
+        ----------
+        count: int
+            the maximum number of created lazy sub interfaces, `None` means no limit
+        """
+        self._maxCreatedInterfaceCount = None if count is None else max(count, 1)
+        self._releaseLazyInterfaces()
+
+    def maxCreatedInterfaceCount(self):
+        return self._maxCreatedInterfaceCount
+
+    def prewarmInterfaces(self, routeKeys: List[str] = None, interval=0):
+        """ create lazy sub interfaces one by one when the event loop is idle
+
+        Parameters
+        ----------
+        routeKeys: List[str]
+            the route keys of lazy sub interfaces, all of them will be created if it's `None`
+
+        interval: int
+            the interval between the creation of two sub interfaces in milliseconds
+        """
+        if routeKeys is None:
+            routeKeys = list(self._lazyInterfaces.keys())
+
+        self._prewarmQueue = [k for k in routeKeys if k in self._lazyInterfaces]
+        self._prewarmTimer.setInterval(interval)
+        self._prewarmTimer.start()
+
+    def _prewarmNextInterface(self):
+        while self._prewarmQueue:
+            interface = self._lazyInterfaces.get(self._prewarmQueue.pop(0))
+            if interface and not interface.isCreated():
+                interface.create()
+                break
+
+        if self._prewarmQueue:
+            self._prewarmTimer.start()
+
+    def _addLazyInterface(self, routeKey: str, factory: Callable[[], QWidget]) -> LazyInterface:
+        if not routeKey:
+            raise ValueError("The route key of lazy sub interface can't be empty string.")
+
+        interface = LazyInterface(routeKey, factory)
+        self._lazyInterfaces[routeKey] = interface
+        return interface
+
+    def _removeLazyInterface(self, interface: QWidget):
+        if isinstance(interface, LazyInterface):
+            self._lazyInterfaces.pop(interface.objectName(), None)
+
+    def _stackedInterface(self, interface: QWidget) -> QWidget:
+        """ get the widget in stacked widget, which is the placeholder for lazy sub interface """
+        parent = interface.parent()
+        if isinstance(parent, LazyInterface) and parent.interface() is interface:
+            return parent
+
+        return interface
+
+    def _releaseLazyInterfaces(self):
+        if self._maxCreatedInterfaceCount is None:
+            return
+
+        current = self.stackedWidget.currentWidget()
+        interfaces = [i for i in self._lazyInterfaces.values() if i.isCreated() and i is not current]
+        count = len(interfaces) + (isinstance(current, LazyInterface) and current.isCreated())
+
+        for interface in interfaces[:max(count - self._maxCreatedInterfaceCount, 0)]:
+            interface.release()
 
     def _onCurrentInterfaceChanged(self, index: int):
         widget = self.stackedWidget.widget(index)
         self.navigationInterface.setCurrentItem(widget.objectName())
         qrouter.push(self.stackedWidget, widget.objectName())
 
+        if isinstance(widget, LazyInterface) and widget.objectName() in self._lazyInterfaces:
+            self._lazyInterfaces.move_to_end(widget.objectName())
+            self._releaseLazyInterfaces()
+
         self._updateStackedBackground()
 
     def _updateStackedBackground(self):
@@ -333,7 +425,41 @@ class FluentWindow(FluentWindowBase):
 
         return item
 
+    def addLazySubInterface(self, routeKey: str, factory: Callable[[], QWidget], icon: Union[FluentIconBase, QIcon, str],
+                            text: str, position=NavigationItemPosition.TOP, parent=None,
+                            isTransparent=False) -> NavigationTreeWidget:
+        """ add sub interface which is created by `factory` on first show
+
+        Parameters
+        ----------
+        routeKey: str
+            the unique route key of sub interface
+
+        factory: Callable[[], QWidget]
+            the function to create sub interface
+
+        icon: FluentIconBase | QIcon | str
+            the icon of navigation item
+
+        text: str
+            the text of navigation item
+
+        position: NavigationItemPosition
+            the position of navigation item
+
+        parent: QWidget | str
+            * QWidget: the parent of navigation item
+            * str: the parent route key of navigation item
+
+        isTransparent: bool
+            whether to use transparent background
+        """
+        interface = self._addLazyInterface(routeKey, factory)
+        return self.addSubInterface(interface, icon, text, position, parent, isTransparent)
+
     def removeInterface(self, interface, isDelete=False):
+        interface = self._stackedInterface(interface)
+        self._removeLazyInterface(interface)
         self.navigationInterface.removeWidget(interface.objectName())
         self.stackedWidget.removeWidget(interface)
         interface.hide()
@@ -437,7 +563,40 @@ class MSFluentWindow(FluentWindowBase):
 
         return item
 
+    def addLazySubInterface(self, routeKey: str, factory: Callable[[], QWidget], icon: Union[FluentIconBase, QIcon, str],
+                            text: str, selectedIcon=None, position=NavigationItemPosition.TOP,
+                            isTransparent=False) -> NavigationBarPushButton:
+        """ add sub interface which is created by `factory` on first show
+
+        Parameters
+        ----------
+        routeKey: str
+            the unique route key of sub interface
+
+        factory: Callable[[], QWidget]
+            the function to create sub interface
+
+        icon: FluentIconBase | QIcon | str
+            the icon of navigation item
+
+        text: str
+            the text of navigation item
+
+        selectedIcon: str | QIcon | FluentIconBase
+            the icon of navigation item in selected state
+
+        position: NavigationItemPosition
+            the position of navigation item
+
+        isTransparent: bool
+            whether to use transparent background
+        """
+        interface = self._addLazyInterface(routeKey, factory)
+        return self.addSubInterface(interface, icon, text, selectedIcon, position, isTransparent)
+
     def removeInterface(self, interface, isDelete=False):
+        interface = self._stackedInterface(interface)
+        self._removeLazyInterface(interface)
         self.navigationInterface.removeWidget(interface.objectName())
         self.stackedWidget.removeWidget(interface)
         interface.hide()
@@ -1,10 +1,68 @@
 # coding:utf-8
+from typing import Callable
+
 from PyQt5.QtCore import Qt, pyqtSignal, QEasingCurve
-from PyQt5.QtWidgets import QFrame, QHBoxLayout, QAbstractScrollArea
+from PyQt5.QtWidgets import QFrame, QHBoxLayout, QAbstractScrollArea, QWidget
 
 from ..components.widgets.stacked_widget import PopUpAniStackedWidget, EntranceTransitionStackedWidget
 
 
+class LazyInterface(QWidget):
+    """ Placeholder of sub interface, the real interface is created by factory on first show """
+
+    interfaceCreated = pyqtSignal(QWidget)
+
+    def __init__(self, routeKey: str, factory: Callable[[], QWidget], parent=None):
+        """
+        Parameters
+        ----------
+        routeKey: str
+            the route key of sub interface, which is used as the object name of placeholder
+
+        factory: Callable[[], QWidget]
+            the function to create sub interface
+
+        parent: QWidget
+            parent widget
+        """
+        super().__init__(parent=parent)
+        self.factory = factory
+        self._interface = None  # type: QWidget
+        self.hBoxLayout = QHBoxLayout(self)
+        self.hBoxLayout.setContentsMargins(0, 0, 0, 0)
+        self.setObjectName(routeKey)
+
+    def interface(self) -> QWidget:
+        """ get the created sub interface, `None` will be returned if it's not created yet """
+        return self._interface
+
+    def isCreated(self):
+        return self._interface is not None
+
+    def create(self) -> QWidget:
+        """ create sub interface if it's not created yet """
+        if self._interface is not None:
+            return self._interface
+
+        self._interface = self.factory()
+        self.hBoxLayout.addWidget(self._interface)
+        self.interfaceCreated.emit(self._interface)
+        return self._interface
+
+    def release(self):
+        """ delete the created sub interface, it will be created again on next show """
+        if self._interface is None:
+            return
+
+        self.hBoxLayout.removeWidget(self._interface)
+        self._interface.hide()
+        self._interface.deleteLater()
+        self._interface = None
+
+    def showEvent(self, e):
+        self.create()
+        super().showEvent(e)
+
 
 class StackedWidget(QFrame):
     """ Stacked widget """
@@ -41,8 +99,13 @@ class StackedWidget(QFrame):
         return self.view.widget(index)
 
     def setCurrentWidget(self, widget, popOut=True):
-        if isinstance(widget, QAbstractScrollArea):
-            widget.verticalScrollBar().setValue(0)
+        if isinstance(widget, LazyInterface):
+            interface = widget.create()
+        else:
+            interface = widget
+
+        if isinstance(interface, QAbstractScrollArea):
+            interface.verticalScrollBar().setValue(0)
 
         if not popOut:
             self.view.setCurrentWidget(widget, duration=300)
@@ -0,0 +1,157 @@
+# coding:utf-8
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt, QItemSelectionModel, QStringListModel, QSortFilterProxyModel
+from PyQt5.QtWidgets import QApplication, QTableWidgetItem, QListWidgetItem
+
+from qfluentwidgets import TableWidget, ListWidget, ListView
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def selectedRows(view):
+    """ the selected rows reported by selection model """
+    rows = set()
+    for r in view.selectionModel().selection():
+        rows.update(range(r.top(), r.bottom() + 1))
+
+    return rows
+
+
+def delegateRows(view):
+    """ the selected rows used by delegate to paint """
+    return {row for row in range(view.model().rowCount()) if view.delegate.isRowSelected(row)}
+
+
+def createTable(rows=10):
+    table = TableWidget()
+    table.setColumnCount(2)
+    table.setRowCount(rows)
+    for i in range(rows):
+        table.setItem(i, 0, QTableWidgetItem(f"{rows - i:02d}"))
+        table.setItem(i, 1, QTableWidgetItem(str(i)))
+
+    table.setSelectionMode(TableWidget.ExtendedSelection)
+    return table
+
+
+def createList(rows=10):
+    view = ListWidget()
+    for i in range(rows):
+        view.addItem(QListWidgetItem(f"{rows - i:02d}"))
+
+    view.setSelectionMode(ListWidget.ExtendedSelection)
+    return view
+
+
+def toggle(view, row):
+    index = view.model().index(row, 0)
+    view.selectionModel().select(index, QItemSelectionModel.Toggle | QItemSelectionModel.Rows)
+
+
+def test_table_sort(app):
+    table = createTable()
+    table.selectRow(0)
+    assert delegateRows(table) == {0}
+
+    table.sortItems(0)
+    assert delegateRows(table) == selectedRows(table) == {9}
+
+    table.selectRow(3)
+    assert delegateRows(table) == selectedRows(table) == {3}
+
+
+def test_table_insert_remove(app):
+    table = createTable()
+    table.selectRow(5)
+
+    table.insertRow(0)
+    assert delegateRows(table) == selectedRows(table) == {6}
+
+    table.removeRow(1)
+    assert delegateRows(table) == selectedRows(table) == {5}
+
+    table.removeRow(5)
+    assert delegateRows(table) == selectedRows(table) == set()
+
+
+def test_table_toggle(app):
+    table = createTable()
+    toggle(table, 2)
+    toggle(table, 4)
+    assert delegateRows(table) == selectedRows(table) == {2, 4}
+
+    toggle(table, 2)
+    assert delegateRows(table) == selectedRows(table) == {4}
+
+
+def test_list_sort_insert_remove_toggle(app):
+    view = createList()
+    toggle(view, 0)
+    toggle(view, 2)
+
+    view.sortItems()
+    assert delegateRows(view) == selectedRows(view) == {7, 9}
+
+    view.insertItem(0, QListWidgetItem("00"))
+    assert delegateRows(view) == selectedRows(view) == {8, 10}
+
+    view.takeItem(8)
+    assert delegateRows(view) == selectedRows(view) == {9}
+
+    toggle(view, 9)
+    assert delegateRows(view) == selectedRows(view) == set()
+
+
+def test_list_view_set_model(app):
+    view = ListView()
+    model = QStringListModel([f"{10 - i:02d}" for i in range(10)])
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    view.setModel(proxy)
+    view.setSelectionMode(ListView.ExtendedSelection)
+
+    toggle(view, 0)
+    proxy.sort(0, Qt.AscendingOrder)
+    assert delegateRows(view) == selectedRows(view) == {9}
+
+    # the old model is disconnected after model changes
+    otherProxy = QSortFilterProxyModel()
+    otherProxy.setSourceModel(QStringListModel([str(i) for i in range(5)]))
+    view.setModel(otherProxy)
+    toggle(view, 1)
+    proxy.sort(0, Qt.DescendingOrder)
+    assert delegateRows(view) == selectedRows(view) == {1}
+
+
+def test_table_random_operations(app):
+    rng = random.Random(0)
+    table = createTable(20)
+
+    for _ in range(300):
+        op = rng.choice(["sort", "insert", "remove", "toggle", "select"])
+        rows = table.rowCount()
+
+        if op == "sort":
+            table.sortItems(rng.randrange(2), rng.choice([Qt.AscendingOrder, Qt.DescendingOrder]))
+        elif op == "insert":
+            row = rng.randint(0, rows)
+            table.insertRow(row)
+            table.setItem(row, 0, QTableWidgetItem(f"{rng.randrange(100):02d}"))
+            table.setItem(row, 1, QTableWidgetItem(str(rng.randrange(100))))
+        elif op == "remove" and rows > 1:
+            table.removeRow(rng.randrange(rows))
+        elif op == "toggle" and rows:
+            toggle(table, rng.randrange(rows))
+        elif op == "select" and rows:
+            table.selectRow(rng.randrange(rows))
+
+        assert delegateRows(table) == selectedRows(table), op